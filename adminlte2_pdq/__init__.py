@@ -19,3 +19,14 @@ def parse_version(version):
 
 
 VERSION = parse_version(__version__)
+
+
+def warmup(steps=None):
+    """Precompute the package caches, such as before worker processes are forked.
+
+    See adminlte2_pdq.cache_warmup.warmup() for details.
+    """
+    # Imported here, as the package caches require Django to be set up.
+    from .cache_warmup import warmup as run_warmup  # pylint:disable=import-outside-toplevel
+
+    return run_warmup(steps)
@@ -0,0 +1,154 @@
+"""Django AdminLte2Pdq access decisions.
+
+Pure evaluation of the AuthMiddleware login and permission decisions, from precomputed route policies and roles.
+Has no Django imports, so that decisions can be evaluated in worker processes without setting up Django.
+"""
+
+# System Imports.
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+
+# Possible access decisions for a route.
+ALLOW = "allow"
+LOGIN = "login"
+FORBIDDEN = "403"
+
+
+def passes_permission_checks(one_of_permissions, full_permissions, has_perm):
+    """Determine if permission requirements are met.
+
+    :param one_of_permissions: Permissions where at least one is required, if any.
+    :param full_permissions: Permissions where all are required, if any.
+    :param has_perm: Function that determines if a single permission is held, such as User.has_perm.
+    :return: True if at least one type of permission requirement is set, and all set requirements are met.
+    """
+
+    # Only allow passing if at least one of the types of perms are set on the view.
+    # NOTE: This will help ensure that if the PermissionRequired mixin is used, the user must
+    # fill out the `permission_required` attribute for the view to pass perm checks.
+    if not one_of_permissions and not full_permissions:
+        return False
+
+    # Partial set exists. Must have at least one of any.
+    if one_of_permissions and not any(has_perm(perm) for perm in one_of_permissions):
+        return False
+
+    # Full set exists. Must have all.
+    if full_permissions and not all(has_perm(perm) for perm in full_permissions):
+        return False
+
+    return True
+
+
+class RoutePolicy(NamedTuple):
+    """Access policy of a single route, as determined by AuthMiddleware from the view and settings."""
+
+    app_name: str
+    pattern: str
+    name: str
+    requires_login: bool
+    login_exempt: bool
+    requires_permissions: bool
+    permission_exempt: bool
+    one_of_permissions: Optional[tuple]
+    full_permissions: Optional[tuple]
+
+
+class AccessRole:
+    """A user, or synthetic set of permissions, to evaluate route access for.
+
+    :param name: Display name of role.
+    :param permissions: Permission strings held by the role, in "app_label.codename" format.
+    :param is_authenticated: Whether the role is a logged-in user.
+    :param is_superuser: Whether the role holds all permissions, as for an active superuser.
+    :param passes_login_hook: Result of the AuthMiddleware login_required_hook() for the role.
+    :param passes_permission_hook: Result of the AuthMiddleware permission_required_hook() for the role.
+    """
+
+    __slots__ = (
+        "name",
+        "permissions",
+        "is_authenticated",
+        "is_superuser",
+        "passes_login_hook",
+        "passes_permission_hook",
+    )
+
+    def __init__(
+        self,
+        name,
+        permissions=(),
+        is_authenticated=True,
+        is_superuser=False,
+        passes_login_hook=False,
+        passes_permission_hook=False,
+    ):
+        self.name = name
+        self.permissions = frozenset(permissions)
+        self.is_authenticated = is_authenticated
+        self.is_superuser = is_superuser
+        self.passes_login_hook = passes_login_hook
+        self.passes_permission_hook = passes_permission_hook
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return f"<AccessRole {self.name!r}>"
+
+    def has_perm(self, perm):
+        """Determine if the role holds a single permission."""
+        return self.is_superuser or perm in self.permissions
+
+
+def get_access_decision(route_policy, role):
+    """Get the access decision for a role requesting a route.
+
+    Follows the same order of checks as AuthMiddleware.run_auth_checks().
+
+    :return: One of ALLOW, LOGIN or FORBIDDEN.
+    """
+
+    # Handle if view requires user login to proceed.
+    if route_policy.requires_login and not (
+        role.is_authenticated or route_policy.login_exempt or role.passes_login_hook
+    ):
+        return LOGIN
+
+    # Handle if view requires specific user permissions to proceed.
+    if route_policy.requires_permissions and not (
+        passes_permission_checks(route_policy.one_of_permissions, route_policy.full_permissions, role.has_perm)
+        or route_policy.permission_exempt
+        or role.passes_permission_hook
+    ):
+        return FORBIDDEN
+
+    return ALLOW
+
+
+def get_access_decisions(route_policies, roles):
+    """Get the access decisions for every route and role.
+
+    :return: List with a list of decisions per route, in the same order as the given roles.
+    """
+    return [[get_access_decision(route_policy, role) for role in roles] for route_policy in route_policies]
+
+
+def get_access_decisions_in_pool(route_policies, roles, processes, chunk_size=500):
+    """Get the access decisions for every route and role, split across a pool of worker processes.
+
+    :return: Same as get_access_decisions().
+    """
+    route_policies = list(route_policies)
+    chunks = [route_policies[index : index + chunk_size] for index in range(0, len(route_policies), chunk_size)]
+
+    decisions = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for chunk_decisions in executor.map(get_access_decisions, chunks, [roles] * len(chunks)):
+            decisions.extend(chunk_decisions)
+    return decisions
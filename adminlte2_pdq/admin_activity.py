@@ -0,0 +1,51 @@
+"""Django AdminLTE2 Admin Recent Activity"""
+
+# Third-Party Imports.
+from django.contrib.admin.models import LogEntry
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Internal Imports.
+from .constants import ADMIN_RECENT_ACTIVITY_CACHE_TIMEOUT
+
+
+# Module Variables.
+RECENT_ACTIVITY_LIMIT = 10
+RECENT_ACTIVITY_CACHE_KEY = "adminlte2_pdq:recent_activity:{user_pk}"
+
+
+def get_recent_activity_cache_key(user_pk):
+    """Get the cache key holding the recent activity of a user."""
+    return RECENT_ACTIVITY_CACHE_KEY.format(user_pk=user_pk)
+
+
+def get_recent_activity(user):
+    """Get the most recent admin log entries of a user.
+
+    Entries are cached per user, and cleared whenever one of the user's log entries is saved or deleted.
+    Log entries created via bulk_create (such as the admin "delete selected" action) do not send signals,
+    so the cache also expires after the ADMINLTE2_ADMIN_RECENT_ACTIVITY_CACHE_TIMEOUT number of seconds.
+
+    :param user: User to get log entries for.
+    :return: List of LogEntry instances, newest first.
+    """
+    if user is None or user.pk is None:
+        return []
+
+    cache_key = get_recent_activity_cache_key(user.pk)
+    log_entries = cache.get(cache_key)
+
+    if log_entries is None:
+        log_entries = LogEntry.objects.filter(user__pk=user.pk).select_related("content_type")
+        log_entries = list(log_entries[:RECENT_ACTIVITY_LIMIT])
+        cache.set(cache_key, log_entries, ADMIN_RECENT_ACTIVITY_CACHE_TIMEOUT)
+
+    return log_entries
+
+
+@receiver(post_save, sender=LogEntry, dispatch_uid="adminlte2_pdq_clear_recent_activity_on_save")
+@receiver(post_delete, sender=LogEntry, dispatch_uid="adminlte2_pdq_clear_recent_activity_on_delete")
+def clear_recent_activity(sender, instance, **kwargs):  # pylint:disable=unused-argument
+    """Clear the cached recent activity of the user that a log entry belongs to."""
+    cache.delete(get_recent_activity_cache_key(instance.user_id))
@@ -0,0 +1,24 @@
+"""Django AdminLte2Pdq app configuration."""
+
+# Third-Party Imports.
+from django.apps import AppConfig, apps
+
+
+class AdminLte2PdqConfig(AppConfig):
+    """App configuration for Django AdminLte2Pdq."""
+
+    name = "adminlte2_pdq"
+    verbose_name = "Django AdminLTE2 PDQ"
+
+    def ready(self):
+        # Build the authentication and authorization policy, now that settings are ready.
+        from .policy import Policy  # pylint:disable=import-outside-toplevel
+
+        Policy.reload()
+
+        # Register package system checks.
+        from . import checks  # noqa: F401 pylint:disable=import-outside-toplevel,unused-import
+
+        # Connect recent activity cache invalidation, if the admin is in use.
+        if apps.is_installed("django.contrib.admin"):
+            from . import admin_activity  # noqa: F401 pylint:disable=import-outside-toplevel,unused-import
@@ -0,0 +1,403 @@
+"""Django AdminLte2Pdq asset bundles.
+
+The "bundleassets" command concatenates and minifies the local static files that the base templates
+otherwise load one by one, into one content-hashed CSS bundle and one content-hashed JS bundle.
+When the ADMINLTE2_USE_ASSET_BUNDLES setting is set, the base templates load the bundles instead.
+
+Bundle names are stored in a bundle manifest, written alongside the bundles. The manifest stores a checksum
+of the bundle definitions it was built from. If the manifest can't be found, or the checksum no longer
+matches (such as after upgrading the package), the bundles are ignored and the individual files are loaded.
+
+Minification is deliberately conservative, and done in pure Python so that bundles can be built offline.
+It only removes comments and redundant whitespace, and leaves already minified (".min.") files as is.
+"""
+
+# System Imports.
+import json
+import logging
+import posixpath
+import re
+from hashlib import sha256
+from pathlib import Path
+
+# Third-Party Imports.
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Internal Imports.
+from .constants import USE_ASSET_BUNDLES
+
+
+logger = logging.getLogger(__name__)
+
+
+# Version of the manifest format. Manifests of any other version are ignored.
+MANIFEST_VERSION = 1
+
+# Static path of the folder that bundles are written to, and of the bundle manifest within it.
+BUNDLES_DIR = "adminlte2_pdq/bundles"
+BUNDLE_MANIFEST_PATH = f"{BUNDLES_DIR}/manifest.json"
+
+# Static files of each bundle, in load order. Matches the order of the base templates.
+# The datetime picker files depend on the widget settings, so are still loaded individually,
+# as is sidebar-state.js, which must run as soon as the body tag is rendered.
+ASSET_BUNDLES = {
+    "styles": (
+        "third-party/bootstrap/3.3.7/css/bootstrap.min.css",
+        "third-party/font-awesome-5/5.8.2/css/all.min.css",
+        "third-party/font-awesome/4.7.0/css/font-awesome.min.css",
+        "third-party/admin-lte/2.3.11/css/AdminLTE.css",
+        "third-party/admin-lte/2.3.11/css/skins/_all-skins.min.css",
+        "third-party/bootstrap-datatables/dataTables.bootstrap.css",
+        "adminlte2_pdq/extra-features/extra-features.css",
+        "adminlte2_pdq/extra-features/header-breadcrumb-overlap-fix.css",
+        "adminlte2_pdq/conflicts/conflicts.css",
+    ),
+    "scripts": (
+        "third-party/jquery/2.2.4/jquery.min.js",
+        "third-party/jqueryui/1.11.4/jquery-ui.min.js",
+        "third-party/bootstrap/3.3.7/js/bootstrap.min.js",
+        "third-party/admin-lte/2.3.11/js/app.min.js",
+        "third-party/inputmask/4.0.7/min/jquery.inputmask.bundle.min.js",
+        "third-party/inputmask/4.0.7/min/inputmask/bindings/inputmask.binding.min.js",
+        "third-party/bootstrap-datatables/dataTables.js",
+        "third-party/bootstrap-datatables/dataTables.bootstrap.js",
+        "adminlte2_pdq/extra-features/extra-features.js",
+        "adminlte2_pdq/extra-features/header-breadcrumb-overlap-fix.js",
+        "adminlte2_pdq/conflicts/conflicts.js",
+    ),
+}
+
+# Number of content hash characters in bundle file names.
+BUNDLE_HASH_LENGTH = 12
+
+
+# CSS strings and comments, which are kept as is when minifying.
+_CSS_TOKEN_RE = re.compile(r"(\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*'|/\*.*?\*/)", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE_RE = re.compile(r" ?([{};,]) ?")
+_CSS_CHARSET_RE = re.compile(r"\s*@charset\s+[^;]*;", re.I)
+_CSS_LEADING_IMPORT_RE = re.compile(r"\s*(@import\s[^;]*;)", re.I)
+_CSS_URL_RE = re.compile(r"url\(\s*([\"']?)([^\"')]*)\1\s*\)", re.I)
+# Urls that don't point at a file relative to the stylesheet. Such as "data:", "https://", "//host" or "/static/".
+_ABSOLUTE_URL_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|/|#)", re.I)
+
+# JS tokens, matched in order. Regex literals are matched separately, as they depend on the preceding token.
+_JS_TOKEN_RE = re.compile(
+    r"(?P<comment>//[^\n]*|/\*.*?\*/)"
+    r"|(?P<string>\"(?:[^\"\\\n]|\\.)*\"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)"
+    r"|(?P<space>\s+)"
+    r"|(?P<slash>/)"
+    r"|(?P<code>[^\s/\"'`]+)",
+    re.S,
+)
+# Preceding token endings and keywords, after which a "/" starts a regex literal instead of a division.
+_JS_REGEX_PRECEDING_CHARACTERS = frozenset("(,=:[!&|?{};~")
+_JS_REGEX_PRECEDING_KEYWORDS = frozenset(
+    ("return", "typeof", "case", "do", "else", "in", "instanceof", "new", "delete", "void", "throw", "yield")
+)
+# Characters that whitespace can be dropped next to, without joining two tokens into one.
+_JS_PUNCTUATION = frozenset("{}()[];,=:<>?!&|*%~^")
+# Characters that a line break can be dropped after, as a statement can't end with them.
+_JS_CONTINUING_CHARACTERS = frozenset("{([;,=:&|?")
+_SOURCE_MAP_RE = re.compile(r"^[ \t]*(?://|/\*)# sourceMappingURL=[^\n]*$\n?", re.M)
+
+
+def minify_css(content):
+    """Minify CSS, by removing comments and redundant whitespace.
+
+    Comments starting with "/*!", such as license headers, are kept.
+    """
+    parts = []
+    plain = ""
+    for index, part in enumerate(_CSS_TOKEN_RE.split(content)):
+        if index % 2 == 0:
+            plain += part
+        elif part.startswith("/*") and not part.startswith("/*!"):
+            # Comments still separate tokens.
+            plain += " "
+        else:
+            parts.extend((_minify_css_plain(plain), part))
+            plain = ""
+    parts.append(_minify_css_plain(plain))
+    return "".join(parts).strip()
+
+
+def _minify_css_plain(content):
+    """Minify CSS outside of strings and comments."""
+    content = _CSS_SPACE_RE.sub(" ", content)
+    content = _CSS_PUNCTUATION_SPACE_RE.sub(r"\1", content)
+    return content.replace(";}", "}")
+
+
+def rewrite_css_urls(content, source_path, bundle_path):
+    """Rewrite the relative urls of a stylesheet, such as of fonts and images, to be relative to the bundle.
+
+    :param content: Stylesheet content.
+    :param source_path: Static path of the stylesheet.
+    :param bundle_path: Static path of the bundle that the stylesheet is added to.
+    """
+    source_dir = posixpath.dirname(source_path)
+    bundle_dir = posixpath.dirname(bundle_path)
+
+    def rewrite(match):
+        quote, url = match.groups()
+        if not url or _ABSOLUTE_URL_RE.match(url):
+            return match.group(0)
+
+        # Keep any query or fragment, such as "?#iefix" or "?v=4.7.0".
+        path, suffix = re.match(r"([^?#]*)(.*)", url, re.S).groups()
+        if not path:
+            return match.group(0)
+        target = posixpath.normpath(posixpath.join(source_dir, path))
+        return f"url({quote}{posixpath.relpath(target, bundle_dir)}{suffix}{quote})"
+
+    return _CSS_URL_RE.sub(rewrite, content)
+
+
+def minify_js(content):
+    """Minify JS, by removing comments and redundant whitespace.
+
+    Comments starting with "/*!", such as license headers, are kept. Line breaks are only dropped where
+    a statement can't end, so that automatic semicolon insertion is unchanged.
+    """
+    parts = []
+    # Last code token emitted, to tell regex literals from divisions.
+    last_code = ""
+    # Whitespace between the last emitted token and the next one. "\n" if it includes a line break.
+    pending_space = ""
+
+    position = 0
+    while position < len(content):
+        match = _JS_TOKEN_RE.match(content, position)
+        kind = match.lastgroup
+        token = match.group()
+        position = match.end()
+
+        if kind == "space" or (kind == "comment" and not token.startswith("/*!")):
+            if "\n" in token or token.startswith("//") or pending_space == "\n":
+                pending_space = "\n"
+            else:
+                pending_space = " "
+            continue
+
+        if kind == "slash" and _is_js_regex_start(last_code):
+            end = _find_js_regex_end(content, position)
+            if end is not None:
+                token = content[match.start() : end]
+                position = end
+                kind = "regex"
+
+        if parts and pending_space:
+            parts.append(_get_js_separator(parts[-1], token, pending_space))
+        pending_space = ""
+        parts.append(token)
+        if kind in ("code", "slash", "regex", "string"):
+            last_code = token
+
+    return "".join(parts)
+
+
+def _is_js_regex_start(last_code):
+    """Determine if a "/" after the given code token starts a regex literal."""
+    if not last_code:
+        return True
+    return last_code[-1] in _JS_REGEX_PRECEDING_CHARACTERS or last_code in _JS_REGEX_PRECEDING_KEYWORDS
+
+
+def _find_js_regex_end(content, position):
+    """Find the end of a regex literal, from just after its opening "/". Gets None if not a regex literal."""
+    in_class = False
+    while position < len(content):
+        character = content[position]
+        if character == "\\":
+            position += 2
+            continue
+        if character == "\n":
+            return None
+        if character == "[":
+            in_class = True
+        elif character == "]":
+            in_class = False
+        elif character == "/" and not in_class:
+            return position + 1
+        position += 1
+    return None
+
+
+def _get_js_separator(previous, following, space):
+    """Get the whitespace to keep between two tokens."""
+    if space == "\n":
+        if previous[-1] in _JS_CONTINUING_CHARACTERS or following[0] in "})]":
+            return ""
+        return "\n"
+    if previous[-1] in _JS_PUNCTUATION or following[0] in _JS_PUNCTUATION:
+        return ""
+    return " "
+
+
+def find_static_file(path):
+    """Get the absolute file path of a static file, as found by the staticfiles finders.
+
+    :raises FileNotFoundError: If the static file can't be found.
+    """
+    absolute_path = finders.find(path)
+    if not absolute_path:
+        raise FileNotFoundError(f"Static file {path} could not be found.")
+    return absolute_path
+
+
+def get_bundles_checksum():
+    """Get a checksum of the bundle definitions that a manifest is built from."""
+    return sha256(json.dumps([MANIFEST_VERSION, ASSET_BUNDLES]).encode("utf-8")).hexdigest()
+
+
+def build_bundle(name, paths):
+    """Build the content of a bundle.
+
+    :param name: Bundle name, such as "styles".
+    :param paths: Static paths of the files to bundle, in load order. All of either ".css" or ".js" files.
+    :return: Tuple of the static path of the bundle, including the content hash, and the bundle content.
+    """
+    extension = posixpath.splitext(paths[0])[1]
+    if extension not in (".css", ".js") or any(not path.endswith(extension) for path in paths):
+        raise ValueError(f'Asset bundle "{name}" must only contain ".css" files, or only ".js" files.')
+
+    # Urls are made relative to the bundle folder, which doesn't depend on the content hash.
+    bundle_dir_path = f"{BUNDLES_DIR}/{name}{extension}"
+
+    contents = []
+    imports = []
+    for path in paths:
+        with open(find_static_file(path), encoding="utf-8-sig") as static_file:
+            content = _SOURCE_MAP_RE.sub("", static_file.read())
+
+        if extension == ".css":
+            content = rewrite_css_urls(content, path, bundle_dir_path)
+            if ".min." not in path:
+                content = minify_css(content)
+            # Imports are only valid at the start of a stylesheet, so are moved to the start of the bundle.
+            content = _CSS_CHARSET_RE.sub("", content, count=1)
+            while True:
+                match = _CSS_LEADING_IMPORT_RE.match(content)
+                if not match:
+                    break
+                imports.append(match.group(1))
+                content = content[match.end() :]
+        elif ".min." not in path:
+            content = minify_js(content)
+
+        contents.append(content.strip())
+
+    if extension == ".css":
+        bundle = "\n".join(imports + contents) + "\n"
+    else:
+        # Separated by semicolons, in case a file doesn't end its last statement.
+        bundle = "\n;\n".join(contents) + "\n"
+
+    content_hash = sha256(bundle.encode("utf-8")).hexdigest()[:BUNDLE_HASH_LENGTH]
+    return f"{BUNDLES_DIR}/{name}.{content_hash}{extension}", bundle
+
+
+def write_bundles(output_dir):
+    """Build every bundle in ASSET_BUNDLES, and write them and the bundle manifest.
+
+    :param output_dir: Static files folder to write to, such as STATIC_ROOT.
+        Files are written to the BUNDLES_DIR folder within it.
+    :return: Manifest dict.
+    """
+    bundles = {}
+    for name, paths in ASSET_BUNDLES.items():
+        bundle_path, content = build_bundle(name, paths)
+        file_path = Path(output_dir, bundle_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding="utf-8")
+        bundles[name] = bundle_path
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "checksum": get_bundles_checksum(),
+        "bundles": bundles,
+    }
+    Path(output_dir, BUNDLE_MANIFEST_PATH).write_text(json.dumps(manifest, indent=4), encoding="utf-8")
+    return manifest
+
+
+def _read_manifest():
+    """Read the bundle manifest, from the staticfiles finders, or else from the static files storage."""
+    manifest_path = finders.find(BUNDLE_MANIFEST_PATH)
+    if manifest_path:
+        with open(manifest_path, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+
+    with staticfiles_storage.open(BUNDLE_MANIFEST_PATH) as manifest_file:
+        return json.loads(manifest_file.read().decode("utf-8"))
+
+
+class _AssetBundles:
+    """Loaded asset bundle manifest.
+
+    Loaded on first use, if the ADMINLTE2_USE_ASSET_BUNDLES setting is set.
+    Run adminlte2_pdq.warmup() to load it before worker processes are forked.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.bundles = {}
+
+    def load(self):
+        """Load the bundle manifest. Leaves the bundles empty if not enabled, unreadable or out of date.
+
+        :return: True if the manifest was loaded, otherwise False.
+        """
+        self.loaded = True
+        self.bundles = {}
+
+        if not USE_ASSET_BUNDLES:
+            return False
+
+        try:
+            manifest = _read_manifest()
+        except (OSError, ValueError, ImproperlyConfigured) as err:
+            logger.warning("Could not read asset bundle manifest, using individual static files: %s", err)
+            return False
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("checksum") != get_bundles_checksum():
+            logger.warning(
+                "Asset bundle manifest does not match the package asset bundles, using individual static files. "
+                "Rebuild the bundles with the bundleassets command."
+            )
+            return False
+
+        self.bundles = manifest["bundles"]
+        return True
+
+    def clear(self):
+        """Clear the loaded manifest, so that it is loaded again on next use."""
+        self.loaded = False
+        self.bundles = {}
+
+    def get(self):
+        """Get the loaded bundles, as a dict of bundle name to static path.
+
+        Returned dict is shared between calls, so must not be modified.
+
+        :return: Dict of bundle paths, or an empty dict if bundles are not in use.
+        """
+        if not self.loaded:
+            self.load()
+        return self.bundles
+
+
+# Make the asset bundles instance.
+AssetBundles = _AssetBundles()
+
+
+@receiver(setting_changed)
+def _reset_asset_bundles(*, setting, **kwargs):
+    """Clear the loaded manifest when static file locations change, so that it is found again."""
+    if setting in ("STATIC_ROOT", "STATICFILES_DIRS", "STATICFILES_FINDERS", "STORAGES"):
+        AssetBundles.clear()
@@ -0,0 +1,152 @@
+"""Django AdminLte2Pdq cache warm-up.
+
+Eagerly computes the values that the package otherwise computes on first use, so that
+the first requests to each worker process don't pay for them. Makes no database queries
+and opens no connections, so is safe to run before worker processes are forked,
+such as from the gunicorn "preload_app" setting, where warmed values are then shared.
+"""
+
+# System Imports.
+import logging
+from pathlib import Path
+
+# Third-Party Imports.
+from django.apps import apps
+from django.template import Engine, TemplateDoesNotExist, TemplateSyntaxError
+from django.utils.functional import Promise
+
+# Internal Imports.
+from .asset_bundles import AssetBundles
+from .menu import get_menu_setting, walk_menu_nodes
+from .policy import Policy
+from .policy_manifest import PolicyManifest
+from .renderers import PARTIAL_TEMPLATES
+from .templatetags.sidebar_menu import ensure_node_has_url_property
+from .ui_settings import UISettings
+
+
+logger = logging.getLogger(__name__)
+
+
+# Package template folders to compile. The admin folder is only compiled if the admin is installed.
+WARMUP_TEMPLATE_FOLDERS = ("adminlte2", "registration", "admin")
+
+
+def warm_whitelists():
+    """Evaluate lazy whitelist entries, such as the default LOGIN_URL, so they aren't reversed on each request.
+
+    :return: Number of entries evaluated.
+    """
+    count = 0
+    for whitelist in (Policy.login_exempt_whitelist, Policy.strict_policy_whitelist):
+        for index, entry in enumerate(whitelist):
+            if isinstance(entry, Promise):
+                whitelist[index] = str(entry)
+                count += 1
+    return count
+
+
+def warm_ui_settings():
+    """Build the UI settings snapshot for the default urlconf. Also populates the url resolver reverse lookups.
+
+    :return: Number of snapshots built.
+    """
+    UISettings.get()
+    return 1
+
+
+def warm_menu():
+    """Reverse the url of every node in the ADMINLTE2_MENU setting, or the default menu if it is in use.
+
+    Urls are stored on the nodes themselves, the same as on first render of the menu.
+
+    :return: Number of nodes with a url.
+    """
+    count = 0
+    for node in walk_menu_nodes(get_menu_setting()):
+        if node.get("nodes"):
+            # Is a tree node, which may not have a route.
+            ensure_node_has_url_property(node, required=False)
+        else:
+            ensure_node_has_url_property(node)
+        count += 1
+    return count
+
+
+def warm_manifest():
+    """Load the route policy manifest, if the ADMINLTE2_ROUTE_POLICY_MANIFEST setting is set and it is up to date.
+
+    :return: Number of routes loaded.
+    """
+    PolicyManifest.load()
+    return len(PolicyManifest.routes)
+
+
+def warm_asset_bundles():
+    """Load the asset bundle manifest, if the ADMINLTE2_USE_ASSET_BUNDLES setting is set and it is up to date.
+
+    :return: Number of bundles loaded.
+    """
+    AssetBundles.load()
+    return len(AssetBundles.bundles)
+
+
+def get_package_template_names():
+    """Get the names of all templates provided by the package, for the installed apps."""
+    templates_dir = Path(__file__).resolve().parent / "templates"
+
+    template_names = []
+    for folder in WARMUP_TEMPLATE_FOLDERS:
+        if folder == "admin" and not apps.is_installed("django.contrib.admin"):
+            continue
+        template_names.extend(
+            path.relative_to(templates_dir).as_posix() for path in sorted((templates_dir / folder).rglob("*.html"))
+        )
+    return template_names
+
+
+def warm_templates():
+    """Compile the package templates into the template loader cache, and the form partial templates.
+
+    Templates that can't compile in the current project, such as ones loading a library from an app
+    that isn't installed, are skipped.
+
+    :return: Number of templates compiled.
+    """
+    engine = Engine.get_default()
+
+    count = 0
+    for template_name in get_package_template_names():
+        try:
+            engine.get_template(template_name)
+        except (TemplateDoesNotExist, TemplateSyntaxError) as err:
+            logger.debug("Skipped warming template %s: %s", template_name, err)
+        else:
+            count += 1
+
+    PARTIAL_TEMPLATES.get()
+
+    return count
+
+
+# Warm-up steps, in the order run.
+WARMUP_STEPS = {
+    "whitelists": warm_whitelists,
+    "ui_settings": warm_ui_settings,
+    "menu": warm_menu,
+    "manifest": warm_manifest,
+    "asset_bundles": warm_asset_bundles,
+    "templates": warm_templates,
+}
+
+
+def warmup(steps=None):
+    """Precompute the package caches.
+
+    :param steps: Names of steps to run, from WARMUP_STEPS. Defaults to all steps.
+    :return: Dict of step name, to the number of items warmed by the step.
+    """
+    if steps is None:
+        steps = list(WARMUP_STEPS)
+
+    return {step: WARMUP_STEPS[step]() for step in steps}
@@ -0,0 +1,103 @@
+"""Django AdminLte2Pdq package system checks."""
+
+# Third-Party Imports.
+from django.core import checks
+from django.db import DatabaseError, router
+from django.urls import get_resolver
+
+# Internal Imports.
+from .url_walker import walk_url_patterns
+
+
+def _get_view_permissions(view):
+    """Get all permission strings declared on a view, by the package decorators or mixins."""
+
+    # Class-based views declare permissions on the class. Function-based views on the function itself.
+    view_source = getattr(view, "view_class", view)
+
+    permissions = set()
+    for attribute_name in ("permission_required", "permission_required_one", "object_permission_required"):
+        value = getattr(view_source, attribute_name, None)
+        if isinstance(value, str):
+            permissions.add(value)
+        elif isinstance(value, (list, tuple)):
+            permissions.update(perm for perm in value if isinstance(perm, str))
+
+    return permissions
+
+
+@checks.register(checks.Tags.database)
+def check_view_permissions(databases=None, **kwargs):
+    """Check that all permission strings declared on project views exist in the Permission table.
+
+    Catches typos in permission strings, which would otherwise silently lock users out of views.
+    Registered as a database check, so only runs for "migrate" and "check --database".
+    """
+
+    if not databases:
+        return []
+
+    # Imported here, as models are not available until the app registry is ready.
+    from django.contrib.auth.models import Permission  # pylint:disable=import-outside-toplevel
+
+    url_patterns = [url_pattern for _, _, url_pattern in walk_url_patterns(get_resolver().url_patterns)]
+
+    # Map each declared permission to the views declaring it.
+    declared_permissions = {}
+    for url_pattern in url_patterns:
+        for permission in _get_view_permissions(url_pattern.callback):
+            declared_permissions.setdefault(permission, set()).add(url_pattern.lookup_str)
+
+    if not declared_permissions:
+        return []
+
+    errors = []
+
+    # Validate permission format, prior to querying.
+    codenames = set()
+    for permission in sorted(declared_permissions):
+        app_label, _, codename = permission.partition(".")
+        if not app_label or not codename:
+            errors.append(
+                checks.Error(
+                    f"Permission '{permission}' is not in the 'app_label.codename' format.",
+                    hint=f"Used by: {', '.join(sorted(declared_permissions[permission]))}",
+                    id="adminlte2_pdq.E001",
+                )
+            )
+        else:
+            codenames.add(codename)
+
+    # Only the databases that hold the Permission table can be checked.
+    aliases = [alias for alias in databases if router.allow_migrate_model(alias, Permission)]
+    if not aliases:
+        return errors
+
+    # Fetch all matching permissions in a single query, per database.
+    existing_permissions = set()
+    for alias in aliases:
+        try:
+            existing_permissions.update(
+                f"{app_label}.{codename}"
+                for app_label, codename in Permission.objects.using(alias)
+                .filter(codename__in=codenames)
+                .values_list("content_type__app_label", "codename")
+            )
+        except DatabaseError:
+            # Permission table is not available yet, such as prior to running migrations.
+            return errors
+
+    for permission in sorted(declared_permissions):
+        if "." in permission and permission not in existing_permissions:
+            errors.append(
+                checks.Warning(
+                    f"Permission '{permission}' does not exist in the Permission table.",
+                    hint=(
+                        "Check the permission string for typos. "
+                        f"Used by: {', '.join(sorted(declared_permissions[permission]))}"
+                    ),
+                    id="adminlte2_pdq.W001",
+                )
+            )
+
+    return errors
@@ -7,10 +7,14 @@ from .general_constants import (
     TIME_WIDGET,
     BOLD_REQUIRED_FIELDS,
     ASTERISK_REQUIRED_FIELDS,
+    USE_LOCAL_AVATARS,
+    USE_ASSET_BUNDLES,
+    ADMIN_RECENT_ACTIVITY_CACHE_TIMEOUT,
     # 403 / 404 handling.
     REDIRECT_TO_HOME_ON_403,
     REDIRECT_TO_HOME_ON_404,
     # Message settings.
+    MESSAGE_CHANNEL_CAPACITY,
     RESPONSE_403_DEBUG_MESSAGE,
     RESPONSE_403_PRODUCTION_MESSAGE,
     RESPONSE_404_DEBUG_MESSAGE,
@@ -46,4 +50,5 @@ from .route_and_policy_constants import (
     STRICT_POLICY,
     STRICT_POLICY_SERVE_403_FUZZY_WHITELIST,
     STRICT_POLICY_SERVE_404_FUZZY_WHITELIST,
+    ROUTE_POLICY_MANIFEST,
 )
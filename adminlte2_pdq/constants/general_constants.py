@@ -1,4 +1,8 @@
-"""General package constants."""
+"""General package constants.
+
+Read once, when the package is imported. Unlike the settings of adminlte2_pdq.policy, later changes to these
+settings, such as from override_settings() in tests, have no effect until the process restarts.
+"""
 
 # Third-Party Imports.
 from django.conf import settings
@@ -16,6 +20,25 @@ BOLD_REQUIRED_FIELDS = getattr(settings, "ADMINLTE2_BOLD_REQUIRED_FIELDS", True)
 ASTERISK_REQUIRED_FIELDS = getattr(settings, "ADMINLTE2_ASTERISK_REQUIRED_FIELDS", True)
 
 
+# Boolean indicating if user avatars should be served as initials images from the package avatar view,
+# instead of from gravatar. Allows pages to render without any external requests.
+USE_LOCAL_AVATARS = getattr(settings, "ADMINLTE2_USE_LOCAL_AVATARS", False)
+
+
+# Boolean indicating if the base templates should load the package static files from the content-hashed
+# bundles written by the "bundleassets" command, instead of as individual files.
+USE_ASSET_BUNDLES = getattr(settings, "ADMINLTE2_USE_ASSET_BUNDLES", False)
+
+
+# Maximum number of seconds that the admin "Recent Activity" log entries of a user are cached for.
+ADMIN_RECENT_ACTIVITY_CACHE_TIMEOUT = getattr(settings, "ADMINLTE2_ADMIN_RECENT_ACTIVITY_CACHE_TIMEOUT", 60)
+
+
+# Maximum number of distinct messages that the package message channel will keep pending for a user.
+# Repeated messages only increment a count, so do not count against this.
+MESSAGE_CHANNEL_CAPACITY = getattr(settings, "ADMINLTE2_MESSAGE_CHANNEL_CAPACITY", 10)
+
+
 # Whether the system should use it's default functionality of redirecting users
 # to the home page on a 403 error, or just raise a 403 error that should be
 # handled manually by whatever means the user of the package has set up.
@@ -28,43 +51,35 @@ REDIRECT_TO_HOME_ON_404 = getattr(settings, "ADMINLTE2_REDIRECT_TO_HOME_ON_404",
 # The message to show upon a standard 403 "missing permissions" redirect.
 # To skip showing messages, change either setting to a blank string.
 # The `debug` message only shows if the above ADMINLTE_DEBUG = True. Otherwise the `production` message shows.
+DEFAULT_RESPONSE_403_DEBUG_MESSAGE = (
+    "AdminLtePdq Warning: Attempted to access {view_type} view '{view_name}' which "
+    "requires permissions, and user permission requirements were not met. "
+    "Redirected to project home instead. \n"
+    "\n\n"
+    "For further information, please see the docs: "
+    "https://django-adminlte2-pdq.readthedocs.io/"
+)
+DEFAULT_RESPONSE_403_PRODUCTION_MESSAGE = (
+    "Unable to locate the requested page. If you believe this was an error, please contact the site administrator."
+)
 RESPONSE_403_DEBUG_MESSAGE = str(
-    getattr(
-        settings,
-        "ADMINLTE2_RESPONSE_403_DEBUG_MESSAGE",
-        (
-            "AdminLtePdq Warning: Attempted to access {view_type} view '{view_name}' which "
-            "requires permissions, and user permission requirements were not met. "
-            "Redirected to project home instead. \n"
-            "\n\n"
-            "For further information, please see the docs: "
-            "https://django-adminlte2-pdq.readthedocs.io/"
-        ),
-    )
+    getattr(settings, "ADMINLTE2_RESPONSE_403_DEBUG_MESSAGE", DEFAULT_RESPONSE_403_DEBUG_MESSAGE)
 ).strip()
 RESPONSE_403_PRODUCTION_MESSAGE = str(
-    getattr(
-        settings,
-        "ADMINLTE2_RESPONSE_403_PRODUCTION_MESSAGE",
-        "Unable to locate the requested page. If you believe this was an error, please contact the site administrator.",
-    )
+    getattr(settings, "ADMINLTE2_RESPONSE_403_PRODUCTION_MESSAGE", DEFAULT_RESPONSE_403_PRODUCTION_MESSAGE)
 ).strip()
 
 
 # The message to show upon a standard 404 "page not found" redirect.
 # To skip showing messages, change either setting to a blank string.
 # The `debug` message only shows if the above ADMINLTE_DEBUG = True. Otherwise the `production` message shows.
+DEFAULT_RESPONSE_404_DEBUG_MESSAGE = "AdminLtePdq Warning: The page you were looking for does not exist."
+DEFAULT_RESPONSE_404_PRODUCTION_MESSAGE = (
+    "Unable to locate the requested page. If you believe this was an error, please contact the site administrator."
+)
 RESPONSE_404_DEBUG_MESSAGE = str(
-    getattr(
-        settings,
-        "ADMINLTE2_RESPONSE_404_DEBUG_MESSAGE",
-        "AdminLtePdq Warning: The page you were looking for does not exist.",
-    )
+    getattr(settings, "ADMINLTE2_RESPONSE_404_DEBUG_MESSAGE", DEFAULT_RESPONSE_404_DEBUG_MESSAGE)
 ).strip()
 RESPONSE_404_PRODUCTION_MESSAGE = str(
-    getattr(
-        settings,
-        "ADMINLTE2_RESPONSE_404_PRODUCTION_MESSAGE",
-        "Unable to locate the requested page. If you believe this was an error, please contact the site administrator.",
-    )
+    getattr(settings, "ADMINLTE2_RESPONSE_404_PRODUCTION_MESSAGE", DEFAULT_RESPONSE_404_PRODUCTION_MESSAGE)
 ).strip()
@@ -42,6 +42,8 @@ STRICT_POLICY_WHITELIST = [
     HOME_ROUTE,
     PWD_CHANGE,
     PWD_CHANGE_DONE,
+    "adminlte2_pdq:avatar",
+    "adminlte2_pdq:avatar_initials",
 ] + LOGIN_EXEMPT_WHITELIST
 
 
@@ -106,6 +108,10 @@ STRICT_POLICY_SERVE_404_FUZZY_WHITELIST = tuple(
     )
 )
 
+# Path to a route policy manifest file, as written by the "policymanifest" command.
+# If set, the AuthMiddleware and sidebar menu read view policies from the manifest, instead of from the views.
+ROUTE_POLICY_MANIFEST = getattr(settings, "ADMINLTE2_ROUTE_POLICY_MANIFEST", None)
+
 # NOTE: This below logic is in functions vs right at module level so that it can be properly tested.
 # They are however called below at module level to ensure that they get run on import.
 
@@ -0,0 +1,13 @@
+"""Django AdminLte2Pdq context processors."""
+
+# Internal Imports.
+from .ui_settings import UISettings
+
+
+def ui_settings(request):  # pylint:disable=unused-argument
+    """Add the cached UI settings snapshot to the template context, as ``adminlte2_ui``.
+
+    Allows templates to read values such as ``{{ adminlte2_ui.skin_class }}`` directly,
+    without any settings lookups or url reversing during the render.
+    """
+    return {"adminlte2_ui": UISettings.get()}
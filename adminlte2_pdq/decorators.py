@@ -2,16 +2,29 @@
 
 # System Imports.
 from functools import wraps
+from urllib.parse import urlsplit
 
 # Third-Party Imports.
-from django.contrib.auth.decorators import (
-    login_required as django_login_required,
-    permission_required as django_permission_required,
-    user_passes_test,
-)
+from asgiref.sync import sync_to_async
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:
+    # Older asgiref versions (as shipped with Django 3.2) do not provide these helpers.
+    from asyncio import iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        """Fallback no-op. Older asgiref versions only detect actual "async def" functions."""
+        return func
+
+from django.conf import settings
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.contrib.auth.decorators import user_passes_test
 from django.core.exceptions import PermissionDenied
+from django.shortcuts import resolve_url
 from django.urls import reverse_lazy
 
+
 # Internal Imports.
 from .constants import HOME_ROUTE
 
@@ -19,32 +32,131 @@ from .constants import HOME_ROUTE
 # region Utility Functions
 
 
-def _one_of_permission_required(perm, login_url=None, raise_exception=False):
+def _redirect_to_login(request, login_url=None, redirect_field_name=REDIRECT_FIELD_NAME):
+    """Redirect to the login page. Same handling as Django's user_passes_test decorator."""
+
+    path = request.build_absolute_uri()
+    resolved_login_url = resolve_url(login_url or settings.LOGIN_URL)
+
+    # If the login url is the same scheme and net location then just use the path as the "next" url.
+    login_scheme, login_netloc = urlsplit(resolved_login_url)[:2]
+    current_scheme, current_netloc = urlsplit(path)[:2]
+    if (not login_scheme or login_scheme == current_scheme) and (not login_netloc or login_netloc == current_netloc):
+        path = request.get_full_path()
+
+    # Imported here to avoid loading auth views (and their models) at import time.
+    from django.contrib.auth.views import redirect_to_login  # pylint:disable=import-outside-toplevel
+
+    return redirect_to_login(path, resolved_login_url, redirect_field_name)
+
+
+async def _get_user_async(request):
+    """Get the request user without blocking the event loop."""
+
+    # Django 5.0+ provides an async user accessor on the request.
+    if hasattr(request, "auser"):
+        return await request.auser()
+
+    # Otherwise, resolve the (potentially lazy) user object in a thread.
+    return await sync_to_async(getattr)(request, "user")
+
+
+def _user_passes_test(test_func, login_url=None, redirect_field_name=REDIRECT_FIELD_NAME):
+    """
+    Decorator for views that checks that the user passes the given test,
+    redirecting to the log-in page if necessary.
+
+    Sync views are handled by Django's user_passes_test decorator.
+    Async views get an async wrapper, so that they keep running on the event loop.
+    """
+
+    def decorator(view_func):
+
+        # Handle for sync views.
+        if not iscoroutinefunction(view_func):
+            return user_passes_test(test_func, login_url=login_url, redirect_field_name=redirect_field_name)(view_func)
+
+        # Handle for async views.
+        async def _view_wrapper(request, *args, **kwargs):
+            user = await _get_user_async(request)
+
+            # Permission checks may query the database, so run test outside of the event loop.
+            if await sync_to_async(test_func)(user):
+                return await view_func(request, *args, **kwargs)
+
+            return _redirect_to_login(request, login_url, redirect_field_name)
+
+        return markcoroutinefunction(wraps(view_func)(_view_wrapper))
+
+    return decorator
+
+
+def _login_required(redirect_field_name=REDIRECT_FIELD_NAME, login_url=None):
     """
-    Decorator for views that checks whether a user has at least one particular
-    permission enabled, redirecting to the log-in page if necessary.
-    If the raise_exception parameter is given the PermissionDenied exception
-    is raised.
+    Decorator for views that checks that the user is logged in, redirecting
+    to the log-in page if necessary.
     """
+    return _user_passes_test(
+        lambda user: user.is_authenticated,
+        login_url=login_url,
+        redirect_field_name=redirect_field_name,
+    )
+
+
+class _PermissionChecker:
+    """Precompiled permission check, built once at decoration time.
+
+    Holds the view permissions as a frozenset, plus whether the user needs all of them, or only one.
+    Evaluated against the set of user permissions, which is computed once per request.
+    """
+
+    __slots__ = ("permissions", "require_all", "raise_exception")
 
-    def check_perms(user):
-        if isinstance(perm, str):
-            perm_list = (perm,)
-        else:
-            perm_list = perm
+    def __init__(self, permissions, require_all=True, raise_exception=False):
+        self.permissions = frozenset(permissions)
+        self.require_all = require_all
+        self.raise_exception = raise_exception
 
-        # Return if the user has any of the permissions in the perm_list
-        if any(user.has_perm(perm) for perm in perm_list):
+    def __call__(self, user):
+        # Return if the user passes the permission check.
+        if self.has_permissions(user):
             return True
 
         # In case the 403 handler should be called raise the exception.
-        if raise_exception:
+        if self.raise_exception:
             raise PermissionDenied
 
         # As the last resort, show the login form.
         return False
 
-    return user_passes_test(check_perms, login_url=login_url)
+    def has_permissions(self, user):
+        """Determine if user has all (or one, if not require_all) of the checker permissions."""
+
+        # Active superusers have all permissions. Skip loading the full permission set.
+        if user.is_active and user.is_superuser:
+            return True
+
+        # Cached by the auth backends on the user object, which only lives as long as the request.
+        user_permissions = user.get_all_permissions()
+
+        if self.require_all:
+            missing_permissions = self.permissions - user_permissions
+            # Fall back to has_perms() for any remainder, in case of backends that only implement has_perm().
+            return not missing_permissions or user.has_perms(missing_permissions)
+
+        return not self.permissions.isdisjoint(user_permissions) or any(
+            user.has_perm(permission) for permission in self.permissions
+        )
+
+
+def _permission_required(checker, login_url=None):
+    """
+    Decorator for views that checks whether a user passes the given precompiled
+    permission checker, redirecting to the log-in page if necessary.
+    If the checker has raise_exception set, the PermissionDenied exception
+    is raised instead.
+    """
+    return _user_passes_test(checker, login_url=login_url)
 
 
 def _sanitize_permissions(permission):
@@ -63,6 +175,46 @@ def _sanitize_permissions(permission):
     return permissions
 
 
+def _wrap_view(function, access_check=None):
+    """Wrap view function, preserving whether it is a sync or async (coroutine) view.
+
+    Wrapping an async view in a plain sync function would hide its coroutine-ness,
+    causing Django to run it in a thread via async_to_sync.
+
+    :param function: View function to wrap.
+    :param access_check: Optional decorator to check user access, prior to calling the view.
+    :return: Wrapped view function.
+    """
+
+    if iscoroutinefunction(function):
+
+        async def wrap(request, *args, **kwargs):
+
+            # Get our view response object.
+            function_view = await function(request, *args, **kwargs)
+
+            return function_view
+
+    else:
+
+        def wrap(request, *args, **kwargs):
+
+            # Get our view response object.
+            function_view = function(request, *args, **kwargs)
+
+            return function_view
+
+    if access_check:
+        wrap = access_check(wrap)
+
+    wrap = wraps(function)(wrap)
+
+    if iscoroutinefunction(function):
+        wrap = markcoroutinefunction(wrap)
+
+    return wrap
+
+
 # endregion Utility Functions
 
 
@@ -83,15 +235,7 @@ def allow_anonymous_access(function=None):
         # Save values to view fetch function for middleware handling + potential debugging.
         function.admin_pdq_data = admin_pdq_data
 
-        @wraps(function)
-        def wrap(request, *args, **kwargs):
-
-            # Get our view response object.
-            function_view = function(request, *args, **kwargs)
-
-            return function_view
-
-        return wrap
+        return _wrap_view(function)
 
     return decorator(function) if function else decorator
 
@@ -122,16 +266,7 @@ def login_required(function=None, redirect_field_name="next", login_url=None):
         # Save values to view fetch function for middleware handling + potential debugging.
         function.admin_pdq_data = admin_pdq_data
 
-        @wraps(function)
-        @django_login_required(redirect_field_name=redirect_field_name, login_url=login_url)
-        def wrap(request, *args, **kwargs):
-
-            # Get our view response object.
-            function_view = function(request, *args, **kwargs)
-
-            return function_view
-
-        return wrap
+        return _wrap_view(function, _login_required(redirect_field_name=redirect_field_name, login_url=login_url))
 
     return decorator(function) if function else decorator
 
@@ -155,16 +290,7 @@ def allow_without_permissions(function=None, redirect_field_name="next", login_u
         # Save values to view fetch function for middleware handling + potential debugging.
         function.admin_pdq_data = admin_pdq_data
 
-        @wraps(function)
-        @django_login_required(redirect_field_name=redirect_field_name, login_url=login_url)
-        def wrap(request, *args, **kwargs):
-
-            # Get our view response object.
-            function_view = function(request, *args, **kwargs)
-
-            return function_view
-
-        return wrap
+        return _wrap_view(function, _login_required(redirect_field_name=redirect_field_name, login_url=login_url))
 
     return decorator(function) if function else decorator
 
@@ -184,6 +310,7 @@ def permission_required_one(permission, login_url=None, raise_exception=False):
 
     # Ensure consistent permission format.
     permissions = _sanitize_permissions(permission)
+    checker = _PermissionChecker(permissions, require_all=False, raise_exception=raise_exception)
 
     admin_pdq_data = {
         "decorator_name": "permission_required",
@@ -199,16 +326,7 @@ def permission_required_one(permission, login_url=None, raise_exception=False):
         function.permission_required_one = permissions  # Must have one, if any.
         function.permission_required = None  # Must have all, if any. Same as Django.
 
-        @wraps(function)
-        @_one_of_permission_required(permission, login_url, raise_exception)
-        def wrap(request, *args, **kwargs):
-
-            # Get our view response object.
-            function_view = function(request, *args, **kwargs)
-
-            return function_view
-
-        return wrap
+        return _wrap_view(function, _permission_required(checker, login_url))
 
     return decorator
 
@@ -228,6 +346,7 @@ def permission_required(permission, login_url=None, raise_exception=False):
 
     # Ensure consistent permission format.
     permissions = _sanitize_permissions(permission)
+    checker = _PermissionChecker(permissions, require_all=True, raise_exception=raise_exception)
 
     admin_pdq_data = {
         "decorator_name": "permission_required",
@@ -243,16 +362,7 @@ def permission_required(permission, login_url=None, raise_exception=False):
         function.permission_required_one = None  # Must have one, if any.
         function.permission_required = permissions  # Must have all, if any. Same as Django.
 
-        @wraps(function)
-        @django_permission_required(permission, login_url, raise_exception)
-        def wrap(request, *args, **kwargs):
-
-            # Get our view response object.
-            function_view = function(request, *args, **kwargs)
-
-            return function_view
-
-        return wrap
+        return _wrap_view(function, _permission_required(checker, login_url))
 
     return decorator
 
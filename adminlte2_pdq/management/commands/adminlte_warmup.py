@@ -0,0 +1,49 @@
+"""
+Command to precompute the package caches, and report what was warmed.
+"""
+
+# System Imports.
+import time
+
+# Third-Party Imports.
+from django.core.management.base import BaseCommand
+
+# Internal Imports.
+from adminlte2_pdq.cache_warmup import WARMUP_STEPS
+
+
+class Command(BaseCommand):
+    """Command to run the package cache warm-up steps, with timings."""
+
+    help = (
+        "Precompute the AdminLtePdq caches (whitelists, UI settings, menu urls, route policy manifest, asset "
+        "bundles and templates), and report the time taken by each step. Useful for checking the cost of cold workers. "
+        "To share warmed caches with workers, call adminlte2_pdq.warmup() in the server process instead."
+    )
+
+    def add_arguments(self, parser):
+        """Define arguments to pass into command."""
+
+        parser.add_argument(
+            "--step",
+            action="append",
+            choices=list(WARMUP_STEPS),
+            help="Only run the given warm-up step. Can be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        """Entry point of command logic."""
+
+        steps = options["step"] or list(WARMUP_STEPS)
+        width = max(len(step) for step in steps)
+
+        total_time = 0
+        for step in steps:
+            start_time = time.perf_counter()
+            count = WARMUP_STEPS[step]()
+            step_time = time.perf_counter() - start_time
+            total_time += step_time
+
+            self.stdout.write(f"{step.ljust(width)}  {count:>5} warmed in {step_time * 1000:8.1f} ms")
+
+        self.stdout.write(self.style.SUCCESS(f"Warm-up complete in {total_time * 1000:.1f} ms."))
@@ -0,0 +1,220 @@
+"""
+Command to evaluate route access decisions for a set of users and roles.
+"""
+
+# Third-Party Imports.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser, Group
+from django.core.management.base import BaseCommand, CommandError
+from django.http import HttpRequest
+
+# Internal Imports.
+from adminlte2_pdq.access_decisions import (
+    AccessRole,
+    RoutePolicy,
+    get_access_decisions,
+    get_access_decisions_in_pool,
+)
+from adminlte2_pdq.management.output import (
+    RowWriter,
+    add_format_argument,
+    add_route_filter_arguments,
+    matches_route_filters,
+)
+from adminlte2_pdq.middleware import get_auth_middleware
+from adminlte2_pdq.url_walker import get_route_data, walk_url_patterns
+
+
+class Command(BaseCommand):
+    """Command to output an access matrix of every route, for each user and role."""
+
+    help = (
+        "Evaluate the AdminLtePdq AuthMiddleware access decision (allow, login or 403) of every route, "
+        "for each given user, group or synthetic role."
+    )
+
+    # Row keys that roles can't be named, as they're used for route values.
+    RESERVED_NAMES = ("app_name", "pattern", "name")
+
+    def add_arguments(self, parser):
+        """Define arguments to pass into command."""
+
+        parser.add_argument(
+            "--user",
+            action="append",
+            default=[],
+            metavar="USERNAME",
+            help="Evaluate access for an existing user. Can be repeated.",
+        )
+        parser.add_argument(
+            "--group",
+            action="append",
+            default=[],
+            metavar="NAME",
+            help="Evaluate access for a logged-in user with only the permissions of a group. Can be repeated.",
+        )
+        parser.add_argument(
+            "--role",
+            action="append",
+            default=[],
+            metavar="NAME=PERMISSIONS",
+            help=(
+                "Evaluate access for a logged-in user with a comma separated set of permissions, "
+                'such as "editor=blog.add_post,blog.change_post". Can be repeated.'
+            ),
+        )
+        parser.add_argument(
+            "--processes",
+            default=1,
+            type=int,
+            help="Number of worker processes to evaluate decisions in. Only worthwhile for very large projects.",
+        )
+        add_route_filter_arguments(parser)
+        add_format_argument(parser)
+
+    def handle(self, *args, **options):
+        """Entry point of command logic."""
+
+        middleware = self.get_middleware()
+        roles = self.get_roles(middleware, options)
+
+        # Calculate the policy of every route once. Decisions are then pure set operations per role.
+        urlconf = __import__(settings.ROOT_URLCONF, {}, {}, [""])
+        route_policies = [
+            self.get_route_policy(middleware, prefix, app_name, url)
+            for prefix, app_name, url in walk_url_patterns(urlconf.urlpatterns)
+            if matches_route_filters(app_name, url.name, options["filter_app_name"], options["filter_url_name"])
+        ]
+
+        if options["processes"] > 1:
+            decisions = get_access_decisions_in_pool(route_policies, roles, options["processes"])
+        else:
+            decisions = get_access_decisions(route_policies, roles)
+
+        role_names = [role.name for role in roles]
+
+        # Handle machine-readable output formats.
+        if options["format"] != "table":
+            writer = RowWriter(self.stdout, options["format"], ["app_name", "pattern", "name", *role_names])
+            writer.start()
+            for route_policy, route_decisions in zip(route_policies, decisions):
+                writer.write_row(
+                    {
+                        "app_name": route_policy.app_name,
+                        "pattern": route_policy.pattern,
+                        "name": route_policy.name,
+                        **dict(zip(role_names, route_decisions)),
+                    }
+                )
+            writer.finish()
+            return
+
+        # Calculate column widths for table output.
+        headers = ["Url Pattern", "Url Endpoint Name", *role_names]
+        widths = [len(header) for header in headers]
+        for route_policy, route_decisions in zip(route_policies, decisions):
+            for index, value in enumerate((route_policy.pattern, route_policy.name, *route_decisions)):
+                widths[index] = max(widths[index], len(value))
+
+        separator_str = "+-" + "-+-".join("-" * width for width in widths) + "-+"
+        header_str = "| " + " | ".join(header.ljust(width) for header, width in zip(headers, widths)) + " |"
+
+        # Display header separators.
+        self.stdout.write(self.style.SUCCESS(separator_str))
+        self.stdout.write(self.style.SUCCESS(header_str))
+        self.stdout.write(self.style.SUCCESS(separator_str))
+
+        for route_policy, route_decisions in zip(route_policies, decisions):
+            values = (route_policy.pattern, route_policy.name, *route_decisions)
+            self.stdout.write("| " + " | ".join(value.ljust(width) for value, width in zip(values, widths)) + " |")
+
+        # Display footer separators.
+        self.stdout.write(self.style.SUCCESS(separator_str))
+
+    def get_middleware(self):
+        """Get an instance of the project AuthMiddleware, or subclass of it, so that project hooks are used."""
+        return get_auth_middleware()
+
+    def get_roles(self, middleware, options):
+        """Get the roles to evaluate, with the permissions of each calculated once.
+
+        An anonymous role is always included. If no other roles are given, then a logged-in user without
+        permissions and a superuser are also included.
+        """
+        roles = [self.get_user_role(middleware, "anonymous", AnonymousUser())]
+
+        # Existing users.
+        UserModel = get_user_model()
+        for username in options["user"]:
+            try:
+                # Documented way to query any user model, despite the underscore.
+                user = UserModel._default_manager.get_by_natural_key(username)  # pylint:disable=protected-access
+            except UserModel.DoesNotExist as err:
+                raise CommandError(f"User '{username}' does not exist.") from err
+            roles.append(self.get_user_role(middleware, username, user))
+
+        # Groups, as synthetic roles.
+        for group_name in options["group"]:
+            try:
+                group = Group.objects.get(name=group_name)
+            except Group.DoesNotExist as err:
+                raise CommandError(f"Group '{group_name}' does not exist.") from err
+            permissions = [
+                f"{app_label}.{codename}"
+                for app_label, codename in group.permissions.values_list("content_type__app_label", "codename")
+            ]
+            roles.append(AccessRole(group_name, permissions))
+
+        # Synthetic roles.
+        for role in options["role"]:
+            name, separator, permissions = role.partition("=")
+            if not separator or not name:
+                raise CommandError(f"Role '{role}' is not in the 'NAME=PERMISSIONS' format.")
+            roles.append(AccessRole(name, [perm.strip() for perm in permissions.split(",") if perm.strip()]))
+
+        if len(roles) == 1:
+            roles.append(AccessRole("authenticated"))
+            roles.append(AccessRole("superuser", is_superuser=True))
+
+        role_names = [role.name for role in roles]
+        for name in role_names:
+            if name in self.RESERVED_NAMES or role_names.count(name) > 1:
+                raise CommandError(f"Role name '{name}' is reserved or used more than once.")
+
+        return roles
+
+    def get_user_role(self, middleware, name, user):
+        """Get role for a user. Permissions are fetched once, and middleware hooks are evaluated for the user."""
+        request = HttpRequest()
+        request.method = "GET"
+        request.path = request.path_info = "/"
+        request.user = user
+
+        return AccessRole(
+            name,
+            user.get_all_permissions() if user.is_active else (),
+            is_authenticated=user.is_authenticated,
+            is_superuser=user.is_active and user.is_superuser,
+            passes_login_hook=bool(middleware.login_required_hook(request)),
+            passes_permission_hook=bool(middleware.permission_required_hook(request)),
+        )
+
+    def get_route_policy(self, middleware, prefix, app_name, url):
+        """Get policy of a route, as calculated by the middleware from the view and settings."""
+        view_data = middleware.get_default_view_data("/" + prefix + str(url.pattern))
+        middleware.parse_view_data(view_data, url.callback, app_name, url.name)
+
+        route_data = get_route_data(prefix, app_name, url)
+
+        return RoutePolicy(
+            app_name=app_name,
+            pattern=route_data["pattern"],
+            name=route_data["name"],
+            requires_login=bool(middleware.view_requires_login(view_data)),
+            login_exempt=bool(middleware.is_login_exempt_route(view_data)),
+            requires_permissions=bool(middleware.view_requires_permissions(view_data)),
+            permission_exempt=bool(middleware.is_permission_exempt_route(view_data)),
+            one_of_permissions=tuple(view_data["one_of_permissions"] or ()) or None,
+            full_permissions=tuple(view_data["full_permissions"] or ()) or None,
+        )
@@ -0,0 +1,50 @@
+"""
+Command to write the package asset bundles.
+"""
+
+# Third-Party Imports.
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Internal Imports.
+from adminlte2_pdq.asset_bundles import ASSET_BUNDLES, BUNDLE_MANIFEST_PATH, write_bundles
+
+
+class Command(BaseCommand):
+    """Command to concatenate and minify the package static files into content-hashed bundles."""
+
+    help = (
+        "Concatenate and minify the AdminLtePdq CSS and JS into one content-hashed bundle each, and write the "
+        "bundle manifest. Set ADMINLTE2_USE_ASSET_BUNDLES for the base templates to load the bundles. "
+        "Run as part of your build, whenever the package is upgraded."
+    )
+
+    def add_arguments(self, parser):
+        """Define arguments to pass into command."""
+
+        parser.add_argument(
+            "--output-dir",
+            default=getattr(settings, "STATIC_ROOT", None),
+            metavar="PATH",
+            help=(
+                "Static files folder to write the bundles to. Defaults to the STATIC_ROOT setting, so run after "
+                "collectstatic. To have collectstatic include the bundles instead, such as to post-process them "
+                "with a hashing storage, give a folder in the STATICFILES_DIRS setting and run before collectstatic."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """Entry point of command logic."""
+
+        output_dir = options["output_dir"]
+        if not output_dir:
+            raise CommandError("No folder to write bundles to. Provide --output-dir, or set STATIC_ROOT.")
+
+        try:
+            manifest = write_bundles(output_dir)
+        except OSError as err:
+            raise CommandError(f"Could not write asset bundles: {err}") from err
+
+        for name, bundle_path in manifest["bundles"].items():
+            self.stdout.write(f"{bundle_path} ({len(ASSET_BUNDLES[name])} files)")
+        self.stdout.write(self.style.SUCCESS(f"Wrote asset bundles and {BUNDLE_MANIFEST_PATH} to {output_dir}."))
@@ -0,0 +1,122 @@
+"""
+Command to write the route policy manifest.
+"""
+
+# System Imports.
+import json
+
+# Third-Party Imports.
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import get_resolver
+
+# Internal Imports.
+from adminlte2_pdq.menu import get_menu_setting, walk_menu_nodes
+from adminlte2_pdq.middleware import get_auth_middleware
+from adminlte2_pdq.policy import Policy
+from adminlte2_pdq.policy_manifest import (
+    MANIFEST_VERSION,
+    MENU_DATA_FIELDS,
+    ROUTE_DATA_FIELDS,
+    get_policy_checksum,
+    get_route_key,
+)
+from adminlte2_pdq.templatetags.sidebar_menu import get_permissions_from_view, get_view_from_node
+from adminlte2_pdq.url_walker import walk_url_patterns
+
+
+def build_manifest():
+    """Build a manifest dict for the current URLconf, menu setting and policy settings.
+
+    View data is calculated by the same AuthMiddleware and sidebar menu logic that is used without a manifest.
+    """
+    middleware = get_auth_middleware()
+
+    routes = {}
+    for prefix, app_name, url in walk_url_patterns(get_resolver().url_patterns, nested_app_names=True):
+        route = prefix + str(url.pattern)
+        view_data = middleware.get_default_view_data("/" + route)
+        middleware.parse_view_data(view_data, url.callback, app_name, url.name)
+        view_data["login_whitelisted_name"] = middleware.is_url_name_in_whitelist(
+            view_data, middleware.policy.login_exempt_whitelist
+        )
+        view_data["permission_whitelisted_name"] = middleware.is_url_name_in_whitelist(
+            view_data, middleware.policy.strict_policy_whitelist
+        )
+
+        # Where routes repeat, the first is what a request resolves to.
+        routes.setdefault(get_route_key(route), [view_data[field] for field in ROUTE_DATA_FIELDS])
+
+    menu = {}
+    for node in walk_menu_nodes(get_menu_setting()):
+        route = node.get("route")
+        if not route or route == "#" or route in menu or node.get("route_args") or node.get("route_kwargs"):
+            continue
+        view = get_view_from_node(node)
+        if view:
+            view_data = get_permissions_from_view(view)
+            menu[route] = [view_data[field] for field in MENU_DATA_FIELDS]
+
+    return {
+        "version": MANIFEST_VERSION,
+        "checksum": get_policy_checksum(),
+        "routes": routes,
+        "menu": menu,
+    }
+
+
+class Command(BaseCommand):
+    """Command to write the view policy data of every route and menu node to a manifest file."""
+
+    help = (
+        "Write the AdminLtePdq route policy manifest, so that the AuthMiddleware and sidebar menu can skip "
+        "introspecting views. Run as part of your build, whenever views, urls or policy settings change."
+    )
+
+    def add_arguments(self, parser):
+        """Define arguments to pass into command."""
+
+        parser.add_argument(
+            "--output",
+            default=Policy.route_policy_manifest,
+            metavar="PATH",
+            help=(
+                "File to write the manifest to. Defaults to the ADMINLTE2_ROUTE_POLICY_MANIFEST setting. "
+                "If neither is set, the manifest is written to stdout."
+            ),
+        )
+        parser.add_argument(
+            "--check",
+            default=False,
+            action="store_true",
+            help="Instead of writing the manifest, check that the existing manifest matches the current URLconf.",
+        )
+
+    def handle(self, *args, **options):
+        """Entry point of command logic."""
+
+        output = options["output"]
+
+        # Handle "check" arg.
+        if options["check"]:
+            if not output:
+                raise CommandError("No manifest to check. Provide --output, or set ADMINLTE2_ROUTE_POLICY_MANIFEST.")
+            try:
+                with open(output, encoding="utf-8") as manifest_file:
+                    manifest = json.load(manifest_file)
+            except (OSError, ValueError) as err:
+                raise CommandError(f"Could not read route policy manifest {output}: {err}") from err
+            if manifest.get("version") != MANIFEST_VERSION or manifest.get("checksum") != get_policy_checksum():
+                raise CommandError(f"Route policy manifest {output} is out of date.")
+            self.stdout.write(self.style.SUCCESS(f"Route policy manifest {output} is up to date."))
+            return
+
+        # Compact separators, as the manifest is only read by the package.
+        manifest_json = json.dumps(build_manifest(), separators=(",", ":"))
+
+        if not output:
+            self.stdout.write(manifest_json)
+            return
+
+        with open(output, "w", encoding="utf-8") as manifest_file:
+            manifest_file.write(manifest_json)
+        self.stdout.write(self.style.SUCCESS(f"Wrote route policy manifest to {output}."))
@@ -0,0 +1,110 @@
+"""
+Command to profile the package components that render a page.
+"""
+
+# System Imports.
+import json
+
+# Third-Party Imports.
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+# Internal Imports.
+from adminlte2_pdq.profiling import profile_page
+
+
+class Command(BaseCommand):
+    """Command to request a page through the test client, and report the time and queries of each package component."""
+
+    help = (
+        "Request a page through the Django test client, and report the time and database queries of each "
+        "AdminLtePdq component that rendered it (AuthMiddleware, menu template tags, admin menu, form tags), "
+        "along with the top functions by cumulative time."
+    )
+
+    def add_arguments(self, parser):
+        """Define arguments to pass into command."""
+
+        parser.add_argument("path", help='Url path of the page to profile, such as "/home/".')
+        parser.add_argument(
+            "--user",
+            metavar="USERNAME",
+            help="Username of the user to request the page as. Defaults to an anonymous user.",
+        )
+        parser.add_argument(
+            "--host",
+            help="Host to request the page from. Defaults to the first ALLOWED_HOSTS entry that isn't a wildcard.",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of functions to report from cProfile, by cumulative time. Use 0 to skip cProfile.",
+        )
+        parser.add_argument(
+            "--cold",
+            default=False,
+            action="store_true",
+            help="Profile the first request, instead of warming package caches with an unprofiled request first.",
+        )
+        parser.add_argument(
+            "--format",
+            default="table",
+            choices=("table", "json"),
+            help='Output format. "table" is human-readable. "json" is for tracking results over time.',
+        )
+
+    def handle(self, *args, **options):
+        """Entry point of command logic."""
+
+        user = None
+        if options["user"]:
+            user_model = get_user_model()
+            try:
+                # Documented way to query any user model, despite the underscore.
+                user = user_model._default_manager.get_by_natural_key(  # pylint:disable=protected-access
+                    options["user"]
+                )
+            except user_model.DoesNotExist as err:
+                raise CommandError(f'User "{options["user"]}" does not exist.') from err
+
+        report = profile_page(
+            options["path"],
+            user=user,
+            host=options["host"],
+            warm=not options["cold"],
+            top=options["top"],
+        )
+
+        if options["format"] == "json":
+            self.stdout.write(json.dumps(report, indent=4))
+            return
+
+        self.write_table(report)
+
+    def write_table(self, report):
+        """Write the profile report in human-readable form."""
+
+        self.stdout.write(
+            f"{report['path']} as {report['user'] or 'anonymous user'}: status {report['status_code']}, "
+            f"{report['time_ms']:.1f} ms, {report['queries']} queries"
+        )
+        self.stdout.write("")
+
+        width = max(len("Component"), *(len(name) for name in report["components"]))
+        self.stdout.write(f"{'Component'.ljust(width)}  {'Calls':>6}  {'Time ms':>9}  {'Cumul ms':>9}  {'Queries':>7}")
+        components = sorted(report["components"].items(), key=lambda item: item[1]["time_ms"], reverse=True)
+        for name, timing in components:
+            self.stdout.write(
+                f"{name.ljust(width)}  {timing['calls']:>6}  {timing['time_ms']:>9.2f}  "
+                f"{timing['cumulative_time_ms']:>9.2f}  {timing['queries']:>7}"
+            )
+
+        if report["profile"]:
+            self.stdout.write("")
+            self.stdout.write(f"{'Calls':>8}  {'Time ms':>9}  {'Cumul ms':>9}  Function")
+            for function in report["profile"]:
+                self.stdout.write(
+                    f"{function['calls']:>8}  {function['time_ms']:>9.2f}  "
+                    f"{function['cumulative_time_ms']:>9.2f}  {function['function']}"
+                )
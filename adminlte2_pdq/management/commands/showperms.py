@@ -5,8 +5,11 @@ Command to list all permissions.
 # Third-Party Imports.
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import Permission
-from django.db.models import F, Value
-from django.db.models.functions import Concat
+from django.db.models import F, Max, Value
+from django.db.models.functions import Concat, Length
+
+# Internal Imports.
+from adminlte2_pdq.management.output import RowWriter, add_format_argument, filters_to_q
 
 
 class Command(BaseCommand):
@@ -21,6 +24,9 @@ class Command(BaseCommand):
         "view_",
     )
 
+    # Number of permissions to fetch from the database at a time.
+    CHUNK_SIZE = 2000
+
     def add_arguments(self, parser):
         """Define arguments to pass into command."""
 
@@ -58,19 +64,32 @@ class Command(BaseCommand):
                 'NOTE: This option uses "starts_with" to omit perms and could hide others that start the same way.'
             ),
         )
+        parser.add_argument(
+            "--filter-app-name",
+            action="append",
+            metavar="PATTERN",
+            help='Only display permissions with an app label matching the pattern, such as "auth*". Can be repeated.',
+        )
+        parser.add_argument(
+            "--filter-model-name",
+            action="append",
+            metavar="PATTERN",
+            help=(
+                'Only display permissions with a content type model matching the pattern, such as "user". '
+                "Can be repeated."
+            ),
+        )
+        parser.add_argument(
+            "--filter-codename",
+            action="append",
+            metavar="PATTERN",
+            help='Only display permissions with a codename matching the pattern, such as "view_*". Can be repeated.',
+        )
+        add_format_argument(parser)
 
     def handle(self, *args, **options):
         """Entry point of command logic."""
 
-        # Structure to hold the maximum length found of each data type, for output formatting.
-        # Default length of 0.
-        max_lengths = {
-            "name_len": 0,
-            "codename_len": 0,
-            "content_type_len": 0,
-            "has_perm_len": 0,
-        }
-
         # Handle permission "name" arg.
         include_names = not options["hide_names"]
 
@@ -86,24 +105,71 @@ class Command(BaseCommand):
         # Handle permission has_perm text.
         include_has_perm_text = not options["hide_has_perm_text"]
 
-        # Get all permission objects.
-        # all_permissions = Permission.objects.all()
-        all_permissions = Permission.objects.order_by(
+        # Handle filter args.
+        app_name_filters = options["filter_app_name"]
+        model_name_filters = options["filter_model_name"]
+        codename_filters = options["filter_codename"]
+
+        # Filter permissions in the database, so that only displayed rows are fetched.
+        permissions = Permission.objects.filter(
+            filters_to_q("content_type__app_label", app_name_filters),
+            filters_to_q("content_type__model", model_name_filters),
+            filters_to_q("codename", codename_filters),
+        )
+
+        # Check to see if we should skip the built-in default perms
+        if not include_default_types:
+            for default_perm in self.DEFAULT_PERMS:
+                permissions = permissions.exclude(codename__startswith=default_perm)
+
+        # Get all permission values.
+        has_perm_label = Concat("content_type__app_label", Value("."), "codename")
+        all_permissions = permissions.order_by(
             "content_type__app_label",
             "codename",
         ).values(
             "name",
             "codename",
             content_type_label=F("content_type__app_label"),
-            has_perm_label=Concat("content_type__app_label", Value("."), "codename"),
+            has_perm_label=has_perm_label,
         )
 
-        # Update calculated max lengths.
-        for perm in all_permissions:
-            max_lengths["name_len"] = max(max_lengths["name_len"], len(perm["name"]))
-            max_lengths["codename_len"] = max(max_lengths["codename_len"], len(perm["codename"]))
-            max_lengths["content_type_len"] = max(max_lengths["content_type_len"], len(perm["content_type_label"]))
-            max_lengths["has_perm_len"] = max(max_lengths["has_perm_len"], len(perm["has_perm_label"]))
+        # Handle machine-readable output formats. These are written as they're fetched, without calculating widths.
+        if options["format"] != "table":
+            fieldnames = []
+            if include_content_types:
+                fieldnames.append("content_type")
+            if include_names:
+                fieldnames.append("name")
+            if include_codenames:
+                fieldnames.append("codename")
+            if include_has_perm_text:
+                fieldnames.append("has_perm")
+
+            writer = RowWriter(self.stdout, options["format"], fieldnames)
+            writer.start()
+            for perm in all_permissions.iterator(chunk_size=self.CHUNK_SIZE):
+                writer.write_row(
+                    {
+                        "content_type": perm["content_type_label"],
+                        "name": perm["name"],
+                        "codename": perm["codename"],
+                        "has_perm": perm["has_perm_label"],
+                    }
+                )
+            writer.finish()
+            return
+
+        # Calculate max lengths in the database, rather than by fetching every row an additional time.
+        max_lengths = {
+            key: value or 0
+            for key, value in permissions.aggregate(
+                name_len=Max(Length("name")),
+                codename_len=Max(Length("codename")),
+                content_type_len=Max(Length("content_type__app_label")),
+                has_perm_len=Max(Length(has_perm_label)),
+            ).items()
+        }
 
         # Calculate separator and header strings.
         header_str, separator_str, max_lengths = self.process_header_str(
@@ -119,12 +185,9 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(header_str))
         self.stdout.write(self.style.SUCCESS(separator_str))
 
+        # Fetch permissions in chunks, to keep memory use flat.
         current_content_type = ""
-        for perm in all_permissions:
-
-            # Check to see if we should skip the built-in default perms
-            if not include_default_types and perm["codename"].startswith(self.DEFAULT_PERMS):
-                continue
+        for perm in all_permissions.iterator(chunk_size=self.CHUNK_SIZE):
 
             # Handle if con tent type changed.
             if current_content_type == "":
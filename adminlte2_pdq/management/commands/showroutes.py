@@ -5,7 +5,15 @@ Command to list all URL routes in project.
 # Third-Party Imports.
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from django.urls.resolvers import URLPattern, URLResolver
+
+# Internal Imports.
+from adminlte2_pdq.management.output import (
+    RowWriter,
+    add_format_argument,
+    add_route_filter_arguments,
+    matches_route_filters,
+)
+from adminlte2_pdq.url_walker import get_route_data, walk_url_patterns
 
 
 class Command(BaseCommand):
@@ -43,13 +51,12 @@ class Command(BaseCommand):
             action="store_true",
             help='Display "default route" args for each route.',
         )
+        add_route_filter_arguments(parser)
+        add_format_argument(parser)
 
     def handle(self, *args, **options):
         """Entry point of command logic."""
 
-        # Array that our url data will populate to. This array is then read in for std output.
-        all_urls = []
-
         # Structure to hold the maximum length found of each data type, for output formatting.
         # Default length of 0.
         max_lengths = {
@@ -75,76 +82,59 @@ class Command(BaseCommand):
         # Handle "default_args" arg.
         include_default_args = options["show_default_args"]
 
+        # Handle filter args.
+        app_name_filters = options["filter_app_name"]
+        url_name_filters = options["filter_url_name"]
+
         # Import project urls.
         # Done this way to force urls to populate fully.
         urlconf = __import__(settings.ROOT_URLCONF, globals={}, locals={}, fromlist=[""])
 
-        app_name = ""
-
-        def parse_url_data(urlpatterns, acc=None):
-            """Process URL route data."""
-
-            nonlocal app_name
-
-            # Populate if array is not yet set.
-            if acc is None:
-                acc = []
-
-            # Return if nothing further to parse.
-            if not urlpatterns:
-                return
-
-            # Get first pattern in set.
-            url = urlpatterns[0]
-
-            # Attempt to determine app name
-            new_app_name = getattr(url, "app_name", None)
-            if new_app_name:
-                app_name = new_app_name
-
-            # Only proceed if dealing with actual url pattern.
-            if isinstance(url, URLPattern):
-                pattern = "".join(acc + [str(url.pattern)])
-
-                if len(pattern) == 0 or pattern[-1] != "/":
-                    pattern += "/"
-
-                # Process url "name" as defined in the Django url definition.
-                name = str(url.name).strip()
-                if name in {"", "None"}:
-                    name = "None"
-                elif app_name:
-                    name = app_name + ":" + name
-
-                # Add parsed values to processed url list.
-                all_urls.append(
-                    {
-                        "app_name": app_name,
-                        "pattern": pattern,
-                        "name": name,
-                        "lookup_str": url.lookup_str,
-                        "default_args": str(url.default_args),
-                    }
-                )
-
-                # Update calculated max lengths.
-                if include_app_names:
-                    max_lengths["app_name_len"] = max(max_lengths["app_name_len"], len(app_name))
-                max_lengths["pattern_len"] = max(max_lengths["pattern_len"], len(pattern))
-                if include_url_names:
-                    max_lengths["name_len"] = max(max_lengths["name_len"], len(name))
-                if include_lookup_str:
-                    max_lengths["lookup_str_len"] = max(max_lengths["lookup_str_len"], len(str(url.lookup_str)))
-                if include_default_args:
-                    max_lengths["default_args_len"] = max(max_lengths["default_args_len"], len(str(url.default_args)))
-            elif isinstance(url, URLResolver):
-                parse_url_data(url.url_patterns, acc + [str(url.pattern)])
-
-            # Call function again, minus url at start of set.
-            parse_url_data(urlpatterns[1:], acc)
-
-        # Call function to parse project url data.
-        parse_url_data(urlconf.urlpatterns)
+        def get_url_data():
+            """Generator of processed URL route data, in display order."""
+            for prefix, app_name, url in walk_url_patterns(urlconf.urlpatterns):
+
+                # Handle if user does not want to see the admin routes
+                if hide_admin_routes and app_name == "admin":
+                    continue
+
+                # Handle filters.
+                if not matches_route_filters(app_name, url.name, app_name_filters, url_name_filters):
+                    continue
+
+                yield get_route_data(prefix, app_name, url)
+
+        # Handle machine-readable output formats. These are written as they're processed, without a width pass.
+        if options["format"] != "table":
+            fieldnames = []
+            if include_app_names:
+                fieldnames.append("app_name")
+            fieldnames.append("pattern")
+            if include_url_names:
+                fieldnames.append("name")
+            if include_lookup_str:
+                fieldnames.append("lookup_str")
+            if include_default_args:
+                fieldnames.append("default_args")
+
+            writer = RowWriter(self.stdout, options["format"], fieldnames)
+            writer.start()
+            for url_dict in get_url_data():
+                writer.write_row(url_dict)
+            writer.finish()
+            return
+
+        # First pass over the project urls, to calculate max lengths.
+        for url_dict in get_url_data():
+            if include_app_names:
+                max_lengths["app_name_len"] = max(max_lengths["app_name_len"], len(url_dict["app_name"]))
+            max_lengths["pattern_len"] = max(max_lengths["pattern_len"], len(url_dict["pattern"]))
+            if include_url_names:
+                max_lengths["name_len"] = max(max_lengths["name_len"], len(url_dict["name"]))
+            if include_lookup_str:
+                max_lengths["lookup_str_len"] = max(max_lengths["lookup_str_len"], len(url_dict["lookup_str"]))
+            if include_default_args:
+                max_lengths["default_args_len"] = max(max_lengths["default_args_len"], len(url_dict["default_args"]))
 
         # Calculate separator and header strings.
         header_str, separator_str, max_lengths = self.process_header_str(
@@ -160,13 +150,20 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(header_str))
         self.stdout.write(self.style.SUCCESS(separator_str))
 
-        # Display parsed url data.
-        current_app_name = ""
-        for url_dict in all_urls:
+        line = ""
+        if include_app_names:
+            line += "| {app_name:{app_name_len}} "
+        line += "| {pattern:{pattern_len}} |"
+        if include_url_names:
+            line += " {name:{name_len}} |"
+        if include_lookup_str:
+            line = line + " {lookup_str:{lookup_str_len}} |"
+        if include_default_args:
+            line = line + " {default_args:{default_args_len}} |"
 
-            # Handle if user does not want to see the admin routes
-            if hide_admin_routes and url_dict["app_name"] == "admin":
-                continue
+        # Second pass over the project urls, to display parsed url data as it's processed.
+        current_app_name = ""
+        for url_dict in get_url_data():
 
             # Handle if app name changed.
             if current_app_name == "":
@@ -175,17 +172,6 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING(separator_str))
                 current_app_name = url_dict["app_name"]
 
-            line = ""
-            if include_app_names:
-                line += "| {app_name:{app_name_len}} "
-            line += "| {pattern:{pattern_len}} |"
-            if include_url_names:
-                line += " {name:{name_len}} |"
-            if include_lookup_str:
-                line = line + " {lookup_str:{lookup_str_len}} |"
-            if include_default_args:
-                line = line + " {default_args:{default_args_len}} |"
-
             # Print parsed output values to console.
             self.stdout.write(line.format(**url_dict, **max_lengths))
 
@@ -4,20 +4,69 @@ Command to list all URL routes in project.
 
 # System Imports.
 import ast
+import importlib
 import inspect
+from functools import lru_cache
 
 # Third-Party Imports.
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from django.urls.resolvers import URLPattern, URLResolver
 
 # Internal Imports.
-from adminlte2_pdq.mixins import (
-    AllowAnonymousAccessMixin,
-    LoginRequiredMixin,
-    AllowWithoutPermissionsMixin,
-    PermissionRequiredMixin,
+from adminlte2_pdq.management.output import (
+    RowWriter,
+    add_format_argument,
+    add_route_filter_arguments,
+    matches_route_filters,
 )
+from adminlte2_pdq.registry import VIEW_POLICY_REGISTRY
+from adminlte2_pdq.url_walker import get_route_data, walk_url_patterns
+
+
+# Package decorator/mixin names, in order of display.
+DECORATOR_TYPES = (
+    "allow_anonymous_access",
+    "login_required",
+    "allow_without_permissions",
+    "permission_required_one",
+    "permission_required",
+)
+
+
+def _get_decorator_name(node):
+    """Get the name of a decorator node, such as "login_required" for "@decorators.login_required()"."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ""
+
+
+@lru_cache(maxsize=None)
+def get_module_decorators(module_name):
+    """Parses the decorator names of all functions within a module.
+
+    Each module is only parsed once, regardless of how many views it has.
+    Original logic (for parsing decorators) from:
+    https://stackoverflow.com/a/31197273
+
+    :param module_name: Name of module to parse.
+    :return: Dict of function name to list of decorator names.
+    """
+    try:
+        source = inspect.getsource(importlib.import_module(module_name))
+    except (ImportError, OSError, TypeError):
+        # Module source is not available, such as for compiled modules.
+        return {}
+
+    decorators = {}
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            decorators[node.name] = [_get_decorator_name(decorator) for decorator in node.decorator_list]
+
+    return decorators
 
 
 class Command(BaseCommand):
@@ -52,6 +101,8 @@ class Command(BaseCommand):
             action="store_true",
             help='Display "default route" args for each route.',
         )
+        add_route_filter_arguments(parser)
+        add_format_argument(parser)
 
     def handle(self, *args, **options):
         """Entry point of command logic."""
@@ -87,180 +138,88 @@ class Command(BaseCommand):
         # Handle "default_args" arg.
         include_default_args = options["show_default_args"]
 
+        # Handle filter args.
+        app_name_filters = options["filter_app_name"]
+        url_name_filters = options["filter_url_name"]
+
+        # Handle machine-readable output formats. These are written as they're processed, instead of grouped.
+        writer = None
+        if options["format"] != "table":
+            fieldnames = ["decorator_type"]
+            if include_app_names:
+                fieldnames.append("app_name")
+            fieldnames.append("pattern")
+            if include_url_names:
+                fieldnames.append("name")
+            if include_lookup_str:
+                fieldnames.append("lookup_str")
+            if include_default_args:
+                fieldnames.append("default_args")
+
+            writer = RowWriter(self.stdout, options["format"], fieldnames)
+            writer.start()
+
         # Import project urls.
         # Done this way to force urls to populate fully.
         urlconf = __import__(settings.ROOT_URLCONF, {}, {}, [""])
 
-        decorated_views = {
-            "allow_anonymous_access": [],
-            "login_required": [],
-            "allow_without_permissions": [],
-            "permission_required_one": [],
-            "permission_required": [],
-        }
+        # Check for use of package decorators and mixins across registered project views.
+        for prefix, app_name, url in walk_url_patterns(urlconf.urlpatterns):
 
-        app_name = ""
-
-        def process_decorators_mixins(urlpatterns, decorated_views, acc=None):
-            """Checks for use of package decorators and mixins across registered project views."""
-
-            nonlocal app_name
-
-            # Populate if array is not yet set.
-            if acc is None:
-                acc = []
-
-            # Return if nothing further to parse.
-            if not urlpatterns:
-                return
-
-            # Get first pattern in set.
-            url = urlpatterns[0]
-
-            # Attempt to determine app name.
-            new_app_name = getattr(url, "app_name", None)
-            if new_app_name:
-                app_name = new_app_name
-            url.app_name = app_name
-
-            # Only proceed if dealing with actual url pattern.
-            if isinstance(url, URLPattern):
-
-                # Try-catch to attempt to find views with decorators/mixins from this package.
-                try:
-                    # Parse the url data to import project views and then parse data about them.
-                    # This seems to be the required minimum in order to check for decorators/mixins.
-                    import_str = url.lookup_str
-                    import_str = import_str.split(".")
-                    view_name = import_str[-1]
-                    import_str = ".".join(import_str[:-1])
-                    module_data = __import__(import_str, globals={}, locals={}, fromlist=[""])
-                    view_data = getattr(module_data, view_name, None)
-                    is_handled = False
-
-                    # Handle if class is in project "ADMINLTE2_LOGIN_EXEMPT_WHITELIST" setting.
-                    if hasattr(settings, "ADMINLTE2_LOGIN_EXEMPT_WHITELIST") and (
-                        url.name in settings.ADMINLTE2_LOGIN_EXEMPT_WHITELIST
-                        or f"{url.app_name}:{url.name}" in settings.ADMINLTE2_STRICT_POLICY_WHITELIST
-                    ):
-                        decorated_views["login_required"].append(url)
-
-                    # Handle if class is in project "ADMINLTE2_STRICT_POLICY_WHITELIST" setting.
-                    if hasattr(settings, "ADMINLTE2_STRICT_POLICY_WHITELIST") and (
-                        url.name in settings.ADMINLTE2_STRICT_POLICY_WHITELIST
-                        or f"{url.app_name}:{url.name}" in settings.ADMINLTE2_STRICT_POLICY_WHITELIST
-                    ):
-                        decorated_views["allow_without_permissions"].append(url)
-
-                    # Handle if is class has package mixins.
-                    if view_name in AllowAnonymousAccessMixin.subclasses:
-                        decorated_views["allow_anonymous_access"].append(url)
-                        is_handled = True
-                    elif view_name in LoginRequiredMixin.subclasses:
-                        decorated_views["login_required"].append(url)
-                        is_handled = True
-                    elif view_name in AllowWithoutPermissionsMixin.subclasses:
-                        decorated_views["allow_without_permissions"].append(url)
-                        is_handled = True
-                    elif view_name in PermissionRequiredMixin.subclasses:
-                        decorated_views["permission_required"].append(url)
-                        is_handled = True
-
-                    # Otherwise might be a method decorator.
-                    if not is_handled:
-                        # Attempt to parse decorator data out of view.
-                        parsed_decorators = self.get_decorators(view_data)[view_name]
-
-                        # Check if parsed data matches package decorators.
-                        if "allow_anonymous_access" in parsed_decorators:
-                            decorated_views["allow_anonymous_access"].append(url)
-                        elif "login_required" in parsed_decorators:
-                            decorated_views["login_required"].append(url)
-                        elif "allow_without_permissions" in parsed_decorators:
-                            decorated_views["allow_without_permissions"].append(url)
-                        elif "permission_required_one" in parsed_decorators:
-                            decorated_views["permission_required_one"].append(url)
-                        elif "permission_required" in parsed_decorators:
-                            decorated_views["permission_required"].append(url)
-
-                except (ModuleNotFoundError, KeyError):
-                    # If we ran into one of these errors, either was a built-in Django view that won't have
-                    # this package's custom decorators/mixins, or it's a view that didn't have an association
-                    # with this package's custom decorators/mixins.
-                    # In either case, should be good to ignore exception.
-                    pass
-
-            elif isinstance(url, URLResolver):
-                process_decorators_mixins(url.url_patterns, decorated_views, acc + [str(url.pattern)])
-
-            # Call function again, minus url at start of set.
-            process_decorators_mixins(urlpatterns[1:], decorated_views, acc)
-
-        # Call function to parse project views for decorators/mixins.
-        process_decorators_mixins(urlconf.urlpatterns, decorated_views)
-
-        def parse_url_data(urlpatterns, decorator_type=None, acc=None):
-            """Process URL route data."""
-
-            # Populate if array is not yet set.
-            if acc is None:
-                acc = []
-
-            # Return if nothing further to parse.
-            if not urlpatterns:
-                return
-
-            # Get first pattern in set.
-            url = urlpatterns[0]
-
-            # Only proceed if dealing with actual url pattern.
-            if isinstance(url, URLPattern):
-
-                pattern = "".join(acc + [str(url.pattern)])
-
-                if len(pattern) == 0 or pattern[-1] != "/":
-                    pattern += "/"
-
-                # Process url "name" as defined in the Django url definition.
-                name = str(url.name).strip()
-                if name in {"", "None"}:
-                    name = "None"
-                elif url.app_name:
-                    name = url.app_name + ":" + name
-
-                # Add parsed values to processed url list.
-                all_urls[decorator_type].append(
-                    {
-                        "app_name": url.app_name,
-                        "pattern": pattern,
-                        "name": name,
-                        "lookup_str": url.lookup_str,
-                        "default_args": str(url.default_args),
-                    }
-                )
-
-                # Update calculated max lengths.
-                if include_app_names:
-                    max_lengths["app_name_len"] = max(max_lengths["app_name_len"], len(url.app_name))
-                max_lengths["pattern_len"] = max(max_lengths["pattern_len"], len(pattern))
-                if include_url_names:
-                    max_lengths["name_len"] = max(max_lengths["name_len"], len(name))
-                if include_lookup_str:
-                    max_lengths["lookup_str_len"] = max(max_lengths["lookup_str_len"], len(str(url.lookup_str)))
-                if include_default_args:
-                    max_lengths["default_args_len"] = max(max_lengths["default_args_len"], len(str(url.default_args)))
-            elif isinstance(url, URLResolver):
-                parse_url_data(url.url_patterns, decorator_type, acc + [str(url.pattern)])
-
-            # Call function again, minus url at start of set.
-            parse_url_data(urlpatterns[1:], decorator_type, acc)
-
-        # Call function to parse project url data.
-        parse_url_data(decorated_views["allow_anonymous_access"], "allow_anonymous_access")
-        parse_url_data(decorated_views["login_required"], "login_required")
-        parse_url_data(decorated_views["allow_without_permissions"], "allow_without_permissions")
-        parse_url_data(decorated_views["permission_required_one"], "permission_required_one")
-        parse_url_data(decorated_views["permission_required"], "permission_required")
+            # Handle filters.
+            if not matches_route_filters(app_name, url.name, app_name_filters, url_name_filters):
+                continue
+
+            decorator_types = []
+
+            # Handle if class is in project "ADMINLTE2_LOGIN_EXEMPT_WHITELIST" setting.
+            if hasattr(settings, "ADMINLTE2_LOGIN_EXEMPT_WHITELIST") and (
+                url.name in settings.ADMINLTE2_LOGIN_EXEMPT_WHITELIST
+                or f"{app_name}:{url.name}" in settings.ADMINLTE2_LOGIN_EXEMPT_WHITELIST
+            ):
+                decorator_types.append("login_required")
+
+            # Handle if class is in project "ADMINLTE2_STRICT_POLICY_WHITELIST" setting.
+            if hasattr(settings, "ADMINLTE2_STRICT_POLICY_WHITELIST") and (
+                url.name in settings.ADMINLTE2_STRICT_POLICY_WHITELIST
+                or f"{app_name}:{url.name}" in settings.ADMINLTE2_STRICT_POLICY_WHITELIST
+            ):
+                decorator_types.append("allow_without_permissions")
+
+            # Handle if view has package decorators/mixins.
+            decorator_type = self.get_decorator_type(url)
+            if decorator_type:
+                decorator_types.append(decorator_type)
+
+            # Skip views that don't use package decorators/mixins.
+            if not decorator_types:
+                continue
+
+            # Process url data once, regardless of how many decorator types the view is listed under.
+            url_dict = get_route_data(prefix, app_name, url)
+
+            if writer:
+                for decorator_type in decorator_types:
+                    writer.write_row({"decorator_type": decorator_type, **url_dict})
+                continue
+
+            for decorator_type in decorator_types:
+                all_urls[decorator_type].append(url_dict)
+
+            # Update calculated max lengths.
+            if include_app_names:
+                max_lengths["app_name_len"] = max(max_lengths["app_name_len"], len(url_dict["app_name"]))
+            max_lengths["pattern_len"] = max(max_lengths["pattern_len"], len(url_dict["pattern"]))
+            if include_url_names:
+                max_lengths["name_len"] = max(max_lengths["name_len"], len(url_dict["name"]))
+            if include_lookup_str:
+                max_lengths["lookup_str_len"] = max(max_lengths["lookup_str_len"], len(url_dict["lookup_str"]))
+            if include_default_args:
+                max_lengths["default_args_len"] = max(max_lengths["default_args_len"], len(url_dict["default_args"]))
+
+        if writer:
+            writer.finish()
+            return
 
         # Calculate separator and header strings.
         header_str, separator_str, max_lengths = self.process_header_str(
@@ -284,6 +243,17 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(header_str))
         self.stdout.write(self.style.SUCCESS(separator_str))
 
+        line = ""
+        if include_app_names:
+            line += "| {app_name:{app_name_len}} "
+        line += "| {pattern:{pattern_len}} |"
+        if include_url_names:
+            line += " {name:{name_len}} |"
+        if include_lookup_str:
+            line = line + " {lookup_str:{lookup_str_len}} |"
+        if include_default_args:
+            line = line + " {default_args:{default_args_len}} |"
+
         # Display parsed url data.
         for decorator_type in [
             ("allow_anonymous_access", "Allow Anonymous Access"),
@@ -312,55 +282,47 @@ class Command(BaseCommand):
             # Process output for this subset of urls.
             for url_dict in url_set:
 
-                line = ""
-                if include_app_names:
-                    line += "| {app_name:{app_name_len}} "
-                line += "| {pattern:{pattern_len}} |"
-                if include_url_names:
-                    line += " {name:{name_len}} |"
-                if include_lookup_str:
-                    line = line + " {lookup_str:{lookup_str_len}} |"
-                if include_default_args:
-                    line = line + " {default_args:{default_args_len}} |"
-
                 # Print parsed output values to console.
                 self.stdout.write(line.format(**url_dict, **max_lengths))
 
         # Display footer separators.
         self.stdout.write(self.style.SUCCESS(separator_str))
 
-    def get_decorators(self, value):
-        """Parses the decorators/mixins associated with provided view.
+    def get_decorator_type(self, url):
+        """Determines which package decorator/mixin is used by the view of the provided url pattern.
 
-        Original logic (for parsing decorators) from:
-        https://stackoverflow.com/a/31197273
+        Views are classified by the admin_pdq_data that the package decorators/mixins attach to them.
+        Only function views without that data fall back to parsing the decorators out of their module source.
+
+        :param url: URLPattern to check the view of.
+        :return: Name of the package decorator/mixin used, or an empty string if none are found.
         """
-        if inspect.isclass(value):
-            # Is class view, so it won't have the decorator's we're searching for.
-            # Return empty dict.
-            return {}
-
-        target = value
-        decorators = {}
-
-        def visit_function_def(node):
-            decorators[node.name] = []
-            for n in node.decorator_list:
-                name = ""
-                if isinstance(n, ast.Call):
-                    name = n.func.attr if isinstance(n.func, ast.Attribute) else n.func.id
-                else:
-                    name = n.attr if isinstance(n, ast.Attribute) else n.id
-
-                decorators[node.name].append(name)
-
-        # Function view. May have package decorators. Continue.
-        node_iter = ast.NodeVisitor()
-        node_iter.visit_function_def = visit_function_def
-        node_iter.visit(ast.parse(inspect.getsource(target)))
-
-        # Return dict of parsed decorators from view.
-        return decorators
+        view_class = getattr(url.callback, "view_class", None)
+        if view_class is not None:
+            # Class-based view. Mixins register the class on definition.
+            view = view_class
+            policy_record = VIEW_POLICY_REGISTRY.get(view_class) or {}
+            decorator_name = policy_record.get("decorator_name", "")
+        else:
+            # Function-based view. Decorators save their data to the view function, which may be wrapped further.
+            try:
+                view = inspect.unwrap(url.callback, stop=lambda function: hasattr(function, "admin_pdq_data"))
+            except ValueError:
+                # Cycle in the chain of wrapped functions.
+                view = url.callback
+            decorator_name = getattr(view, "admin_pdq_data", {}).get("decorator_name", "")
+
+            if not decorator_name:
+                # May be wrapped by something that didn't keep the decorator data. Check the view source instead.
+                view_name = url.lookup_str.split(".")[-1]
+                parsed_decorators = get_module_decorators(url.callback.__module__).get(view_name, ())
+                return next((name for name in DECORATOR_TYPES if name in parsed_decorators), "")
+
+        # Both permission decorators/mixins save the same decorator name. Distinguish by the permissions set.
+        if decorator_name == "permission_required" and getattr(view, "permission_required_one", None):
+            decorator_name = "permission_required_one"
+
+        return decorator_name if decorator_name in DECORATOR_TYPES else ""
 
     def process_header_str(
         self,
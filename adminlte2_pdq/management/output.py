@@ -0,0 +1,197 @@
+"""
+Shared output logic for the package management commands.
+"""
+
+# System Imports.
+import csv
+import json
+import re
+from fnmatch import fnmatchcase
+
+# Third-Party Imports.
+from django.db.models import Q
+
+
+# Output formats supported by the package commands. "table" is the default human-readable output.
+OUTPUT_FORMATS = ("table", "json", "jsonl", "csv")
+
+
+def add_format_argument(parser):
+    """Add the "--format" argument to a command parser."""
+
+    parser.add_argument(
+        "--format",
+        default="table",
+        choices=OUTPUT_FORMATS,
+        help=(
+            'Output format. "table" is human-readable. Other formats are machine-readable, '
+            "and are written row by row as each row is processed."
+        ),
+    )
+
+
+def add_route_filter_arguments(parser):
+    """Add the "--filter-app-name" and "--filter-url-name" arguments to a command parser."""
+
+    parser.add_argument(
+        "--filter-app-name",
+        action="append",
+        metavar="PATTERN",
+        help='Only display routes with an app name matching the pattern, such as "admin*". Can be repeated.',
+    )
+    parser.add_argument(
+        "--filter-url-name",
+        action="append",
+        metavar="PATTERN",
+        help=(
+            'Only display routes with a url name (with or without app name) matching the pattern, such as "*home". '
+            "Can be repeated."
+        ),
+    )
+
+
+def matches_filters(value, patterns):
+    """Determine if a value matches any of the provided shell-style wildcard patterns.
+
+    :param value: String value to check, such as an app name.
+    :param patterns: List of patterns, such as "admin*". If empty or None, all values match.
+    :return: True if value matches, otherwise False.
+    """
+    if not patterns:
+        return True
+    return any(fnmatchcase(value, pattern) for pattern in patterns)
+
+
+def _pattern_to_q(field_name, pattern):
+    """Convert a single wildcard pattern into a queryset filter.
+
+    Always a regex lookup, as it is case-sensitive on every database, the same as fnmatchcase().
+    Contains, startswith and exact lookups are case-insensitive on some databases, such as SQLite and MySQL.
+    """
+    if pattern and not pattern.strip("*"):
+        # Matches everything.
+        return Q()
+
+    # Translate to an anchored regex, handling character classes the same as fnmatch.
+    regex = ""
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        index += 1
+        if char == "*":
+            regex += ".*"
+        elif char == "?":
+            regex += "."
+        elif char == "[":
+            end = index
+            if end < len(pattern) and pattern[end] == "!":
+                end += 1
+            # A "]" directly after the opening bracket is part of the class.
+            if end < len(pattern) and pattern[end] == "]":
+                end += 1
+            while end < len(pattern) and pattern[end] != "]":
+                end += 1
+            if end >= len(pattern):
+                # Unclosed, so a literal bracket.
+                regex += re.escape(char)
+                continue
+
+            char_class = pattern[index:end]
+            index = end + 1
+            negate = char_class.startswith("!")
+            if negate:
+                char_class = char_class[1:]
+            # Escape characters with a meaning within regex classes. Ranges ("-") are kept.
+            char_class = "".join(
+                f"\\{class_char}" if class_char in "\\^[]&~|" else class_char for class_char in char_class
+            )
+            regex += f"[{'^' if negate else ''}{char_class}]"
+        else:
+            regex += re.escape(char)
+    return Q(**{f"{field_name}__regex": f"^{regex}$"})
+
+
+def filters_to_q(field_name, patterns):
+    """Convert shell-style wildcard patterns into a queryset filter, matching the same values as matches_filters().
+
+    Matching is case-sensitive, on every database.
+
+    :param field_name: Name of model field to filter on, such as "codename".
+    :param patterns: List of patterns, such as "view_*". If empty or None, all values match.
+    :return: Q object matching any of the patterns.
+    """
+    q_filter = Q()
+    for pattern in patterns or ():
+        pattern_q = _pattern_to_q(field_name, pattern)
+        if not pattern_q:
+            # Pattern matches everything.
+            return Q()
+        q_filter |= pattern_q
+    return q_filter
+
+
+def matches_route_filters(app_name, url_name, app_name_filters, url_name_filters):
+    """Determine if a route matches the "--filter-app-name" and "--filter-url-name" argument values.
+
+    :param app_name: App name of route.
+    :param url_name: Url name of route, without app name.
+    :param app_name_filters: List of app name patterns.
+    :param url_name_filters: List of url name patterns, checked against the url name with and without app name.
+    :return: True if route matches, otherwise False.
+    """
+    if not matches_filters(app_name, app_name_filters):
+        return False
+    if not url_name_filters:
+        return True
+
+    url_names = [str(url_name)]
+    if app_name:
+        url_names.append(f"{app_name}:{url_name}")
+    return any(matches_filters(name, url_name_filters) for name in url_names)
+
+
+class RowWriter:
+    """Writes rows to command output in one of the machine-readable formats, as each row is provided.
+
+    :param stdout: Command output to write to.
+    :param output_format: One of "json", "jsonl" or "csv".
+    :param fieldnames: Row keys to output, in output order.
+    """
+
+    def __init__(self, stdout, output_format, fieldnames):
+        self.stdout = stdout
+        self.output_format = output_format
+        self.fieldnames = fieldnames
+        self.row_count = 0
+
+        if output_format == "csv":
+            self.csv_writer = csv.DictWriter(self, fieldnames, extrasaction="ignore", lineterminator="\n")
+
+    def write(self, value):
+        """Write raw value to command output. Allows the csv writer to write directly to command output."""
+        self.stdout.write(value, ending="")
+
+    def start(self):
+        """Write any output that comes before the first row."""
+        if self.output_format == "json":
+            self.write("[")
+        elif self.output_format == "csv":
+            self.csv_writer.writeheader()
+
+    def write_row(self, row):
+        """Write a single row dict."""
+        if self.output_format == "csv":
+            self.csv_writer.writerow(row)
+        else:
+            row = {key: row[key] for key in self.fieldnames}
+            if self.output_format == "json":
+                self.write(("\n  " if self.row_count == 0 else ",\n  ") + json.dumps(row))
+            else:
+                self.write(json.dumps(row) + "\n")
+
+        self.row_count += 1
+
+    def finish(self):
+        """Write any output that comes after the last row."""
+        if self.output_format == "json":
+            self.write("\n]\n" if self.row_count else "]\n")
@@ -3,6 +3,9 @@
 # Third-Party Imports.
 from django.conf import settings
 
+# Internal Imports.
+from .ui_settings import UISettings
+
 
 # Default Menu
 # NOTE: If this default menu is updated to include new routes,
@@ -61,3 +64,26 @@ MENU = [
         ],
     },
 ]
+
+
+def get_menu_setting():
+    """Get the ADMINLTE2_MENU setting. Or if not set, the default menu, if the default routes are registered."""
+    if hasattr(settings, "ADMINLTE2_MENU"):
+        return settings.ADMINLTE2_MENU
+    if UISettings.get().default_routes_are_registered:
+        return MENU
+    return []
+
+
+def walk_menu_nodes(menu):
+    """Yield every node within the sections of a menu, including tree nodes and the nodes within them."""
+    stack = [iter(section.get("nodes") or ()) for section in reversed(menu)]
+    while stack:
+        for node in stack[-1]:
+            yield node
+            child_nodes = node.get("nodes")
+            if child_nodes:
+                stack.append(iter(child_nodes))
+                break
+        else:
+            stack.pop()
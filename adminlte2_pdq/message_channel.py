@@ -0,0 +1,154 @@
+"""Django AdminLte2Pdq deduplicating message channel.
+
+Writes messages through to the Django messages framework, but stores each distinct message only once.
+Repeats of a pending message increment a count for that message instead. Counts are kept separate from
+the messages, under their own session key, so that they are stored along with the pending messages
+without changing how the messages themselves are stored or rendered.
+The number of distinct pending messages is also bounded, so that cookie and session storage cannot grow
+without limit when messages are added faster than pages are rendered.
+
+Counts only apply while their message is pending. Once the message storage is iterated, by any template or
+view, its messages are displayed, and their counts are dropped.
+"""
+
+# System Imports.
+import logging
+
+# Third-Party Imports.
+from django.contrib import messages
+from django.contrib.messages.storage.base import BaseStorage, Message
+
+# Internal Imports.
+from .constants import MESSAGE_CHANNEL_CAPACITY
+
+
+logger = logging.getLogger(__name__)
+
+
+# Session key that holds the counts of repeated pending messages, until the messages are displayed.
+COUNTS_SESSION_KEY = "adminlte2_pdq_message_counts"
+
+
+def get_message_counts(storage):
+    """Get the counts of pending messages added through the channel, for a message storage.
+
+    Counts are kept on the storage for the current request, and loaded from the session (if any) on first use.
+    Counts of messages that are no longer pending are dropped.
+
+    :param storage: Message storage of a request.
+    :return: Dict of (level, message text) to the number of times that the message was added.
+    """
+    counts = getattr(storage, "adminlte2_message_counts", None)
+    if counts is None:
+        counts = _load_message_counts(storage)
+        storage.adminlte2_message_counts = counts
+        storage.adminlte2_message_counts_used = storage.used
+    elif storage.used and not storage.adminlte2_message_counts_used:
+        # The storage was iterated since the counts were loaded, which displayed every pending message.
+        storage.adminlte2_message_counts_used = True
+        if counts:
+            counts.clear()
+            _save_message_counts(storage, counts)
+    return counts
+
+
+def _load_message_counts(storage):
+    """Load the counts of repeated messages from the session, keeping only those of still pending messages.
+
+    Messages may have been displayed without grouping them, such as by a plain loop over the messages,
+    in which case their counts were left in the session.
+    """
+    session = getattr(storage.request, "session", None)
+    stored_counts = session.get(COUNTS_SESSION_KEY, []) if session is not None else []
+    if not stored_counts:
+        return {}
+
+    counts = {}
+    if not storage.used:
+        counts = {(level, text): count for level, text, count in stored_counts if Message(level, text) in storage}
+    if len(counts) != len(stored_counts):
+        _save_message_counts(storage, counts)
+    return counts
+
+
+def _save_message_counts(storage, counts):
+    """Save the counts of repeated messages to the session, so they are kept along with the pending messages."""
+    session = getattr(storage.request, "session", None)
+    if session is None:
+        return
+
+    stored_counts = [[level, text, count] for (level, text), count in counts.items() if count > 1]
+    if stored_counts:
+        session[COUNTS_SESSION_KEY] = stored_counts
+    elif COUNTS_SESSION_KEY in session:
+        del session[COUNTS_SESSION_KEY]
+
+
+def add_message(request, level, message):
+    """Add a message for the request, unless an identical message is already pending.
+
+    Identical pending messages have their count incremented instead.
+    Distinct messages past the ADMINLTE2_MESSAGE_CHANNEL_CAPACITY setting are logged and dropped.
+    """
+    storage = getattr(request, "_messages", None)
+    if not isinstance(storage, BaseStorage):
+        # Not a known message storage. Let Django handle it (or raise the usual error if it's missing).
+        messages.add_message(request, level, message)
+        return
+
+    # Same level check as the message storage itself.
+    if level < storage.level:
+        return
+
+    message_text = str(message)
+    key = (level, message_text)
+    counts = get_message_counts(storage)
+    # Once the storage is used, its previously stored messages were displayed, so are no longer pending.
+    # Only messages added through the channel since then are, which are the ones with counts.
+    if key in counts or (not storage.used and Message(level, message_text) in storage):
+        counts[key] = counts.get(key, 1) + 1
+        _save_message_counts(storage, counts)
+        return
+
+    pending_count = len(counts) if storage.used else len(storage)
+    if pending_count >= MESSAGE_CHANNEL_CAPACITY:
+        logger.debug("Message storage is at capacity. Dropping message: %s", message_text)
+        return
+
+    storage.add(level, message)
+    counts[key] = 1
+
+
+def warning(request, message):
+    """Add a message with the WARNING level."""
+    add_message(request, messages.WARNING, message)
+
+
+def group_messages(message_list):
+    """Group messages with the same level and text.
+
+    Grouping a message storage displays its messages, so their pending counts are moved onto the
+    displayed messages themselves, and are no longer kept in the session.
+
+    :param message_list: Iterable of messages, such as the message storage for a request.
+    :return: List of (message, count) pairs, in the order that each message was first seen.
+    """
+    counts = {}
+    if isinstance(message_list, BaseStorage):
+        counts = get_message_counts(message_list)
+        message_list.adminlte2_message_counts = {}
+        message_list.adminlte2_message_counts_used = True
+        _save_message_counts(message_list, {})
+
+    groups = {}
+    for message in message_list:
+        key = (message.level, str(message))
+        if not hasattr(message, "adminlte2_count"):
+            # Repeats that were merged into the first stored message.
+            message.adminlte2_count = counts.pop(key, 1)
+
+        if key in groups:
+            groups[key][1] += message.adminlte2_count
+        else:
+            groups[key] = [message, message.adminlte2_count]
+    return [tuple(group) for group in groups.values()]
@@ -7,35 +7,19 @@ import warnings
 # Third-Party Imports.
 from django.http import Http404
 from django.conf import settings
-from django.contrib import messages
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
 from django.shortcuts import redirect
 from django.urls import resolve, is_valid_path
 from django.utils.http import escape_leading_slashes
+from django.utils.module_loading import import_string
 from django.views.generic.base import RedirectView
 
 # Internal Imports.
-from .constants import (
-    REDIRECT_TO_HOME_ON_403,
-    REDIRECT_TO_HOME_ON_404,
-    LOGIN_REQUIRED,
-    LOGIN_EXEMPT_WHITELIST,
-    LOGIN_EXEMPT_FUZZY_WHITELIST,
-    RESPONSE_403_DEBUG_MESSAGE,
-    RESPONSE_403_PRODUCTION_MESSAGE,
-    RESPONSE_404_DEBUG_MESSAGE,
-    RESPONSE_404_PRODUCTION_MESSAGE,
-    STRICT_POLICY_SERVE_403_FUZZY_WHITELIST,
-    STRICT_POLICY_SERVE_404_FUZZY_WHITELIST,
-    STRICT_POLICY,
-    STRICT_POLICY_WHITELIST,
-    STRICT_POLICY_FUZZY_WHITELIST,
-    LOGIN_URL,
-    HOME_ROUTE,
-    MEDIA_ROUTE,
-    STATIC_ROUTE,
-    WEBSOCKET_ROUTE,
-)
+from . import message_channel
+from .access_decisions import passes_permission_checks
+from .policy import Policy
+from .policy_manifest import PolicyManifest
+from .registry import VIEW_POLICY_REGISTRY
 
 
 logger = logging.getLogger(__name__)
@@ -66,6 +50,8 @@ class AuthMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        # Bound once, as it is read throughout every request. Rebuilt in place when settings change.
+        self.policy = Policy
 
     def __call__(self, request):
         return self.run_auth_checks(request)
@@ -106,36 +92,38 @@ class AuthMiddleware:
                 # Is a special route where 404s are okay
                 self.is_special_route(view_data)
                 # Verify if whitelisted route
-                or self.path_starts_with_whitelist_entry(view_data["path"], STRICT_POLICY_SERVE_404_FUZZY_WHITELIST)
+                or self.path_starts_with_whitelist_entry(
+                    view_data["path"], self.policy.strict_policy_serve_404_fuzzy_whitelist
+                )
                 # Site setup to handle 404s manually
-                or not REDIRECT_TO_HOME_ON_404
+                or not self.policy.redirect_to_home_on_404
             ):
                 raise Http404()
 
             # Entered url does not correspond to any view. Redirect to home route.
             if settings.DEBUG:
                 # Handle output when DEBUG = True.
-                if len(RESPONSE_404_DEBUG_MESSAGE) > 0:
-                    messages.warning(request, RESPONSE_404_DEBUG_MESSAGE)
-                    logger.warning(RESPONSE_404_DEBUG_MESSAGE)
+                if len(self.policy.response_404_debug_message) > 0:
+                    message_channel.warning(request, self.policy.response_404_debug_message)
+                    logger.warning(self.policy.response_404_debug_message)
             else:
                 # Handle output when DEBUG = False.
-                if len(RESPONSE_404_PRODUCTION_MESSAGE) > 0:
-                    messages.warning(request, RESPONSE_404_PRODUCTION_MESSAGE)
+                if len(self.policy.response_404_production_message) > 0:
+                    message_channel.warning(request, self.policy.response_404_production_message)
 
             # Redirect to home route.
-            return redirect(HOME_ROUTE)
+            return redirect(self.policy.home_route)
 
         # Raise errors on conflicting decorator/mixin states.
         self.check_main_error_states(request, view_data)
 
         # Handle if view requires user login to proceed.
         # Determined by combination of the ADMINLTE2_USE_LOGIN_REQUIRED and ADMINLTE2_LOGIN_EXEMPT_WHITELIST settings.
-        if (LOGIN_REQUIRED or view_data["login_required"]) and not self.verify_logged_in(request, view_data):
+        if self.view_requires_login(view_data) and not self.verify_logged_in(request, view_data):
             # User not logged in and view requires login to access.
 
             # Redirect to login page.
-            return redirect(LOGIN_URL + f"?next={request.path}")
+            return redirect(self.policy.login_url + f"?next={request.path}")
 
         # Check any post login error states.
         # NOTE: This call need to happen after we do the above Login Required checking.
@@ -144,36 +132,36 @@ class AuthMiddleware:
         # Handle if view requires specific user permissions to proceed.
         # Determined by combination of the ADMINLTE2_USE_STRICT_POLICY and ADMINLTE2_STRICT_POLICY_WHITELIST settings.
         permission_required = view_data["decorator_name"] in ("permission_required", "permission_required_one")
-        if (STRICT_POLICY or permission_required) and not self.verify_permissions(request, view_data):
+        if self.view_requires_permissions(view_data) and not self.verify_permissions(request, view_data):
             # Create potential warnings messages
             if settings.DEBUG:
                 # Warning if in development mode.
-                warning_message = RESPONSE_403_DEBUG_MESSAGE.format(
+                warning_message = self.policy.response_403_debug_message.format(
                     view_type=view_data["view_type"],
                     view_name=view_data["view_name"],
                 )
             else:
-                warning_message = RESPONSE_403_PRODUCTION_MESSAGE
+                warning_message = self.policy.response_403_production_message
 
             # Determine if path is 403 fuzzy whitelisted.
             path_is_403_fuzzy_whitelisted = self.path_starts_with_whitelist_entry(
-                view_data["path"], STRICT_POLICY_SERVE_403_FUZZY_WHITELIST
+                view_data["path"], self.policy.strict_policy_serve_403_fuzzy_whitelist
             )
             # If the path should skip 403 checking.
-            if path_is_403_fuzzy_whitelisted or not REDIRECT_TO_HOME_ON_403:
+            if path_is_403_fuzzy_whitelisted or not self.policy.redirect_to_home_on_403:
                 # Check if View has a mixin or decorator that will handle checking perms.
                 # If not, we should raise PermissionDenied. If it does, we can just skip handling
                 # all together as it will be handled at the decorator / mixin level.
                 if not permission_required:
                     # Create Django Messages warning.
-                    messages.warning(request, warning_message)
+                    message_channel.warning(request, warning_message)
                     # No mixin or decorator on view, need to handle here.
                     raise PermissionDenied()  # No mixin or decorator on view, need to handle here.
             else:
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
                 # Redirect to the Home Route
-                return redirect(HOME_ROUTE)
+                return redirect(self.policy.home_route)
 
         # User passed all tests or wants to handle 403s manually,
         # return requested response.
@@ -204,10 +192,10 @@ class AuthMiddleware:
             decorator_name = view_decorator_name.replace("_", " ").title().replace(" ", "")
 
         # Handle if using login_required decorator within STRICT mode or Login Required mode.
-        if (STRICT_POLICY or LOGIN_REQUIRED) and view_decorator_name == "login_required":
+        if (self.policy.strict_policy or self.policy.login_required) and view_decorator_name == "login_required":
 
             # Determine some error message values based on mode.
-            if STRICT_POLICY:
+            if self.policy.strict_policy:
                 mode_type = "STRICT"
                 mode_text = "login and permissions are"
                 if view_perm_type == "decorator":
@@ -238,14 +226,14 @@ class AuthMiddleware:
         if (
             # Using allow_anonymous or allow_without_permissions in Loose mode.
             (
-                (not STRICT_POLICY and not LOGIN_REQUIRED)
+                (not self.policy.strict_policy and not self.policy.login_required)
                 and view_decorator_name in ["allow_anonymous_access", "allow_without_permissions"]
             )
             # Or using allow_without_permissions outside of strict mode.
-            or (not STRICT_POLICY and view_decorator_name == "allow_without_permissions")
+            or (not self.policy.strict_policy and view_decorator_name == "allow_without_permissions")
         ):
             # Determine some error message values based on mode.
-            if not STRICT_POLICY and not LOGIN_REQUIRED:
+            if not self.policy.strict_policy and not self.policy.login_required:
                 mode_type = "LOOSE"
             else:
                 mode_type = "LOGIN REQUIRED"
@@ -277,7 +265,7 @@ class AuthMiddleware:
                 # Create console warning message.
                 warnings.warn(warning_message, RuntimeWarning)
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
 
         # Handle if view is login whitelisted but using a decorator/mixin state that doesn't make sense.
         if is_login_whitelisted:
@@ -299,14 +287,14 @@ class AuthMiddleware:
                 # Create console warning message.
                 warnings.warn(warning_message, RuntimeWarning)
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
 
             # Handle if whitelists don't make sense.
             # Specifically if view is login whitelisted, but permissions are still required in some way.
             # In such a case, the user still requires login for permissions, so the login whitelist does nothing.
 
             # Determine if permissions are still required and if they are negated properly.
-            requires_permissions = STRICT_POLICY or view_decorator_name == "permission_required"
+            requires_permissions = self.policy.strict_policy or view_decorator_name == "permission_required"
             permission_required_not_negated = not (
                 is_perm_whitelisted or view_decorator_name == "allow_without_permissions"
             )
@@ -333,7 +321,7 @@ class AuthMiddleware:
                 # Create console warning message.
                 warnings.warn(warning_message, RuntimeWarning)
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
 
         # Handle if view is a permission view but does NOT have permission requirements defined.
         # Determine if is a class-based view.
@@ -345,7 +333,7 @@ class AuthMiddleware:
             # Or, we are a non-whitelisted, class-based view, with no other mixins, in strict mode.
             or (
                 # In Strict Mode
-                STRICT_POLICY
+                self.policy.strict_policy
                 # and is a class based view, which implicitly assumes permission required. (unlike function-based)
                 and is_class_based
                 # and there is no mixin on the view (We called it decorator regardless of mixin or decorator)
@@ -377,10 +365,10 @@ class AuthMiddleware:
                 # Create console warning message.
                 warnings.warn(warning_message, RuntimeWarning)
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
             else:
                 # Error if in production mode.
-                raise ImproperlyConfigured(RESPONSE_404_PRODUCTION_MESSAGE)
+                raise ImproperlyConfigured(self.policy.response_404_production_message)
 
         # Handle if view is permission exempt view, but has permission requirements defined.
         if (
@@ -403,7 +391,7 @@ class AuthMiddleware:
                 # Create console warning message.
                 warnings.warn(warning_message, RuntimeWarning)
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
 
     def check_post_login_check_error_states(self, request, view_data):
         """Check for various permission required errors
@@ -423,7 +411,7 @@ class AuthMiddleware:
         # Handle if using Strict mode and there are no permission set on the view.
         if (
             # In strict mode
-            STRICT_POLICY
+            self.policy.strict_policy
             # and view is function-based
             and view_type == "function-based"
             # and missing decorators
@@ -456,11 +444,11 @@ class AuthMiddleware:
                 # Create console warning message.
                 warnings.warn(warning_message, RuntimeWarning)
                 # Create Django Messages warning.
-                messages.warning(request, warning_message)
+                message_channel.warning(request, warning_message)
             else:
                 # Error if in production mode.
                 # Create Django Messages warning.
-                messages.warning(request, RESPONSE_403_PRODUCTION_MESSAGE)
+                message_channel.warning(request, self.policy.response_403_production_message)
 
     def parse_request_data(self, request):
         """Parses request data and generates dict of calculated values."""
@@ -472,8 +460,32 @@ class AuthMiddleware:
             path = request.path_info
 
         # Initialize default data structure.
-        # This is our fallback if view is not using AdminLtePdq logic.
-        data_dict = {
+        data_dict = self.get_default_view_data(path)
+
+        # Try to get the view.
+        try:
+            resolver = resolve(data_dict["path"])
+            data_dict["resolver"] = resolver
+
+            # Use the precomputed view data of the route policy manifest, if in use and up to date.
+            route_data = PolicyManifest.get_route_data(resolver.route)
+            if route_data is None:
+                self.parse_view_data(data_dict, resolver.func, resolver.app_name, resolver.url_name)
+            else:
+                self.update_view_data_from_manifest(
+                    data_dict, route_data, resolver.func, resolver.app_name, resolver.url_name
+                )
+
+        except Http404:
+            # Request was 404, not valid page.
+            data_dict.update({"resolver": None})
+
+        # Return parsed data.
+        return data_dict
+
+    def get_default_view_data(self, path):
+        """Initial data dict for a path. This is our fallback if view is not using AdminLtePdq logic."""
+        return {
             "path": path,
             "decorator_name": "",
             "allow_anonymous_access": False,
@@ -483,117 +495,120 @@ class AuthMiddleware:
             "full_permissions": None,
         }
 
-        # Try to get the view.
-        try:
-            resolver = resolve(data_dict["path"])
-            data_dict["resolver"] = resolver
-
-            # Determine if view function or view class.
-            view_class = getattr(resolver.func, "view_class", None)
-            data_dict["view_class"] = view_class
+    def parse_view_data(self, data_dict, view_func, app_name, current_url_name):
+        """Updates data dict with calculated values for a resolved view.
 
-            # Determine universal values.
-            app_name = resolver.app_name
-            current_url_name = resolver.url_name
-            fully_qualified_url_name = f"{app_name}:{current_url_name}"
-            data_dict["app_name"] = app_name
-            data_dict["current_url_name"] = current_url_name
-            data_dict["fully_qualified_url_name"] = fully_qualified_url_name
+        Split from parse_request_data(), so that route policies can be calculated without a request.
+        """
 
-            # Get extra AdminLtePdq data, if available.
-            if view_class:
-                # Is class-based view.
+        # Determine if view function or view class.
+        view_class = getattr(view_func, "view_class", None)
+        data_dict["view_class"] = view_class
 
-                # Get AdminLte class data dict.
-                admin_pdq_data = getattr(view_class, "admin_pdq_data", {})
-            else:
-                # Is function-based view. Get AdminLte function data dict.
-                admin_pdq_data = getattr(resolver.func, "admin_pdq_data", {})
-
-            # Process data.
-            if view_class:
-                # Processing a class-based view.
-                # Get class attributes.
-                data_dict["view_name"] = view_class.__qualname__
-                data_dict["view_type"] = "class-based"
-                data_dict["view_perm_type"] = "mixin"
-
-                if admin_pdq_data or STRICT_POLICY:
-                    if admin_pdq_data:
-                        data_dict["decorator_name"] = admin_pdq_data.get("decorator_name", "")
-                        data_dict["allow_anonymous_access"] = admin_pdq_data.get("allow_anonymous_access", False)
-                        data_dict["login_required"] = admin_pdq_data.get("login_required", False)
-                        data_dict["allow_without_permissions"] = admin_pdq_data.get("allow_without_permissions", False)
-                    else:
-                        # No Mixins used, use default data_dict as admin_pdq_data and also set on view.
-                        # NOTE: We only set this default in class-based views.
-                        # Function-based will still need a decorator to set the required perms.
-                        admin_pdq_data = data_dict
-                        view_class.admin_pdq_data = data_dict
-
-                    # Because we seem unable to get the "updated" class attributes,
-                    # and only have access to the original literal class-level values,
-                    # we seem unable to rely on the data dict for this.
-                    permission_required_one_value = getattr(view_class, "permission_required_one", None)
-                    permission_required_value = getattr(view_class, "permission_required", None)
-
-                    # Sanitize values.
-                    if permission_required_one_value is not None:
-                        # Is populated. Make sure it's the correct format.
-                        if isinstance(permission_required_one_value, tuple):
-                            # Correct format, pass.
-                            pass
-                        elif isinstance(permission_required_one_value, list):
-                            # Is an iterable type, but not the expected one. Reformat.
-                            permission_required_one_value = tuple(permission_required_one_value)
-                        else:
-                            # Is some other type. Put into a tuple and hope it works out.
-                            permission_required_one_value = (permission_required_one_value,)
-                    if permission_required_value is not None:
-                        # Is populated. Make sure it's the correct format.
-                        if isinstance(permission_required_value, tuple):
-                            # Correct format, pass.
-                            pass
-                        elif isinstance(permission_required_value, list):
-                            # Is an iterable type, but not the expected one. Reformat.
-                            permission_required_value = tuple(permission_required_value)
-                        else:
-                            # Is some other type. Put into a tuple and hope it works out.
-                            permission_required_value = (permission_required_value,)
-
-                    # Save to data dict.
-                    data_dict["one_of_permissions"] = permission_required_one_value
-                    data_dict["full_permissions"] = permission_required_value
-
-                    # Update data on the class itself.
-                    view_class.admin_pdq_data["one_of_permissions"] = data_dict["one_of_permissions"]
-                    view_class.admin_pdq_data["full_permissions"] = data_dict["full_permissions"]
+        # Determine universal values.
+        fully_qualified_url_name = f"{app_name}:{current_url_name}"
+        data_dict["app_name"] = app_name
+        data_dict["current_url_name"] = current_url_name
+        data_dict["fully_qualified_url_name"] = fully_qualified_url_name
 
-            else:
-                # Processing a function-based view.
-                # Get function attributes.
-                data_dict["view_name"] = resolver.func.__qualname__
-                data_dict["view_type"] = "function-based"
-                data_dict["view_perm_type"] = "decorator"
+        # Get extra AdminLtePdq data, if available.
+        if view_class:
+            # Is class-based view.
 
-                # Handle for AdminLtePdq-specific attributes.
+            # Get AdminLte class data dict.
+            admin_pdq_data = VIEW_POLICY_REGISTRY.get_admin_pdq_data(view_class)
+        else:
+            # Is function-based view. Get AdminLte function data dict.
+            admin_pdq_data = getattr(view_func, "admin_pdq_data", {})
+
+        # Process data.
+        if view_class:
+            # Processing a class-based view.
+            # Get class attributes.
+            data_dict["view_name"] = view_class.__qualname__
+            data_dict["view_type"] = "class-based"
+            data_dict["view_perm_type"] = "mixin"
+
+            if admin_pdq_data or self.policy.strict_policy:
                 if admin_pdq_data:
                     data_dict["decorator_name"] = admin_pdq_data.get("decorator_name", "")
                     data_dict["allow_anonymous_access"] = admin_pdq_data.get("allow_anonymous_access", False)
                     data_dict["login_required"] = admin_pdq_data.get("login_required", False)
                     data_dict["allow_without_permissions"] = admin_pdq_data.get("allow_without_permissions", False)
+                else:
+                    # No Mixins used, use default data_dict as admin_pdq_data and also set on view.
+                    # NOTE: We only set this default in class-based views.
+                    # Function-based will still need a decorator to set the required perms.
+                    admin_pdq_data = data_dict
+                    view_class.admin_pdq_data = data_dict
+
+                # Because we seem unable to get the "updated" class attributes,
+                # and only have access to the original literal class-level values,
+                # we seem unable to rely on the data dict for this.
+                permission_required_one_value = getattr(view_class, "permission_required_one", None)
+                permission_required_value = getattr(view_class, "permission_required", None)
+
+                # Sanitize values.
+                if permission_required_one_value is not None:
+                    # Is populated. Make sure it's the correct format.
+                    if isinstance(permission_required_one_value, tuple):
+                        # Correct format, pass.
+                        pass
+                    elif isinstance(permission_required_one_value, list):
+                        # Is an iterable type, but not the expected one. Reformat.
+                        permission_required_one_value = tuple(permission_required_one_value)
+                    else:
+                        # Is some other type. Put into a tuple and hope it works out.
+                        permission_required_one_value = (permission_required_one_value,)
+                if permission_required_value is not None:
+                    # Is populated. Make sure it's the correct format.
+                    if isinstance(permission_required_value, tuple):
+                        # Correct format, pass.
+                        pass
+                    elif isinstance(permission_required_value, list):
+                        # Is an iterable type, but not the expected one. Reformat.
+                        permission_required_value = tuple(permission_required_value)
+                    else:
+                        # Is some other type. Put into a tuple and hope it works out.
+                        permission_required_value = (permission_required_value,)
 
-                    permission_required_one_value = getattr(resolver.func, "permission_required_one", None)
-                    permission_required_value = getattr(resolver.func, "permission_required", None)
+                # Save to data dict.
+                data_dict["one_of_permissions"] = permission_required_one_value
+                data_dict["full_permissions"] = permission_required_value
 
-                    data_dict["one_of_permissions"] = permission_required_one_value
-                    data_dict["full_permissions"] = permission_required_value
+                # Update data on the class itself.
+                view_class.admin_pdq_data["one_of_permissions"] = data_dict["one_of_permissions"]
+                view_class.admin_pdq_data["full_permissions"] = data_dict["full_permissions"]
 
-        except Http404:
-            # Request was 404, not valid page.
-            data_dict.update({"resolver": None})
+        else:
+            # Processing a function-based view.
+            # Get function attributes.
+            data_dict["view_name"] = view_func.__qualname__
+            data_dict["view_type"] = "function-based"
+            data_dict["view_perm_type"] = "decorator"
+
+            # Handle for AdminLtePdq-specific attributes.
+            if admin_pdq_data:
+                data_dict["decorator_name"] = admin_pdq_data.get("decorator_name", "")
+                data_dict["allow_anonymous_access"] = admin_pdq_data.get("allow_anonymous_access", False)
+                data_dict["login_required"] = admin_pdq_data.get("login_required", False)
+                data_dict["allow_without_permissions"] = admin_pdq_data.get("allow_without_permissions", False)
+
+                permission_required_one_value = getattr(view_func, "permission_required_one", None)
+                permission_required_value = getattr(view_func, "permission_required", None)
+
+                data_dict["one_of_permissions"] = permission_required_one_value
+                data_dict["full_permissions"] = permission_required_value
 
-        # Return parsed data.
+        return data_dict
+
+    def update_view_data_from_manifest(self, data_dict, route_data, view_func, app_name, current_url_name):
+        """Updates data dict with the view data stored in the route policy manifest, instead of parse_view_data()."""
+        data_dict.update(route_data)
+        data_dict["view_class"] = getattr(view_func, "view_class", None)
+        data_dict["app_name"] = app_name
+        data_dict["current_url_name"] = current_url_name
+        data_dict["fully_qualified_url_name"] = f"{app_name}:{current_url_name}"
         return data_dict
 
     def should_redirect_with_slash(self, request):
@@ -634,6 +649,17 @@ class AuthMiddleware:
             )
         return new_path
 
+    def view_requires_login(self, view_data):
+        """Determine if view requires login, as set by the ADMINLTE2_USE_LOGIN_REQUIRED setting or the view itself."""
+        return self.policy.login_required or view_data["login_required"]
+
+    def view_requires_permissions(self, view_data):
+        """Determine if view requires permissions, as set by the ADMINLTE2_USE_STRICT_POLICY setting or the view."""
+        return self.policy.strict_policy or view_data["decorator_name"] in (
+            "permission_required",
+            "permission_required_one",
+        )
+
     def verify_logged_in(self, request, view_data):
         """Checks to verify User is logged in, for views that require it."""
 
@@ -642,13 +668,20 @@ class AuthMiddleware:
             return True
 
         # User not logged in. Still allow request for the following:
+        return (
+            # View is exempt from login, regardless of request.
+            self.is_login_exempt_route(view_data)
+            # If passes requirements for custom login hook (defined on a per-project basis).
+            or self.login_required_hook(request)
+        )
+
+    def is_login_exempt_route(self, view_data):
+        """Return whether the view is exempt from requiring login, based only on the view and settings."""
         return (
             # View has allow_anonymous decorator.
             view_data["allow_anonymous_access"] is True
             # If url name exists in whitelist.
             or self.is_login_whitelisted(view_data)
-            # If passes requirements for custom login hook (defined on a per-project basis).
-            or self.login_required_hook(request)
             # If url is for a special route that does not need processing
             or self.is_special_route(view_data)
         )
@@ -665,38 +698,23 @@ class AuthMiddleware:
 
     def user_passes_perms(self, request, view_data):
         """Checks to verify User has required permissions, for views that require it."""
-
-        # Default to failing.
-        passed_one_of_perms_check = False
-        passed_full_perms_check = False
-        # Only allow passing if at least one of the types of perms are set on the view.
-        # NOTE: This will help ensure that if the PermissionRequired mixin is used, the user must
-        # fill out the `permission_required` attribute for the view to pass perm checks.
-        at_least_one_set = False
-
-        if view_data["one_of_permissions"]:
-            at_least_one_set = True
-            # Partial set exists. Must have at least one of any.
-            if any(request.user.has_perm(perm) for perm in view_data["one_of_permissions"]):
-                passed_one_of_perms_check = True
-        else:
-            # No partial set to pass. Default to true.
-            passed_one_of_perms_check = True
-
-        if view_data["full_permissions"]:
-            at_least_one_set = True
-            # Full set exists. Must have all.
-            if all(request.user.has_perm(perm) for perm in view_data["full_permissions"]):
-                passed_full_perms_check = True
-        else:
-            # No full set to pass. Default to true.
-            passed_full_perms_check = True
-
-        # Return true if passes both checks.
-        return at_least_one_set and passed_one_of_perms_check and passed_full_perms_check
+        return passes_permission_checks(
+            view_data["one_of_permissions"],
+            view_data["full_permissions"],
+            request.user.has_perm,
+        )
 
     def view_is_permission_exempt(self, request, view_data):
         """Return whether the view is exempt from requiring permissions in strict mode."""
+        return (
+            # View is exempt from permissions, regardless of request.
+            self.is_permission_exempt_route(view_data)
+            # If passes requirements for custom login hook (defined on a per-project basis).
+            or self.permission_required_hook(request)
+        )
+
+    def is_permission_exempt_route(self, view_data):
+        """Return whether the view is exempt from requiring permissions, based only on the view and settings."""
         return (
             # View has allow_anonymous decorator.
             view_data["allow_anonymous_access"] is True
@@ -706,8 +724,6 @@ class AuthMiddleware:
             or self.is_permission_whitelisted(view_data)
             # If is the equivalent of the "Django Admin" app.
             or view_data["app_name"] == "admin"
-            # If passes requirements for custom login hook (defined on a per-project basis).
-            or self.permission_required_hook(request)
             # If url is for a special route that does not need processing
             or self.is_special_route(view_data)
             # If url is for redirecting.
@@ -717,22 +733,20 @@ class AuthMiddleware:
     def is_login_whitelisted(self, view_data):
         """Determines if view is login-whitelisted. Used for login_required mode or strict mode."""
 
-        # Fetch out path and url names and default to blank string.
+        # Fetch out path and default to blank string.
         path = view_data.get("path", "")
-        url_name = view_data.get("current_url_name", "")
-        full_url_name = view_data.get("fully_qualified_url_name", "")
 
         # In "standard" exemption list.
         # Verify whether each path var is not an empty string and is in the whitelist.
-        whitelisted_directly = (
-            (path and path in LOGIN_EXEMPT_WHITELIST)
-            or (url_name and url_name in LOGIN_EXEMPT_WHITELIST)
-            or (full_url_name and full_url_name in LOGIN_EXEMPT_WHITELIST)
-        )
+        # Url name membership may already be known from the route policy manifest.
+        url_name_whitelisted = view_data.get("login_whitelisted_name")
+        if url_name_whitelisted is None:
+            url_name_whitelisted = self.is_url_name_in_whitelist(view_data, self.policy.login_exempt_whitelist)
+        whitelisted_directly = (path and path in self.policy.login_exempt_whitelist) or url_name_whitelisted
 
         # In "app-wide" exemption list.
         # Verify whether path var is not an empty string and is in the fuzzy whitelist.
-        whitelisted_fuzzy = self.path_starts_with_whitelist_entry(path, LOGIN_EXEMPT_FUZZY_WHITELIST)
+        whitelisted_fuzzy = self.path_starts_with_whitelist_entry(path, self.policy.login_exempt_fuzzy_whitelist)
 
         # Return if either whitelisted directly or via fuzzy logic
         return whitelisted_directly or whitelisted_fuzzy
@@ -740,26 +754,30 @@ class AuthMiddleware:
     def is_permission_whitelisted(self, view_data):
         """Determines if view is permission-whitelisted. Used for strict mode."""
 
-        # Fetch out path and url names and default to blank string.
+        # Fetch out path and default to blank string.
         path = view_data.get("path", "")
-        url_name = view_data.get("current_url_name", "")
-        full_url_name = view_data.get("fully_qualified_url_name", "")
 
         # In "standard" exemption list.
         # Verify whether each path var is not an empty string and is in the whitelist.
-        whitelisted_directly = (
-            (path and path in STRICT_POLICY_WHITELIST)
-            or (url_name and url_name in STRICT_POLICY_WHITELIST)
-            or (full_url_name and full_url_name in STRICT_POLICY_WHITELIST)
-        )
+        # Url name membership may already be known from the route policy manifest.
+        url_name_whitelisted = view_data.get("permission_whitelisted_name")
+        if url_name_whitelisted is None:
+            url_name_whitelisted = self.is_url_name_in_whitelist(view_data, self.policy.strict_policy_whitelist)
+        whitelisted_directly = (path and path in self.policy.strict_policy_whitelist) or url_name_whitelisted
 
         # In "project-wide" exemption list.
         # Verify whether path var is not an empty string and is in the fuzzy whitelist.
-        whitelisted_fuzzy = self.path_starts_with_whitelist_entry(path, STRICT_POLICY_FUZZY_WHITELIST)
+        whitelisted_fuzzy = self.path_starts_with_whitelist_entry(path, self.policy.strict_policy_fuzzy_whitelist)
 
         # Return if either whitelisted directly or via fuzzy logic
         return whitelisted_directly or whitelisted_fuzzy
 
+    def is_url_name_in_whitelist(self, view_data, whitelist):
+        """Determine if the url name of a view, with or without app name, is in a given whitelist"""
+        url_name = view_data.get("current_url_name", "")
+        full_url_name = view_data.get("fully_qualified_url_name", "")
+        return bool((url_name and url_name in whitelist) or (full_url_name and full_url_name in whitelist))
+
     def path_starts_with_whitelist_entry(self, path, whitelist):
         """Determine if a path starts with an entry in a given whitelist"""
         whitelisted = False
@@ -801,24 +819,37 @@ class AuthMiddleware:
     def verify_static_route(self, path):
         """Verify that the path of the request is not a STATIC URL"""
         return_val = False
-        if STATIC_ROUTE and STATIC_ROUTE != "/":
-            return_val = path.startswith(STATIC_ROUTE)
+        if self.policy.static_route and self.policy.static_route != "/":
+            return_val = path.startswith(self.policy.static_route)
         return return_val
 
     def verify_media_route(self, path):
         """Verify that the path of the request is not a MEDIA URL"""
         return_val = False
-        if MEDIA_ROUTE and MEDIA_ROUTE != "/":
-            return_val = path.startswith(MEDIA_ROUTE)
+        if self.policy.media_route and self.policy.media_route != "/":
+            return_val = path.startswith(self.policy.media_route)
         return return_val
 
     def verify_websocket_route(self, path):
         """Verify that the path of the request is not a WEBSOCKET URL"""
         return_val = False
-        if WEBSOCKET_ROUTE and WEBSOCKET_ROUTE != "/":
-            return_val = path.startswith(WEBSOCKET_ROUTE)
+        if self.policy.websocket_route and self.policy.websocket_route != "/":
+            return_val = path.startswith(self.policy.websocket_route)
         return return_val
 
     def verify_redirect_route(self, view_class):
         """Verify that the view class is a RedirectView"""
         return view_class is not None and view_class == RedirectView
+
+
+def get_auth_middleware():
+    """Get an instance of the project AuthMiddleware, or subclass of it, so that project overrides are used.
+
+    For evaluating route policies outside of a request, such as in management commands.
+    Falls back to the package AuthMiddleware if none is in the MIDDLEWARE setting.
+    """
+    for middleware_path in settings.MIDDLEWARE:
+        middleware_class = import_string(middleware_path)
+        if isinstance(middleware_class, type) and issubclass(middleware_class, AuthMiddleware):
+            return middleware_class(get_response=None)
+    return AuthMiddleware(get_response=None)
@@ -1,20 +1,19 @@
 """Django AdminLte2Pdq package mixins."""
 
 # Third-Party Imports.
+from django.contrib.auth import get_backends
 from django.contrib.auth.mixins import (
     LoginRequiredMixin as DjangoLoginRequiredMixin,
     PermissionRequiredMixin as DjangoPermissionRequiredMixin,
 )
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 
 # Internal Imports.
-from .constants import (
-    HOME_ROUTE,
-    REDIRECT_TO_HOME_ON_403,
-    STRICT_POLICY_SERVE_403_FUZZY_WHITELIST,
-)
+from .policy import Policy
+from .registry import VIEW_POLICY_REGISTRY, RegisteredSubclassNames
 
 
 class AllowAnonymousAccessMixin:
@@ -31,15 +30,16 @@ class AllowAnonymousAccessMixin:
         "allow_without_permissions": False,
     }
 
-    subclasses = []
+    # Deprecated. Names of the classes that inherit this mixin.
+    subclasses = RegisteredSubclassNames()
 
     def __init_subclass__(cls, **kwargs):
-        """Hook to record all classes that inherit this mixin.
+        """Hook to record all classes that inherit this mixin, in the view policy registry.
 
         Solution from: https://stackoverflow.com/a/50099920
         """
         super().__init_subclass__(**kwargs)
-        cls.subclasses.append(cls.__name__)
+        VIEW_POLICY_REGISTRY.register(cls)
 
 
 class LoginRequiredMixin(DjangoLoginRequiredMixin):
@@ -53,15 +53,16 @@ class LoginRequiredMixin(DjangoLoginRequiredMixin):
         "allow_without_permissions": False,
     }
 
-    subclasses = []
+    # Deprecated. Names of the classes that inherit this mixin.
+    subclasses = RegisteredSubclassNames()
 
     def __init_subclass__(cls, **kwargs):
-        """Hook to record all classes that inherit this mixin.
+        """Hook to record all classes that inherit this mixin, in the view policy registry.
 
         Solution from: https://stackoverflow.com/a/50099920
         """
         super().__init_subclass__(**kwargs)
-        cls.subclasses.append(cls.__name__)
+        VIEW_POLICY_REGISTRY.register(cls)
 
 
 class AllowWithoutPermissionsMixin(DjangoLoginRequiredMixin):
@@ -78,15 +79,16 @@ class AllowWithoutPermissionsMixin(DjangoLoginRequiredMixin):
         "allow_without_permissions": True,
     }
 
-    subclasses = []
+    # Deprecated. Names of the classes that inherit this mixin.
+    subclasses = RegisteredSubclassNames()
 
     def __init_subclass__(cls, **kwargs):
-        """Hook to record all classes that inherit this mixin.
+        """Hook to record all classes that inherit this mixin, in the view policy registry.
 
         Solution from: https://stackoverflow.com/a/50099920
         """
         super().__init_subclass__(**kwargs)
-        cls.subclasses.append(cls.__name__)
+        VIEW_POLICY_REGISTRY.register(cls)
 
 
 class PermissionRequiredMixin(DjangoPermissionRequiredMixin):
@@ -104,15 +106,16 @@ class PermissionRequiredMixin(DjangoPermissionRequiredMixin):
         "allow_without_permissions": False,
     }
 
-    subclasses = []
+    # Deprecated. Names of the classes that inherit this mixin.
+    subclasses = RegisteredSubclassNames()
 
     def __init_subclass__(cls, **kwargs):
-        """Hook to record all classes that inherit this mixin.
+        """Hook to record all classes that inherit this mixin, in the view policy registry.
 
         Solution from: https://stackoverflow.com/a/50099920
         """
         super().__init_subclass__(**kwargs)
-        cls.subclasses.append(cls.__name__)
+        VIEW_POLICY_REGISTRY.register(cls)
 
     def dispatch(self, request, *args, **kwargs):
         # Override to always redirect to home in event of permission failure
@@ -123,13 +126,13 @@ class PermissionRequiredMixin(DjangoPermissionRequiredMixin):
             # Failed permission checks.
             # Determine if path is 403 fuzzy whitelisted.
             path_is_403_fuzzy_whitelisted = self.path_starts_with_whitelist_entry(
-                request.path, STRICT_POLICY_SERVE_403_FUZZY_WHITELIST
+                request.path, Policy.strict_policy_serve_403_fuzzy_whitelist
             )
             # If the path should skip 403 handling, use default, otherwise, redirect to home
-            if path_is_403_fuzzy_whitelisted or not REDIRECT_TO_HOME_ON_403:
+            if path_is_403_fuzzy_whitelisted or not Policy.redirect_to_home_on_403:
                 return self.handle_no_permission()
             else:
-                return redirect(reverse_lazy(HOME_ROUTE))
+                return redirect(reverse_lazy(Policy.home_route))
 
         return super().dispatch(request, *args, **kwargs)
 
@@ -218,10 +221,77 @@ class PermissionRequiredMixin(DjangoPermissionRequiredMixin):
         return whitelisted
 
 
+class ObjectPermissionRequiredMixin(PermissionRequiredMixin):
+    """Mixin for list views that limits the queryset to objects the user has object-level permissions for.
+
+    Model-level permissions are still checked exactly as in PermissionRequiredMixin, so the middleware
+    and sidebar treat this view like any other permission view. Object-level permissions are then
+    applied as a single queryset filter, built from a Q object provided by the authentication backends,
+    instead of calling ``user.has_perm(perm, obj)`` once per row.
+
+    Backends opt in by defining a ``get_object_permission_q(user_obj, perms, model)`` method, returning
+    a Q object matching the objects the user holds all of the given perms for, or None if the backend
+    does not handle the model. Results from multiple backends are OR'd together, matching how Django
+    treats ``has_perm()``. If no backend handles the model, no objects are returned.
+    """
+
+    # Values for user to override.
+    object_permission_required = None  # Must have all, per object, if any.
+
+    def get_object_permission_required(self):
+        """Override this method to override the object permission attribute.
+        Must return an iterable of permission strings.
+        """
+        if isinstance(self.object_permission_required, str):
+            return (self.object_permission_required,)
+        elif isinstance(self.object_permission_required, (list, tuple)):
+            return tuple(self.object_permission_required)
+        elif self.object_permission_required is None:
+            return tuple()
+
+        raise TypeError(
+            f"Unknown type ({type(self.object_permission_required)}) for object permission. "
+            "Expected list, tuple, or string."
+        )
+
+    def get_object_permission_q(self, model):
+        """Get the Q object limiting the given model to objects the request user has object permissions for.
+
+        Override this method to filter without going through the authentication backends.
+        """
+        perms = self.get_object_permission_required()
+        user = self.request.user
+
+        # No object permissions to check, or user bypasses all permission checks.
+        if not perms or (user.is_active and user.is_superuser):
+            return Q()
+
+        combined_q = None
+        for backend in get_backends():
+            if not hasattr(backend, "get_object_permission_q"):
+                continue
+
+            backend_q = backend.get_object_permission_q(user, perms, model)
+            if backend_q is not None:
+                combined_q = backend_q if combined_q is None else combined_q | backend_q
+
+        if combined_q is None:
+            # No backend handles object permissions for this model. Match nothing.
+            return Q(pk__in=[])
+
+        return combined_q
+
+    def get_queryset(self):
+        """Limit the view queryset to objects the request user has object permissions for."""
+        queryset = super().get_queryset()
+        return queryset.filter(self.get_object_permission_q(queryset.model))
+
+
 # Limit imports from this file.
 __all__ = [
     "AllowAnonymousAccessMixin",
     "AllowWithoutPermissionsMixin",
     "LoginRequiredMixin",
+    "ObjectPermissionRequiredMixin",
     "PermissionRequiredMixin",
 ]
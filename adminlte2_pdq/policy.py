@@ -0,0 +1,220 @@
+"""Django AdminLte2Pdq authentication and authorization policy.
+
+Holds the policy settings that the AuthMiddleware, mixins and sidebar menu check on every request.
+Built from settings when the app is ready, and rebuilt whenever one of those settings changes,
+such as from override_settings() in tests. So unlike the import-time values in adminlte2_pdq.constants,
+policy changes apply without reloading any modules.
+
+Only the settings in POLICY_SETTINGS are reloadable. Other package settings, such as
+ADMINLTE2_USE_LOCAL_AVATARS, ADMINLTE2_USE_ASSET_BUNDLES and ADMINLTE2_MESSAGE_CHANNEL_CAPACITY,
+are read once at import.
+"""
+
+# System Imports.
+import logging
+
+# Third-Party Imports.
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import reverse_lazy
+
+# Internal Imports.
+from .constants.general_constants import (
+    DEFAULT_RESPONSE_403_DEBUG_MESSAGE,
+    DEFAULT_RESPONSE_403_PRODUCTION_MESSAGE,
+    DEFAULT_RESPONSE_404_DEBUG_MESSAGE,
+    DEFAULT_RESPONSE_404_PRODUCTION_MESSAGE,
+)
+from .constants.route_and_policy_constants import get_login_required_policy, get_strict_policy
+
+
+logger = logging.getLogger(__name__)
+
+
+# Settings that the policy is built from.
+POLICY_SETTINGS = frozenset(
+    (
+        "ADMINLTE2_USE_STRICT_POLICY",
+        "ADMINLTE2_USE_LOGIN_REQUIRED",
+        "ADMINLTE2_HOME_ROUTE",
+        "ADMINLTE2_LOGIN_EXEMPT_WHITELIST",
+        "ADMINLTE2_STRICT_POLICY_WHITELIST",
+        "ADMINLTE2_LOGIN_EXEMPT_FUZZY_WHITELIST",
+        "ADMINLTE2_STRICT_POLICY_FUZZY_WHITELIST",
+        "ADMINLTE2_STRICT_POLICY_SERVE_403_FUZZY_WHITELIST",
+        "ADMINLTE2_STRICT_POLICY_SERVE_404_FUZZY_WHITELIST",
+        "ADMINLTE2_REDIRECT_TO_HOME_ON_403",
+        "ADMINLTE2_REDIRECT_TO_HOME_ON_404",
+        "ADMINLTE2_RESPONSE_403_DEBUG_MESSAGE",
+        "ADMINLTE2_RESPONSE_403_PRODUCTION_MESSAGE",
+        "ADMINLTE2_RESPONSE_404_DEBUG_MESSAGE",
+        "ADMINLTE2_RESPONSE_404_PRODUCTION_MESSAGE",
+        "ADMINLTE2_ROUTE_POLICY_MANIFEST",
+        "LOGIN_URL",
+        "LOGOUT_URL",
+        "MEDIA_URL",
+        "STATIC_URL",
+        "WEBSOCKET_URL",
+        "PWD_RESET_ROUTE",
+        "PWD_RESET_DONE_ROUTE",
+        "PWD_RESET_CONFIRM_ROUTE",
+        "PWD_RESET_COMPLETE_ROUTE",
+        "REGISTER_ROUTE",
+        "PWD_CHANGE",
+        "PWD_CHANGE_DONE",
+    )
+)
+
+
+class _Policy:
+    """Authentication and authorization policy settings.
+
+    Attributes match the equally named (upper case) values in adminlte2_pdq.constants.
+    Slots are used, as attributes are read on every request.
+    """
+
+    __slots__ = (
+        # Policy modes.
+        "strict_policy",
+        "login_required",
+        # Routes.
+        "login_url",
+        "home_route",
+        "media_route",
+        "static_route",
+        "websocket_route",
+        # Whitelists.
+        "login_exempt_whitelist",
+        "strict_policy_whitelist",
+        "login_exempt_fuzzy_whitelist",
+        "strict_policy_fuzzy_whitelist",
+        "strict_policy_serve_403_fuzzy_whitelist",
+        "strict_policy_serve_404_fuzzy_whitelist",
+        # 403 / 404 handling.
+        "redirect_to_home_on_403",
+        "redirect_to_home_on_404",
+        "response_403_debug_message",
+        "response_403_production_message",
+        "response_404_debug_message",
+        "response_404_production_message",
+        # Route policy manifest.
+        "route_policy_manifest",
+    )
+
+    def __init__(self):
+        """Start with an empty policy, until reload() is called once settings are ready."""
+        # Policy modes.
+        self.strict_policy = False
+        self.login_required = False
+
+        # Routes.
+        self.login_url = ""
+        self.home_route = ""
+        self.media_route = ""
+        self.static_route = ""
+        self.websocket_route = ""
+
+        # Whitelists.
+        self.login_exempt_whitelist = []
+        self.strict_policy_whitelist = []
+        self.login_exempt_fuzzy_whitelist = ()
+        self.strict_policy_fuzzy_whitelist = ()
+        self.strict_policy_serve_403_fuzzy_whitelist = ()
+        self.strict_policy_serve_404_fuzzy_whitelist = ()
+
+        # 403 / 404 handling.
+        self.redirect_to_home_on_403 = True
+        self.redirect_to_home_on_404 = True
+        self.response_403_debug_message = ""
+        self.response_403_production_message = ""
+        self.response_404_debug_message = ""
+        self.response_404_production_message = ""
+
+        # Route policy manifest.
+        self.route_policy_manifest = None
+
+    def reload(self):
+        """Build the policy from the current settings.
+
+        :raises ImproperlyConfigured: If a whitelist setting is set outside of its policy mode.
+        """
+        self.strict_policy = get_strict_policy()
+        self.login_required = get_login_required_policy(self.strict_policy)
+
+        self.login_url = getattr(settings, "LOGIN_URL", reverse_lazy("login"))
+        self.home_route = getattr(settings, "ADMINLTE2_HOME_ROUTE", "adminlte2_pdq:home")
+        self.media_route = getattr(settings, "MEDIA_URL", "/media/")
+        self.static_route = getattr(settings, "STATIC_URL", "/static/")
+        self.websocket_route = getattr(settings, "WEBSOCKET_URL", "/ws/")
+
+        # Known routes that should never require being logged in, then any user defined routes.
+        login_exempt_whitelist = [
+            self.login_url,
+            getattr(settings, "LOGOUT_URL", reverse_lazy("logout")),
+            getattr(settings, "PWD_RESET_ROUTE", "password_reset"),
+            getattr(settings, "PWD_RESET_DONE_ROUTE", "password_reset_done"),
+            getattr(settings, "PWD_RESET_CONFIRM_ROUTE", "password_reset_confirm"),
+            getattr(settings, "PWD_RESET_COMPLETE_ROUTE", "password_reset_complete"),
+            getattr(settings, "REGISTER_ROUTE", "adminlte2_pdq:register"),
+        ]
+        # Known routes that should never require a permission check, then any user defined routes.
+        self.strict_policy_whitelist = [
+            self.home_route,
+            getattr(settings, "PWD_CHANGE", "password_change"),
+            getattr(settings, "PWD_CHANGE_DONE", "password_change_done"),
+            "adminlte2_pdq:avatar",
+            "adminlte2_pdq:avatar_initials",
+            *login_exempt_whitelist,
+            *getattr(settings, "ADMINLTE2_STRICT_POLICY_WHITELIST", []),
+        ]
+        self.login_exempt_whitelist = login_exempt_whitelist + list(
+            getattr(settings, "ADMINLTE2_LOGIN_EXEMPT_WHITELIST", [])
+        )
+
+        self.login_exempt_fuzzy_whitelist = tuple(getattr(settings, "ADMINLTE2_LOGIN_EXEMPT_FUZZY_WHITELIST", []))
+        self.strict_policy_fuzzy_whitelist = tuple(getattr(settings, "ADMINLTE2_STRICT_POLICY_FUZZY_WHITELIST", []))
+        self.strict_policy_serve_403_fuzzy_whitelist = tuple(
+            getattr(settings, "ADMINLTE2_STRICT_POLICY_SERVE_403_FUZZY_WHITELIST", [])
+        )
+        self.strict_policy_serve_404_fuzzy_whitelist = tuple(
+            getattr(settings, "ADMINLTE2_STRICT_POLICY_SERVE_404_FUZZY_WHITELIST", [])
+        )
+
+        self.redirect_to_home_on_403 = getattr(settings, "ADMINLTE2_REDIRECT_TO_HOME_ON_403", True)
+        self.redirect_to_home_on_404 = getattr(settings, "ADMINLTE2_REDIRECT_TO_HOME_ON_404", True)
+        self.response_403_debug_message = str(
+            getattr(settings, "ADMINLTE2_RESPONSE_403_DEBUG_MESSAGE", DEFAULT_RESPONSE_403_DEBUG_MESSAGE)
+        ).strip()
+        self.response_403_production_message = str(
+            getattr(settings, "ADMINLTE2_RESPONSE_403_PRODUCTION_MESSAGE", DEFAULT_RESPONSE_403_PRODUCTION_MESSAGE)
+        ).strip()
+        self.response_404_debug_message = str(
+            getattr(settings, "ADMINLTE2_RESPONSE_404_DEBUG_MESSAGE", DEFAULT_RESPONSE_404_DEBUG_MESSAGE)
+        ).strip()
+        self.response_404_production_message = str(
+            getattr(settings, "ADMINLTE2_RESPONSE_404_PRODUCTION_MESSAGE", DEFAULT_RESPONSE_404_PRODUCTION_MESSAGE)
+        ).strip()
+
+        self.route_policy_manifest = getattr(settings, "ADMINLTE2_ROUTE_POLICY_MANIFEST", None)
+
+
+# Make the policy instance. Built by the app config once settings are ready.
+Policy = _Policy()
+
+
+@receiver(setting_changed)
+def _reload_policy(*, setting, **kwargs):
+    """Rebuild the policy when a setting that it is built from changes.
+
+    Settings may be changed one at a time, passing through combinations that aren't valid together.
+    So an invalid combination keeps the previous policy, rather than failing the change.
+    """
+    if setting not in POLICY_SETTINGS:
+        return
+
+    try:
+        Policy.reload()
+    except ImproperlyConfigured as err:
+        logger.warning("AdminLtePdq policy not reloaded, as the changed settings are invalid: %s", err)
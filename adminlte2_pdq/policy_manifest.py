@@ -0,0 +1,207 @@
+"""Django AdminLte2Pdq route policy manifest.
+
+A manifest holds the view policy data of every route, and of every node in the menu setting,
+as calculated ahead of time by the "policymanifest" command. When the ADMINLTE2_ROUTE_POLICY_MANIFEST
+setting is set, the AuthMiddleware and sidebar menu read view policies from it, instead of
+introspecting each view (and reversing and resolving each menu node route) on use.
+
+The manifest stores a checksum of the URLconf, view policies and policy settings it was built from.
+If the checksum no longer matches, the manifest is ignored and live introspection is used instead.
+The manifest itself is built by the "policymanifest" command.
+"""
+
+# System Imports.
+import json
+import logging
+from hashlib import sha256
+
+# Third-Party Imports.
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_resolver
+
+# Internal Imports.
+from .policy import POLICY_SETTINGS, Policy
+from .registry import VIEW_POLICY_REGISTRY
+from .url_walker import walk_url_patterns
+
+
+logger = logging.getLogger(__name__)
+
+
+# Version of the manifest format. Manifests of any other version are ignored.
+MANIFEST_VERSION = 1
+
+# AuthMiddleware view data values stored per route, in stored order.
+ROUTE_DATA_FIELDS = (
+    "decorator_name",
+    "allow_anonymous_access",
+    "login_required",
+    "allow_without_permissions",
+    "one_of_permissions",
+    "full_permissions",
+    "view_name",
+    "view_type",
+    "view_perm_type",
+    "login_whitelisted_name",
+    "permission_whitelisted_name",
+)
+
+# Sidebar menu view data values stored per menu node route, in stored order.
+MENU_DATA_FIELDS = (
+    "decorator_name",
+    "allow_anonymous_access",
+    "login_required",
+    "allow_without_permissions",
+    "one_of_permissions",
+    "full_permissions",
+)
+
+
+def get_route_key(route):
+    """Get the manifest key of a route.
+
+    ResolverMatch.route drops the leading "^" of each nested regex pattern, while joined patterns keep them.
+    So all are dropped, to give the same key either way.
+    """
+    return route.replace("^", "")
+
+
+def get_declared_view_policy(callback):
+    """Get the policy values that a url callback declares, via the package decorators or mixins.
+
+    Read from the view policy registry for class-based views, and from the decorator data for function-based views.
+    Unlike the admin_pdq_data of a view class, neither is changed by the middleware parsing the view.
+    """
+    view_class = getattr(callback, "view_class", None)
+    if view_class:
+        view = view_class
+        admin_pdq_data = VIEW_POLICY_REGISTRY.get(view_class, {})
+    else:
+        view = callback
+        admin_pdq_data = getattr(callback, "admin_pdq_data", {})
+
+    return [
+        admin_pdq_data.get("decorator_name", ""),
+        admin_pdq_data.get("allow_anonymous_access", False),
+        admin_pdq_data.get("login_required", False),
+        admin_pdq_data.get("allow_without_permissions", False),
+        getattr(view, "permission_required_one", None),
+        getattr(view, "permission_required", None),
+    ]
+
+
+def get_policy_checksum():
+    """Get a checksum of the URLconf, view policies and policy settings that the view policy data depends on."""
+    checksum = sha256()
+    checksum.update(
+        json.dumps(
+            [
+                MANIFEST_VERSION,
+                Policy.strict_policy,
+                Policy.login_required,
+                [str(entry) for entry in Policy.login_exempt_whitelist],
+                [str(entry) for entry in Policy.strict_policy_whitelist],
+            ]
+        ).encode("utf-8")
+    )
+    for prefix, app_name, url in walk_url_patterns(get_resolver().url_patterns, nested_app_names=True):
+        route_values = [prefix + str(url.pattern), app_name, url.name, url.lookup_str]
+        # Permissions may be given as any iterable, so anything json can't store is compared by its string value.
+        route_values.append(get_declared_view_policy(url.callback))
+        checksum.update(json.dumps(route_values, default=str).encode("utf-8"))
+    return checksum.hexdigest()
+
+
+def _from_json(value):
+    """Restore a stored value. Permission tuples are stored as json lists."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+class _PolicyManifest:
+    """Loaded route policy manifest.
+
+    Loaded on first use, from the file in the ADMINLTE2_ROUTE_POLICY_MANIFEST setting (Policy.route_policy_manifest).
+    Run adminlte2_pdq.warmup() to load it before worker processes are forked.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.routes = {}
+        self.menu = {}
+
+    def load(self):
+        """Load the manifest file. Leaves the manifest empty if not set, unreadable or out of date.
+
+        :return: True if the manifest was loaded, otherwise False.
+        """
+        self.loaded = True
+        self.routes = {}
+        self.menu = {}
+
+        manifest_path = Policy.route_policy_manifest
+        if not manifest_path:
+            return False
+
+        try:
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError) as err:
+            logger.warning("Could not read route policy manifest %s, using live introspection: %s", manifest_path, err)
+            return False
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("checksum") != get_policy_checksum():
+            logger.warning(
+                "Route policy manifest %s does not match the current URLconf or policy settings, "
+                "using live introspection. Regenerate it with the policymanifest command.",
+                manifest_path,
+            )
+            return False
+
+        self.routes = {
+            route_key: dict(zip(ROUTE_DATA_FIELDS, map(_from_json, values)))
+            for route_key, values in manifest["routes"].items()
+        }
+        self.menu = {
+            route: dict(zip(MENU_DATA_FIELDS, map(_from_json, values))) for route, values in manifest["menu"].items()
+        }
+        return True
+
+    def clear(self):
+        """Clear the loaded manifest, so that it is loaded again on next use."""
+        self.loaded = False
+        self.routes = {}
+        self.menu = {}
+
+    def get_route_data(self, route):
+        """Get the stored AuthMiddleware view data for a route, as given by ResolverMatch.route.
+
+        Returned dict is shared between calls, so must not be modified.
+
+        :return: Dict of ROUTE_DATA_FIELDS values, or None if not in the manifest.
+        """
+        if not self.loaded:
+            self.load()
+        return self.routes.get(get_route_key(route)) if self.routes else None
+
+    def get_menu_data(self, route):
+        """Get the stored sidebar view data for a menu node route name, without route args.
+
+        Returned dict is shared between calls, so must not be modified.
+
+        :return: Dict of MENU_DATA_FIELDS values, or None if not in the manifest.
+        """
+        if not self.loaded:
+            self.load()
+        return self.menu.get(route) if self.menu else None
+
+
+# Make the manifest instance.
+PolicyManifest = _PolicyManifest()
+
+
+@receiver(setting_changed)
+def _reset_policy_manifest(*, setting, **kwargs):
+    """Clear the loaded manifest when the URLconf or policy changes, so that its checksum is checked again."""
+    if setting == "ROOT_URLCONF" or setting in POLICY_SETTINGS:
+        PolicyManifest.clear()
@@ -0,0 +1,318 @@
+"""Django AdminLte2Pdq page profiling.
+
+Times the package components involved in rendering a page, such as the AuthMiddleware, the sidebar menu
+template tags and the admin menu, and counts the database queries made by each.
+
+Timing hooks are only installed while profiling, so have no cost otherwise.
+Times are "self" times, so exclude the time of other components run within them.
+For example, the "view" component excludes the time of the template tags rendered by the view.
+"""
+
+# System Imports.
+import cProfile
+import inspect
+import pstats
+import time
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+# Third-Party Imports.
+from django.conf import settings
+from django.db import connections
+from django.test import Client
+from django.utils.module_loading import import_string
+
+
+# Package callables timed while profiling, by component name.
+# Each target is the import path of the class (or instance) holding the callable, and the callable name.
+PROFILE_HOOKS = {
+    "auth_middleware": ("adminlte2_pdq.middleware.AuthMiddleware", "run_auth_checks"),
+    "admin_menu": ("adminlte2_pdq.admin_menu.AdminMenu", "create_menu"),
+    # Resolves and calls the view, within all middleware. Includes rendering template responses.
+    # Private Django method, as the handler has no public hook that runs between the middleware and the view.
+    # Checked against Django 3.2 to 5.2, where load_middleware() binds it as the innermost (sync) handler.
+    "view": ("django.core.handlers.base.BaseHandler", "_get_response"),
+}
+
+# Template tag nodes timed while profiling. Package tags are timed as the "tag.<tag function name>" component.
+PROFILE_TAG_NODES = (
+    "django.template.library.InclusionNode",
+    "django.template.library.SimpleNode",
+)
+
+# Component for time and queries outside of all other components, such as other middleware.
+OTHER_COMPONENT = "other"
+
+
+class ComponentTiming:
+    """Timings and query count of a profiled component."""
+
+    __slots__ = ("calls", "time", "cumulative_time", "queries")
+
+    def __init__(self):
+        self.calls = 0
+        # Time within the component, excluding other components run within it.
+        self.time = 0.0
+        # Time within the component, including other components run within it.
+        self.cumulative_time = 0.0
+        self.queries = 0
+
+    def as_dict(self):
+        """Get the timings as a dict, with times in milliseconds."""
+        return {
+            "calls": self.calls,
+            "time_ms": round(self.time * 1000, 3),
+            "cumulative_time_ms": round(self.cumulative_time * 1000, 3),
+            "queries": self.queries,
+        }
+
+
+class _PageProfiler:
+    """Collects component timings while active.
+
+    Components run within one another are tracked on a stack, so that the time and
+    queries of each are only counted against the innermost running component.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.components = {}
+        self.stack = []
+
+    @contextmanager
+    def profile(self):
+        """Context manager to collect component timings within.
+
+        Collected timings are kept after exiting, until profiling starts again.
+        """
+        if self.active:
+            raise RuntimeError("Page profiling is already active.")
+
+        self.components = {}
+        self.stack = []
+        with ExitStack() as stack:
+            for component, (owner_path, attribute) in PROFILE_HOOKS.items():
+                wrapper_factory = self._component_wrapper(component)
+                stack.enter_context(self._hook(import_string(owner_path), attribute, wrapper_factory))
+            for node_path in PROFILE_TAG_NODES:
+                stack.enter_context(self._hook(import_string(node_path), "render", self._tag_node_wrapper))
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(self._count_query))
+
+            self.active = True
+            try:
+                yield self
+            finally:
+                self.active = False
+
+    @contextmanager
+    def component(self, name):
+        """Context manager to time a component. Does nothing unless profiling is active."""
+        if not self.active:
+            yield
+            return
+
+        timing = self.components.setdefault(name, ComponentTiming())
+        timing.calls += 1
+        # Stack entries are [component name, child component time].
+        entry = [name, 0.0]
+        self.stack.append(entry)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.stack.pop()
+            timing.time += elapsed - entry[1]
+            # Recursive components, such as nested menu trees, only count the outermost call as cumulative.
+            if not any(stack_name == name for stack_name, _ in self.stack):
+                timing.cumulative_time += elapsed
+            if self.stack:
+                self.stack[-1][1] += elapsed
+
+    def get_report(self, total_time, total_queries):
+        """Get the collected timings, as a dict of component name to timings dict.
+
+        :param total_time: Time of the whole profiled request, in seconds.
+            Time not counted against any component is reported as the "other" component.
+        :param total_queries: Queries of the whole profiled request.
+        """
+        other = ComponentTiming()
+        other.calls = 1
+        other.time = other.cumulative_time = max(total_time - sum(t.time for t in self.components.values()), 0.0)
+        other.queries = max(total_queries - sum(t.queries for t in self.components.values()), 0)
+
+        report = {name: timing.as_dict() for name, timing in sorted(self.components.items())}
+        report[OTHER_COMPONENT] = other.as_dict()
+        return report
+
+    @contextmanager
+    def _hook(self, owner, attribute, wrapper_factory):
+        """Replace a callable with a timed wrapper of it, restoring the original on exit."""
+        original = inspect.getattr_static(owner, attribute)
+        has_own_attribute = attribute in vars(owner)
+        if isinstance(owner, type):
+            # Wrap the function, which is then bound as usual.
+            setattr(owner, attribute, wrapper_factory(original))
+        else:
+            # Singleton instance. Wrap the already bound method.
+            setattr(owner, attribute, wrapper_factory(getattr(owner, attribute)))
+        try:
+            yield
+        finally:
+            if has_own_attribute:
+                setattr(owner, attribute, original)
+            else:
+                delattr(owner, attribute)
+
+    def _component_wrapper(self, name):
+        """Get a wrapper factory, that times calls as the given component."""
+
+        def wrapper_factory(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.component(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return wrapper_factory
+
+    def _tag_node_wrapper(self, render):
+        """Wrap a template tag node render method, timing package tags by tag function name."""
+
+        @wraps(render)
+        def wrapper(node, context):
+            if not getattr(node.func, "__module__", "").startswith("adminlte2_pdq."):
+                return render(node, context)
+            with self.component(f"tag.{node.func.__name__}"):
+                return render(node, context)
+
+        return wrapper
+
+    def _count_query(self, execute, sql, params, many, context):  # pylint:disable=too-many-arguments
+        """Database execute wrapper, counting the query against the running component."""
+        if self.stack:
+            self.components[self.stack[-1][0]].queries += 1
+        return execute(sql, params, many, context)
+
+
+# Make the page profiler instance.
+PageProfiler = _PageProfiler()
+
+
+class QueryCounter:
+    """Database execute wrapper, counting all queries."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):  # pylint:disable=too-many-arguments
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def get_profile_client(user=None, host=None):
+    """Get a test client to profile requests with.
+
+    Logging in saves a session, so call close_profile_client() once done.
+
+    :param user: User to log in as. Defaults to an anonymous user.
+    :param host: Host to make requests to. Defaults to the first ALLOWED_HOSTS entry that isn't a wildcard.
+    """
+    if host is None:
+        host = next((host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"), "localhost")
+
+    client = Client(HTTP_HOST=host)
+    if user is not None:
+        client.force_login(user)
+    return client
+
+
+def close_profile_client(client):
+    """Delete the session of a profile client, if it has one, so that profiling leaves no sessions behind."""
+    if settings.SESSION_COOKIE_NAME in client.cookies:
+        client.session.delete()
+
+
+def _get_profile_top(profile, top):
+    """Get the top functions of a cProfile run, by cumulative time."""
+    stats = pstats.Stats(profile)
+    stats.strip_dirs()
+
+    functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    return [
+        {
+            "function": pstats.func_std_string(function),
+            "calls": calls,
+            "time_ms": round(total_time * 1000, 3),
+            "cumulative_time_ms": round(cumulative_time * 1000, 3),
+        }
+        for function, (_, calls, total_time, cumulative_time, _) in functions
+    ]
+
+
+def profile_request(client, path):
+    """Request a path with a test client, collecting the package component timings in PageProfiler.
+
+    :return: Tuple of the response, the request time in seconds, and the number of queries made by the request.
+    """
+    query_counter = QueryCounter()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(query_counter))
+        with PageProfiler.profile():
+            # Load the middleware again, as the handler binds the view handler method (the "view" hook) when
+            # loading middleware. Otherwise the unhooked method, bound on the first request, would be called.
+            client.handler.load_middleware()
+            start_time = time.perf_counter()
+            response = client.get(path)
+            total_time = time.perf_counter() - start_time
+
+    return response, total_time, query_counter.count
+
+
+def profile_page(path, user=None, host=None, warm=True, top=20):
+    """Request a page through the test client, and profile the package components that render it.
+
+    Component timings and cProfile stats are taken from separate requests, as cProfile slows every call.
+
+    :param path: Url path of the page, such as "/home/".
+    :param user: User to request the page as. Defaults to an anonymous user.
+    :param host: Host to request the page from. See get_profile_client().
+    :param warm: Whether to make an unprofiled request first, so that first use caches don't count.
+    :param top: Number of functions to report from cProfile, by cumulative time. 0 to skip cProfile.
+    :return: Dict of the profile report.
+    """
+    client = get_profile_client(user, host)
+    try:
+        report = _profile_page(client, path, user, warm, top)
+    finally:
+        close_profile_client(client)
+
+    return report
+
+
+def _profile_page(client, path, user, warm, top):
+    """Profile a page with the given client. See profile_page()."""
+    if warm:
+        client.get(path)
+
+    response, total_time, total_queries = profile_request(client, path)
+
+    report = {
+        "path": path,
+        "user": user.get_username() if user is not None else None,
+        "status_code": response.status_code,
+        "time_ms": round(total_time * 1000, 3),
+        "queries": total_queries,
+        "components": PageProfiler.get_report(total_time, total_queries),
+        "profile": [],
+    }
+
+    if top:
+        profile = cProfile.Profile()
+        profile.runcall(client.get, path)
+        report["profile"] = _get_profile_top(profile, top)
+
+    return report
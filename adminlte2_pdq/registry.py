@@ -0,0 +1,104 @@
+"""Django AdminLTE2 View Policy Registry"""
+
+# System Imports.
+import warnings
+
+
+class _ViewPolicyRegistry:
+    """Registry of class-based views that use the package authentication mixins.
+
+    Maps each view class (and its fully qualified "module.QualName" string) to a policy record,
+    so that lookups are a single dict access, and views that share a class name across apps
+    do not collide.
+    """
+
+    def __init__(self):
+        self.by_class = {}
+        self.by_qualified_name = {}
+
+    def register(self, view_class):
+        """Register (or re-register) a view class, using its current admin_pdq_data values.
+
+        Called by the package mixins upon a class inheriting them. Policy values are read from the
+        class itself, so that the record matches what Python attribute lookup (MRO) resolves to.
+        """
+
+        admin_pdq_data = getattr(view_class, "admin_pdq_data", {})
+        qualified_name = self.get_qualified_name(view_class)
+
+        record = {
+            "view_class": view_class,
+            "qualified_name": qualified_name,
+            "decorator_name": admin_pdq_data.get("decorator_name", ""),
+            "allow_anonymous_access": admin_pdq_data.get("allow_anonymous_access", False),
+            "login_required": admin_pdq_data.get("login_required", False),
+            "allow_without_permissions": admin_pdq_data.get("allow_without_permissions", False),
+        }
+
+        self.by_class[view_class] = record
+        self.by_qualified_name[qualified_name] = record
+
+        return record
+
+    def get(self, view, default=None):
+        """Get the policy record for a view class or a fully qualified view name string.
+
+        :param view: View class, or fully qualified "module.QualName" string (such as a url lookup_str).
+        :param default: Value to return if the view is not registered.
+        :return: Policy record dict, or default.
+        """
+        if isinstance(view, str):
+            return self.by_qualified_name.get(view, default)
+        return self.by_class.get(view, default)
+
+    def get_admin_pdq_data(self, view_class):
+        """Get the admin_pdq_data for a class-based view.
+
+        Registered views return their policy record. Unregistered views fall back to whatever
+        admin_pdq_data the class may define (such as the middleware strict-mode default).
+        """
+        record = self.by_class.get(view_class)
+        if record is not None:
+            return record
+        return getattr(view_class, "admin_pdq_data", {})
+
+    def __contains__(self, view):
+        if isinstance(view, str):
+            return view in self.by_qualified_name
+        return view in self.by_class
+
+    def __len__(self):
+        return len(self.by_class)
+
+    @staticmethod
+    def get_qualified_name(view_class):
+        """Get the fully qualified name of a view class. Matches Django's URLPattern.lookup_str format."""
+        return f"{view_class.__module__}.{view_class.__qualname__}"
+
+
+# Make the registry instance.
+VIEW_POLICY_REGISTRY = _ViewPolicyRegistry()
+
+
+class RegisteredSubclassNames:
+    """Deprecated "subclasses" attribute of the package mixins. Use VIEW_POLICY_REGISTRY instead.
+
+    Gives the class names of all registered views that inherit the mixin, in the order that they were defined.
+    Same as the list that each mixin used to keep, but built from the registry, so is read only.
+    """
+
+    def __init__(self):
+        self.mixin = None
+
+    def __set_name__(self, owner, name):
+        self.mixin = owner
+
+    def __get__(self, instance, owner=None):
+        warnings.warn(
+            f"{self.mixin.__name__}.subclasses is deprecated. Use adminlte2_pdq.registry.VIEW_POLICY_REGISTRY.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return [
+            view_class.__name__ for view_class in VIEW_POLICY_REGISTRY.by_class if issubclass(view_class, self.mixin)
+        ]
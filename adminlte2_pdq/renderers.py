@@ -0,0 +1,192 @@
+"""Django AdminLte2Pdq form renderers."""
+
+# Third-Party Imports.
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.forms.renderers import DjangoTemplates
+from django.template import Context, Engine
+from django.template.autoreload import get_template_directories
+from django.utils.autoreload import file_changed
+
+# Internal Imports.
+from .constants import ASTERISK_REQUIRED_FIELDS, BOLD_REQUIRED_FIELDS
+
+
+# Partial templates included by the form templates, by their key within the "adminlte2_partials" context value.
+FORM_PARTIALS = {
+    "checkbox": "adminlte2/partials/_form/_checkbox.html",
+    "checkbox_select": "adminlte2/partials/_form/_checkbox_select.html",
+    "date": "adminlte2/partials/_form/_date.html",
+    "datetime": "adminlte2/partials/_form/_datetime.html",
+    "field_error": "adminlte2/partials/_form/_field_error.html",
+    "file": "adminlte2/partials/_form/_file.html",
+    "radio": "adminlte2/partials/_form/_radio.html",
+    "select": "adminlte2/partials/_form/_select.html",
+    "text": "adminlte2/partials/_form/_text.html",
+    "time": "adminlte2/partials/_form/_time.html",
+    "formset_start": "adminlte2/partials/_horizontal_formset/_start.html",
+    "formset_form": "adminlte2/partials/_horizontal_formset/_form.html",
+    "formset_end": "adminlte2/partials/_horizontal_formset/_end.html",
+}
+
+# Widget class names, mapped to the key of the partial template that renders the widget.
+# Widgets not listed are rendered by the "text" partial.
+WIDGET_PARTIALS = {
+    "CheckboxInput": "checkbox",
+    "Select": "select",
+    "NullBooleanSelect": "select",
+    "SelectMultiple": "select",
+    "RadioSelect": "radio",
+    "CheckboxSelectMultiple": "checkbox_select",
+    "ClearableFileInput": "file",
+}
+
+
+class _PartialTemplates:
+    """Compiled partial templates for the form template tags.
+
+    Passed to the form templates as "adminlte2_partials", so that each "{% include %}" renders
+    an already compiled template, instead of going back to the template loaders.
+    Built on first use, and cleared whenever the templates may have changed.
+    """
+
+    def __init__(self):
+        self.templates = None
+
+    def get(self):
+        """Get the dict of partial key to compiled template."""
+        templates = self.templates
+        if templates is None:
+            engine = Engine.get_default()
+            templates = self.templates = {key: engine.get_template(name) for key, name in FORM_PARTIALS.items()}
+        return templates
+
+    def clear(self):
+        """Clear all compiled templates."""
+        self.templates = None
+
+
+# Make the partial templates instance.
+PARTIAL_TEMPLATES = _PartialTemplates()
+
+
+def clear_compiled_templates():
+    """Clear the partial templates, so they are compiled again on next use."""
+    PARTIAL_TEMPLATES.clear()
+
+
+@receiver(setting_changed)
+def _reset_compiled_templates(*, setting, **kwargs):
+    """Clear compiled templates when template settings change, as they may be stale."""
+    if setting == "TEMPLATES":
+        clear_compiled_templates()
+
+
+@receiver(file_changed, dispatch_uid="adminlte2_pdq_template_changed")
+def _reset_compiled_templates_on_file_change(*, file_path, **kwargs):
+    """Clear compiled templates when the development server autoreloader sees a template file change.
+
+    Mirrors Django's own template autoreload check. Does not return True, so Django's handling is unaffected.
+    """
+    if file_path.suffix == ".py":
+        return
+
+    for template_dir in get_template_directories():
+        if template_dir in file_path.parents:
+            clear_compiled_templates()
+            return
+
+
+def get_fields_context(fields_to_render, labels=True, media=None):
+    """Get the context for the _form.html and _horizontal_form.html templates.
+
+    :param fields_to_render: Iterable of bound fields to render.
+    :param labels: Whether to use labels for fields. Defaults to True.
+    :param media: Media that needs to be used in the form. Defaults to None.
+    :return: Context to use with template.
+    """
+    hidden_fields = []
+    visible_fields = []
+    for bound_field in fields_to_render:
+        if bound_field.field.widget.is_hidden:
+            hidden_fields.append(bound_field)
+        else:
+            visible_fields.append(bound_field)
+    return {
+        "fields_to_render": fields_to_render,
+        "bold_required": BOLD_REQUIRED_FIELDS,
+        "asterisk_required": ASTERISK_REQUIRED_FIELDS,
+        "hidden_fields": hidden_fields,
+        "visible_fields": visible_fields,
+        "labels": labels,
+        "media": media,
+        "adminlte2_partials": PARTIAL_TEMPLATES.get(),
+    }
+
+
+class AdminLteFormRenderer(DjangoTemplates):
+    """Form renderer that renders forms the same as the render_form template tag.
+
+    Set as the FORM_RENDERER setting, or as the "default_renderer" attribute of a form,
+    to have "{{ form }}" render in the AdminLTE2 vertical layout. Requires Django 4.1 or later,
+    where forms render via the form_template_name of their renderer.
+    Widgets, and any other templates, are rendered as normal.
+    """
+
+    form_template_name = "adminlte2/partials/_form.html"
+
+    def render(self, template_name, context, request=None):
+        form = context.get("form")
+        if template_name == self.form_template_name and form is not None:
+            context = get_fields_context(list(form), media=form.media)
+
+        return super().render(template_name, context, request=request)
+
+
+class AdminLteHorizontalFormRenderer(AdminLteFormRenderer):
+    """Form renderer that renders forms the same as the render_horizontal_form template tag."""
+
+    form_template_name = "adminlte2/partials/_horizontal_form.html"
+
+
+def stream_horizontal_formset(formset, section_heading, forms_per_chunk=20):
+    """Generator that renders a horizontal formset in chunks, for use with a StreamingHttpResponse.
+
+    Output matches the render_horizontal_formset template tag, rendered via the same partial templates.
+    Yields the formset header (including the management form), then the rendered forms in groups of
+    forms_per_chunk, then the formset footer. Only one chunk of rendered html is held in memory at a time.
+
+    :param formset: The formset to render.
+    :param section_heading: The section header to render.
+    :param forms_per_chunk: Number of forms to render per yielded chunk. Defaults to 20.
+    :return: Generator of rendered html strings.
+    """
+    partials = PARTIAL_TEMPLATES.get()
+    start_template = partials["formset_start"]
+    form_template = partials["formset_form"]
+    end_template = partials["formset_end"]
+
+    # Single context for the entire formset. Per-form values are pushed on top of it.
+    context = Context(
+        {
+            "formset": formset,
+            "section_heading": section_heading,
+            "adminlte2_partials": partials,
+        }
+    )
+
+    yield start_template.render(context)
+
+    chunk = []
+    for form in formset:
+        with context.push(form=form):
+            chunk.append(form_template.render(context))
+
+        if len(chunk) >= forms_per_chunk:
+            yield "".join(chunk)
+            chunk = []
+
+    if chunk:
+        yield "".join(chunk)
+
+    yield end_template.render(context)
@@ -1,38 +1,32 @@
 """Django AdminLTE2 Admin Control Sidebar"""
 
 from django import template
-from django.conf import settings
+
+from adminlte2_pdq.ui_settings import UISettings
 
 register = template.Library()
 
 
-@register.inclusion_tag("admin/partials/_control_sidebar/_tabs.html")
-def show_control_sidebar_tabs():
-    """Show the control sidebar tabs"""
+def _get_recent_activity(user):
+    """Get the cached recent activity of a user.
 
-    # Default the show recent activity tab to true
-    default_dict = {
-        "SHOW_RECENT_ACTIVITY_TAB": True,
-    }
+    Imported on use, as the admin LogEntry model is only available when the admin app is installed.
+    """
+    from adminlte2_pdq.admin_activity import get_recent_activity  # pylint:disable=import-outside-toplevel
+
+    return get_recent_activity(user)
 
-    # Pull the settings for the control sidebar from settings.
-    # It is possible that the show recent activity will be
-    # overridden by the settings
-    control_sidebar_tabs = {
-        **default_dict,
-        **getattr(settings, "ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS", {}),
-    }
 
-    # Get the number of tabs that should be shown. This sums up the values
-    # of the dictionary representing the control sidebar. Each value is a
-    # boolean. Despite the fact that they values are booleans, the sum operation
-    # will work since False = 0 and True = 1. Therefore, one setting set to
-    # true will yield True, and 3 settings set to try will yield 3.
-    number_of_tabs = sum(control_sidebar_tabs.values())
+@register.inclusion_tag("admin/partials/_control_sidebar/_tabs.html")
+def show_control_sidebar_tabs():
+    """Show the control sidebar tabs"""
 
-    # If the number of tabs is greater than 1, we will turn the control sidebar
-    # into tabs. If it is 0 or 1 tab, it will not render the tabs part.
-    show_tabs = number_of_tabs > 1
+    # Pull the control sidebar settings from the cached snapshot. The snapshot
+    # defaults the show recent activity tab to true, and determines if there is
+    # more than 1 tab, in which case the control sidebar is turned into tabs.
+    ui_settings = UISettings.get()
+    control_sidebar_tabs = ui_settings.control_sidebar_tabs
+    show_tabs = ui_settings.show_control_sidebar_tabs
 
     return {
         "show_csb_tabs": show_tabs,
@@ -58,32 +52,29 @@ def show_control_sidebar_tabs():
 def show_control_sidebar_recent_activity_tab_pane(context):
     """Show the control sidebar recent activity tab pane"""
 
-    control_sidebar_tabs = getattr(
-        settings,
-        "ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS",
-        {},
-    )
+    control_sidebar_tabs = UISettings.get().control_sidebar_tabs
 
     show_tab_pane = control_sidebar_tabs.get(
         "SHOW_RECENT_ACTIVITY_TAB",
         True,
     )
 
-    new_context = context.flatten()
-    new_context.update(
-        {
-            "show_csb_recent_activity_tab_pane": show_tab_pane,
-        }
-    )
+    user = context.get("user")
 
-    return new_context
+    # Only pass along what the pane uses, instead of a copy of the full admin context.
+    return {
+        "show_csb_recent_activity_tab_pane": show_tab_pane,
+        "admin_log": _get_recent_activity(user) if show_tab_pane else [],
+        "request": context.get("request"),
+        "user": user,
+    }
 
 
 @register.inclusion_tag("admin/partials/_control_sidebar/_settings_tab_pane.html")
 def show_control_sidebar_settings_tab_pane():
     """Show control sidebar settings tab pane"""
 
-    control_sidebar_tabs = getattr(settings, "ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS", {})
+    control_sidebar_tabs = UISettings.get().control_sidebar_tabs
 
     show_tab_pane = control_sidebar_tabs.get(
         "SHOW_SETTINGS_TAB",
@@ -104,7 +95,7 @@ def show_control_sidebar_settings_tab_pane():
 def show_control_sidebar_extra_tab_panes():
     """Show control sidebar extra tab panes"""
 
-    control_sidebar_tabs = getattr(settings, "ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS", {})
+    control_sidebar_tabs = UISettings.get().control_sidebar_tabs
 
     show_tab_pane = control_sidebar_tabs.get(
         "SHOW_EXTRA_TABS",
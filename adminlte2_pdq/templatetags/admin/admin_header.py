@@ -1,7 +1,8 @@
 """Django AdminLTE2 Admin Header"""
 
 from django import template
-from django.conf import settings
+
+from adminlte2_pdq.ui_settings import UISettings
 
 register = template.Library()
 
@@ -10,17 +11,6 @@ register = template.Library()
 def show_control_sidebar_button():
     """Show control sidebar button"""
 
-    default_dict = {
-        "SHOW_RECENT_ACTIVITY_TAB": True,
-    }
-
-    control_sidebar_tabs = {
-        **default_dict,
-        **getattr(settings, "ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS", {}),
-    }
-
-    number_of_tabs = sum(control_sidebar_tabs.values())
-
-    show_button = number_of_tabs > 0
+    show_button = UISettings.get().show_control_sidebar_button
 
     return {"show_control_sidebar_button": show_button}
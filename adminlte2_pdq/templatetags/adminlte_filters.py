@@ -6,16 +6,158 @@ attributes that the user would like the form fields to have.
 """
 
 # System Imports.
+import copy
 import json
+from functools import lru_cache
 
 # Third-Party Imports.
 from django import template
+from django.template.base import Variable
+
+# Internal Imports.
+from adminlte2_pdq import message_channel, renderers
 
 
 # Template tag registration.
 register = template.Library()
 
 
+# Default values for field attributes, when the attribute is provided without a value.
+DEFAULT_PATTERN = "\\([0-9]{3}\\) [0-9]{3}-[0-9]{4}"
+DEFAULT_INPUTMASK = "(999) 999-9999"
+DEFAULT_MIN = 0
+DEFAULT_MAX = 100
+
+
+@lru_cache(maxsize=256)
+def _load_json_attrs(attrs_as_json):
+    """Parse a json string of attributes. Cached, as filter arguments are usually template literals.
+
+    Returned dict is shared between calls, so must not be modified.
+    """
+    return json.loads(attrs_as_json)
+
+
+class _FieldAttrsOverlay:
+    """Attribute changes to apply when rendering a form field, as collected from field_attrs tag arguments."""
+
+    __slots__ = ("attrs", "classes", "placeholder", "input_type")
+
+    def __init__(self):
+        self.attrs = {}
+        self.classes = []
+        self.placeholder = None
+        self.input_type = None
+
+    def copy(self):
+        """Get a copy of overlay, to apply further render-time values to."""
+        overlay = _FieldAttrsOverlay()
+        overlay.attrs = dict(self.attrs)
+        overlay.classes = list(self.classes)
+        overlay.placeholder = self.placeholder
+        overlay.input_type = self.input_type
+        return overlay
+
+    def apply(self, key, value):
+        """Apply a single field_attrs argument. Same handling as the equivalent "with_" filter."""
+
+        if key == "attrs":
+            self.attrs.update(_load_json_attrs(value) if isinstance(value, str) else value)
+        elif key == "data":
+            data_attrs = _load_json_attrs(value) if isinstance(value, str) else value
+            self.attrs.update({f"data-{data_key}": data_value for data_key, data_value in data_attrs.items()})
+        elif key == "class":
+            self.classes.append(value)
+        elif key == "placeholder":
+            # Empty placeholder means to default to the field label. Does not replace an explicit placeholder.
+            if value or self.placeholder is None:
+                self.placeholder = value or ""
+        elif key == "type":
+            self.input_type = value
+        elif key == "pattern":
+            self.attrs["pattern"] = DEFAULT_PATTERN if value is None else value
+        elif key == "inputmask":
+            self.attrs["data-inputmask"] = f"'mask':'{DEFAULT_INPUTMASK if value is None else value}'"
+        elif key == "min":
+            self.attrs["min"] = DEFAULT_MIN if value is None else value
+        elif key == "max":
+            self.attrs["max"] = DEFAULT_MAX if value is None else value
+        else:
+            # Includes "list", which defaults to the field name at render time, if None.
+            self.attrs[key] = value
+
+    def render(self, field):
+        """Render the field widget with the overlay, without modifying the field widget itself."""
+        widget = field.field.widget
+        attrs = dict(self.attrs)
+
+        if self.classes:
+            # Appended to any class set via attrs, which itself replaces the class of the widget.
+            base_class = attrs.get("class", widget.attrs.get("class", ""))
+            attrs["class"] = " ".join(base_class.split() + self.classes)
+
+        # Default placeholder to field label, if the widget does not already have a placeholder.
+        if self.placeholder:
+            attrs["placeholder"] = self.placeholder
+        elif self.placeholder is not None and "placeholder" not in widget.attrs:
+            attrs["placeholder"] = field.label
+
+        if "list" in attrs and attrs["list"] is None:
+            attrs["list"] = f"{field.name}_list"
+
+        if self.input_type:
+            widget = copy.copy(widget)
+            widget.input_type = self.input_type
+
+        # Same as rendering the bound field itself, which includes the initial value for show_hidden_initial.
+        if field.field.show_hidden_initial:
+            return field.as_widget(widget=widget, attrs=attrs) + field.as_hidden(only_initial=True)
+        return field.as_widget(widget=widget, attrs=attrs)
+
+
+class _BoundFieldOverlay:
+    """Bound field proxy, which collects attribute changes from chained "with_" filters.
+
+    Changes are applied once, when the field is rendered. The field widget itself is left unmodified,
+    so changes do not leak into other renders of the same form instance.
+    """
+
+    __slots__ = ("bound_field", "overlay")
+
+    def __init__(self, bound_field):
+        self.bound_field = bound_field
+        self.overlay = _FieldAttrsOverlay()
+
+    def __getattr__(self, name):
+        return getattr(self.bound_field, name)
+
+    def __str__(self):
+        return self.overlay.render(self.bound_field)
+
+    def __html__(self):
+        return str(self)
+
+    def __bool__(self):
+        return bool(self.bound_field)
+
+    def __iter__(self):
+        return iter(self.bound_field)
+
+    def __len__(self):
+        return len(self.bound_field)
+
+    def __getitem__(self, idx):
+        return self.bound_field[idx]
+
+
+def _with_overlay(field, key, value):
+    """Apply a single attribute change to the overlay of a field, creating the overlay if needed."""
+    if not isinstance(field, _BoundFieldOverlay):
+        field = _BoundFieldOverlay(field)
+    field.overlay.apply(key, value)
+    return field
+
+
 @register.filter("fieldtype")
 def fieldtype(field):
     """
@@ -28,6 +170,22 @@ def fieldtype(field):
     return field.field.widget.__class__.__name__
 
 
+@register.filter("form_partial")
+def form_partial(field, partials=None):
+    """
+    Get the partial template that renders a given field, by the class of its widget.
+
+    :param field: Form Field to get the partial template of.
+    :param partials: Dict of compiled partial templates, as passed to the form templates as "adminlte2_partials".
+     Defaults to None, to get the partial template name instead.
+    :return: Compiled partial template, or partial template name.
+    """
+    key = renderers.WIDGET_PARTIALS.get(field.field.widget.__class__.__name__, "text")
+    if partials:
+        return partials[key]
+    return renderers.FORM_PARTIALS[key]
+
+
 @register.filter("with_attrs")
 def with_attrs(field, attrs_as_json=None):
     """
@@ -42,22 +200,15 @@ def with_attrs(field, attrs_as_json=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_attrs:'{"attribute-1":"value-1", "attribute-2":"value-2"}' %}
-            {% field %}
+            {{ field|with_attrs:'{"attribute-1":"value-1", "attribute-2":"value-2"}' }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="text" name="field" attribute-1="value-1" attribute-2="value-2" id="id_field" />
     """
 
-    attrs_as_json = attrs_as_json or {}
-    attrs = field.field.widget.attrs
-    data_attrs = json.loads(attrs_as_json)
-    for key, value in data_attrs.items():
-        attrs[f"{key}"] = value
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-    return field
+    return _with_overlay(field, "attrs", attrs_as_json or {})
 
 
 @register.filter("with_class")
@@ -73,23 +224,17 @@ def with_class(field, class_name=""):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_class:'my-added-class' %}
-            {% field %}
+            {{ field|with_class:'my-added-class' }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="text" name="field" class="my-added-class" id="id_field" />
     """
 
     if not field:
         return field
-    attrs = field.field.widget.attrs
-    current_class_list = attrs.get("class", "").split()
-    current_class_list.append(class_name)
-    attrs["class"] = " ".join(current_class_list)
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-    return field
+    return _with_overlay(field, "class", class_name)
 
 
 @register.filter("with_data")
@@ -105,11 +250,10 @@ def with_data(field, data_attrs_json=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_data:'{"attribute-1":"value-1", "attribute-2":"value-2"}' %}
-            {% field %}
+            {{ field|with_data:'{"attribute-1":"value-1", "attribute-2":"value-2"}' }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input
             type="text"
@@ -120,13 +264,7 @@ def with_data(field, data_attrs_json=None):
         />
     """
 
-    data_attrs_json = data_attrs_json or {}
-    attrs = field.field.widget.attrs
-    data_attrs = json.loads(data_attrs_json)
-    for key, value in data_attrs.items():
-        attrs[f"data-{key}"] = value
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-    return field
+    return _with_overlay(field, "data", data_attrs_json or {})
 
 
 @register.filter("with_placeholder")
@@ -142,11 +280,10 @@ def with_placeholder(field, placeholder=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_placeholder 'My Placeholder Text' %}
-            {% field %}
+            {{ field|with_placeholder:'My Placeholder Text' }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input
             type="text"
@@ -159,15 +296,7 @@ def with_placeholder(field, placeholder=None):
     # Default placeholder to field.label if the widget does not already have
     # a placeholder, and a value was not sent to the method.
     # Assume that if a value for placeholder was sent in, we are using it.
-    if not placeholder and "placeholder" not in field.field.widget.attrs:
-        placeholder = field.label
-
-    if placeholder:
-        attrs = field.field.widget.attrs
-        attrs["placeholder"] = placeholder
-        field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-
-    return field
+    return _with_overlay(field, "placeholder", placeholder)
 
 
 @register.filter("with_list")
@@ -186,23 +315,15 @@ def with_list(field, name=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_list:"my_awesome_list" %}
-            {% field %}
+            {{ field|with_list:"my_awesome_list" }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="text" name="field" list="my_awesome_list" id="id_field" />
 
     """
-    if name is None:
-        name = f"{field.name}_list"
-
-    attrs = field.field.widget.attrs
-    attrs["list"] = name
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-
-    return field
+    return _with_overlay(field, "list", name)
 
 
 @register.filter("with_pattern")
@@ -231,22 +352,14 @@ def with_pattern(field, pattern=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_pattern:field.pattern %}
-            {% field %}
+            {{ field|with_pattern:field.pattern }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="tel" name="field" pattern="[0-9]{3}-[0-9]{3}-[0-9]{4}" id="id_field" />
     """
-    if pattern is None:
-        pattern = "\\([0-9]{3}\\) [0-9]{3}-[0-9]{4}"
-
-    attrs = field.field.widget.attrs
-    attrs["pattern"] = pattern
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-
-    return field
+    return _with_overlay(field, "pattern", pattern)
 
 
 @register.filter("with_inputmask")
@@ -267,22 +380,14 @@ def with_inputmask(field, inputmask=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_inputmask:'(999) 999-9999' %}
-            {% field %}
+            {{ field|with_inputmask:'(999) 999-9999' }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="tel" name="field" data-inputmask="'mask':'(999) 999-9999'" id="id_field" />
     """
-    if inputmask is None:
-        inputmask = ("(999) 999-9999",)
-
-    attrs = field.field.widget.attrs
-    attrs["data-inputmask"] = f"'mask':'{inputmask}'"
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-
-    return field
+    return _with_overlay(field, "inputmask", inputmask)
 
 
 @register.filter("with_min")
@@ -299,23 +404,15 @@ def with_min(field, min_val=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_min:5 %}
-            {% field %}
+            {{ field|with_min:5 }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="range" name="field" min="5" id="id_field" />
     """
 
-    if min_val is None:
-        min_val = 0
-
-    attrs = field.field.widget.attrs
-    attrs["min"] = min_val
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-
-    return field
+    return _with_overlay(field, "min", min_val)
 
 
 @register.filter("with_max")
@@ -332,23 +429,15 @@ def with_max(field, max_val=None):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_max:9 %}
-            {% field %}
+            {{ field|with_max:9 }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="range" name="field" max="9" id="id_field" />
     """
 
-    if max_val is None:
-        max_val = 100
-
-    attrs = field.field.widget.attrs
-    attrs["max"] = max_val
-    field.field.widget.attrs = {**field.field.widget.attrs, **attrs}
-
-    return field
+    return _with_overlay(field, "max", max_val)
 
 
 @register.filter("with_input_type")
@@ -364,17 +453,116 @@ def with_input_type(field, new_type):
 
         {% load adminlte_filters %}
         {% for field in form %}
-            {% field|with_input_type:'date' %}
-            {% field %}
+            {{ field|with_input_type:'date' }}
         {% endfor %}
 
-        Which will update the form field to look like the following:
+        Which will render the form field as the following:
 
         <input type="date" name="field" id="id_field" />
     """
 
-    field.field.widget.input_type = new_type
-    return field
+    return _with_overlay(field, "type", new_type)
+
+
+class FieldAttrsNode(template.Node):
+    """Node for the field_attrs tag. Holds all arguments which are constant, pre-applied at compile time."""
+
+    def __init__(self, field, static_overlay, dynamic_args):
+        self.field = field
+        self.static_overlay = static_overlay
+        self.dynamic_args = dynamic_args
+
+    def render(self, context):
+        field = self.field.resolve(context)
+        if not field:
+            return ""
+
+        overlay = self.static_overlay
+        if self.dynamic_args:
+            overlay = overlay.copy()
+            for key, value in self.dynamic_args:
+                overlay.apply(key, value.resolve(context, ignore_failures=True))
+
+        return overlay.render(field)
+
+
+def _is_constant(filter_expression):
+    """Determine if a compiled template argument is a literal, which can be resolved at compile time."""
+    if filter_expression.filters:
+        return False
+    var = filter_expression.var
+    return not isinstance(var, Variable) or (var.lookups is None and not var.translate)
+
+
+@register.tag("field_attrs")
+def field_attrs(parser, token):
+    """
+    Render a form field with any number of attributes added, in a single pass.
+
+    Equivalent to chaining the "with_" filters, except that constant arguments (including json)
+    are parsed once when the template is compiled.
+
+    Supported arguments:
+
+    * ``attrs`` - Json (or dict) of attributes, same as ``with_attrs``.
+    * ``data`` - Json (or dict) of data attributes, same as ``with_data``.
+    * ``class`` - Class to append to existing widget classes, same as ``with_class``.
+    * ``placeholder`` - Placeholder text. If provided without a value, defaults to the field label,
+      same as ``with_placeholder``.
+    * ``type`` - Input type, same as ``with_input_type``.
+    * ``pattern``, ``inputmask``, ``min``, ``max``, ``list`` - Same as the matching filters.
+    * Any other ``key=value`` is added as an attribute as-is.
+
+    Example::
+
+        {% load adminlte_filters %}
+        {% for field in form %}
+            {% field_attrs field attrs='{"attribute-1":"value-1"}' class="form-control" placeholder %}
+        {% endfor %}
+
+        Which will render the form field as the following:
+
+        <input
+            type="text"
+            name="field"
+            attribute-1="value-1"
+            class="form-control"
+            placeholder="Field"
+            id="id_field"
+        />
+    """
+
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a form field as the first argument.")
+
+    field = parser.compile_filter(bits[1])
+    static_overlay = _FieldAttrsOverlay()
+    dynamic_args = []
+
+    for bit in bits[2:]:
+        if "=" not in bit:
+            if bit != "placeholder":
+                raise template.TemplateSyntaxError(
+                    f"'{bits[0]}' tag received an invalid argument '{bit}'. Expected key=value arguments."
+                )
+            # Placeholder without a value, which defaults to field label.
+            static_overlay.apply("placeholder", "")
+            continue
+
+        key, value = bit.split("=", 1)
+        value = parser.compile_filter(value)
+
+        if not _is_constant(value):
+            dynamic_args.append((key, value))
+            continue
+
+        try:
+            static_overlay.apply(key, value.resolve(template.Context()))
+        except json.JSONDecodeError as err:
+            raise template.TemplateSyntaxError(f"'{bits[0]}' tag received invalid json for '{key}': {err}") from err
+
+    return FieldAttrsNode(field, static_overlay, dynamic_args)
 
 
 @register.filter("dir")
@@ -471,3 +659,14 @@ def modulo(a, b):
     :return: Result of the modulo operation.
     """
     return a % b
+
+
+@register.filter(name="group_messages")
+def group_messages(messages):
+    """
+    Group messages with the same level and text, so that each is only displayed once.
+
+    :param messages: Messages to group, such as the "messages" context variable.
+    :return: List of (message, count) pairs.
+    """
+    return message_channel.group_messages(messages)
@@ -4,21 +4,24 @@ Django AdminLTE2 Template Tags
 Collection of template tags to make rendering things easier.
 """
 
+from functools import lru_cache
 from hashlib import md5
 import logging
 
 from django import template
 from django.conf import settings
+from django.core.exceptions import NON_FIELD_ERRORS
 from django.urls import reverse
-from django.utils.safestring import mark_safe
 
 from adminlte2_pdq.constants import (
     DATETIME_WIDGET,
     DATE_WIDGET,
     TIME_WIDGET,
-    BOLD_REQUIRED_FIELDS,
-    ASTERISK_REQUIRED_FIELDS,
+    USE_LOCAL_AVATARS,
 )
+from adminlte2_pdq import renderers
+from adminlte2_pdq.asset_bundles import AssetBundles
+from adminlte2_pdq.ui_settings import UISettings
 
 
 # Logging Initialization.
@@ -34,6 +37,111 @@ register = template.Library()
 # |-----------------------------------------------------------------------------
 
 
+class _ErrorSummaryCollector:
+    """
+    Collects the error summary flags for a set of forms and formsets in a single pass.
+
+    Each form's error state is computed once per collector, and forms are skipped
+    entirely once every form level flag is known, unless the form has asked for
+    its field errors to be listed in the summary.
+    """
+
+    def __init__(self, errors=None):
+        if errors is None:
+            errors = {
+                "forms": [],
+                "has_non_form_errors": False,
+                "has_non_field_errors": False,
+                "has_field_errors": False,
+            }
+        self.errors = errors
+        self._form_states = {}
+
+    @property
+    def form_flags_known(self):
+        """Whether further forms can no longer change the form level flags."""
+        return self.errors["has_field_errors"] and self.errors["has_non_field_errors"]
+
+    def get_form_state(self, form):
+        """
+        Get a (has_field_errors, has_non_field_errors) tuple for a form.
+
+        Reads form.errors exactly once per form.
+        """
+        state = self._form_states.get(id(form))
+        if state is None:
+            form_errors = form.errors
+            has_non_field_errors = NON_FIELD_ERRORS in form_errors
+            # Any error key other than the non field key belongs to a field.
+            has_field_errors = len(form_errors) > has_non_field_errors
+            state = (has_field_errors, has_non_field_errors)
+            self._form_states[id(form)] = state
+        return state
+
+    def add_formset(self, formset):
+        """
+        Inspect a formset, and its forms, and update the error flags.
+
+        :param formset: formset that may have errors.
+        :return: errors.
+        """
+        try:
+            # If the formset has opted in for using the error summary
+            if getattr(formset, "adminlte2_use_error_summary", True):
+                if formset.non_form_errors():
+                    self.errors["has_non_form_errors"] = True
+
+                # Only bound forms can be marked for deletion, and have the cleaned data to check it with.
+                can_delete = formset.can_delete and formset.is_bound
+                for form in formset.forms:
+                    # Match is_valid(), which ignores forms marked for deletion.
+                    if can_delete and formset._should_delete_form(form):  # pylint: disable=protected-access
+                        continue
+                    self.add_form(form)
+            return self.errors
+        # Trying to access a property that does not exist. Give some helpful text in error.
+        except AttributeError as attribute_error:
+            error_message = (
+                f"The object that you are trying to use for rendering out the formset"
+                f" and it's subsequent formset errors does not contain required attributes."
+                f" Original Error: {attribute_error}"
+            )
+            raise AttributeError(error_message) from attribute_error
+
+    def add_form(self, form):
+        """
+        Inspect a form and update the error flags.
+
+        :param form: form that may have errors.
+        :return: errors.
+        """
+        try:
+            # Determine error options.
+            use_error_summary = getattr(form, "adminlte2_use_error_summary", True)
+            show_field_errors_in_summary = getattr(form, "adminlte2_show_field_errors_in_summary", False)
+
+            # If the form has not disabled using the error summary, and could still change the summary.
+            if use_error_summary and (show_field_errors_in_summary or not self.form_flags_known):
+                has_field_errors, has_non_field_errors = self.get_form_state(form)
+
+                if has_field_errors:
+                    self.errors["has_field_errors"] = True
+                    if show_field_errors_in_summary:
+                        self.errors["forms"].append(form)
+                if has_non_field_errors:
+                    self.errors["has_non_field_errors"] = True
+
+            return self.errors
+        # Trying to access property that does not exist. Give some helpful text in error.
+        except AttributeError as attribute_error:
+            error_message = (
+                f"The object that you are trying to use for rendering out the forms"
+                f" and it's subsequent form errors does not contain required attributes."
+                f" Original Error: {attribute_error}"
+            )
+            raise AttributeError(error_message) from attribute_error
+
+
 def _update_errors_with_formset_data(errors, formset):
     """
     Inspect a formset, determine what types of errors it has, and then return a
@@ -43,33 +151,7 @@ def _update_errors_with_formset_data(errors, formset):
     :param formset: formset that may have errors.
     :return: errors.
     """
-    try:
-        # Determine error options.
-        use_error_summary = getattr(formset, "adminlte2_use_error_summary", True)
-
-        # If the formset has opted in for using the error summary
-        if use_error_summary:
-            total_error_count = formset.total_error_count()
-            if total_error_count > 0:
-                non_form_error_count = len(formset.non_form_errors())
-                if non_form_error_count > 0:
-                    errors["has_non_form_errors"] = True
-
-                form_error_count = total_error_count - non_form_error_count
-                # If the formset has any errors at all
-                if form_error_count > 0:
-                    # Go through each form and collect the errors
-                    for form in formset.forms:
-                        _update_errors_with_form_data(errors, form)
-        return errors
-    # Trying to access a property that does not exist. Give some helpful text in error.
-    except AttributeError as attribute_error:
-        error_message = (
-            f"The object that you are trying to use for rendering out the formset"
-            f" and it's subsequent formset errors does not contain required attributes."
-            f" Original Error: {attribute_error}"
-        )
-        raise AttributeError(error_message) from attribute_error
+    return _ErrorSummaryCollector(errors).add_formset(formset)
 
 
 def _update_errors_with_form_data(errors, form):
@@ -81,38 +163,51 @@ def _update_errors_with_form_data(errors, form):
     :param form: form that may have errors.
     :return: errors.
     """
-    try:
-        # Determine error options.
-        use_error_summary = getattr(form, "adminlte2_use_error_summary", True)
-        show_field_errors_in_summary = getattr(form, "adminlte2_show_field_errors_in_summary", False)
-
-        # If the form has not disabled using the error summary
-        if use_error_summary:
-            # If the form has errors
-            if form.errors:
-                # If there are more field errors than non field errors, which will
-                # always be true unless the only errors are non field errors.
-                if len(form.errors) > len(form.non_field_errors()):
-                    errors["has_field_errors"] = True
-                    # The form could have field and non_field errors. Flip the non_field bool
-                    if form.non_field_errors():
-                        errors["has_non_field_errors"] = True
+    return _ErrorSummaryCollector(errors).add_form(form)
 
-                    if show_field_errors_in_summary:
-                        errors["forms"].append(form)
-                else:
-                    # The only errors are non_field_errors, so flip the bool
-                    errors["has_non_field_errors"] = True
-
-        return errors
-    # Trying to access property that does not exist. Give some helpful text in error.
-    except AttributeError as attribute_error:
-        error_message = (
-            f"The object that you are trying to use for rendering out the forms"
-            f" and it's subsequent form errors does not contain required attributes."
-            f" Original Error: {attribute_error}"
-        )
-        raise AttributeError(error_message) from attribute_error
+
+@lru_cache(maxsize=1024)
+def _get_email_hash(email):
+    """
+    Get the gravatar hash of an email.
+
+    Memoized, as the same few emails are hashed for the page header on every request.
+
+    :param email: Email to hash.
+    :return: Hex digest of the email.
+    """
+    return md5(email.encode("utf-8")).hexdigest()
+
+
+def _get_initials(first_name="", last_name=""):
+    """
+    Create initials from a first and/or last name.
+
+    :param first_name: First name of the user.
+    :param last_name: Last name of the user.
+    :return: Initials, or an empty string if neither name is provided.
+    """
+    if first_name and last_name:
+        return f"{first_name[0]} {last_name[0]}"
+    if first_name:
+        return f"{first_name[0]}"
+    if last_name:
+        return f"{last_name[0]}"
+    return ""
+
+
+def _get_local_avatar_url(initials, size):
+    """
+    Get the url of a locally rendered avatar image.
+
+    :param initials: Initials to show in the avatar. If empty, the default person avatar is used.
+    :param size: Size of the avatar, in pixels.
+    :return: Url of the package avatar view.
+    """
+    initials = "".join(initials.split())[:3]
+    if initials:
+        return reverse("adminlte2_pdq:avatar_initials", kwargs={"size": size, "initials": initials})
+    return reverse("adminlte2_pdq:avatar", kwargs={"size": size})
 
 
 # |-----------------------------------------------------------------------------
@@ -131,28 +226,24 @@ def render_form_error_summary(context):
     :return: Context for the template.
     """
 
-    # Initialize the errors dictionary
-    errors = {
-        "forms": [],
-        "has_non_form_errors": False,
-        "has_non_field_errors": False,
-        "has_field_errors": False,
-    }
+    # Collect every form and formset into the same errors dictionary.
+    collector = _ErrorSummaryCollector()
+    errors = collector.errors
 
     if "adminlte2_formset_list" in context:
         for formset in context["adminlte2_formset_list"]:
-            _update_errors_with_formset_data(errors, formset)
+            collector.add_formset(formset)
     elif "formset" in context:
-        _update_errors_with_formset_data(errors, context["formset"])
+        collector.add_formset(context["formset"])
         context["adminlte2_formset_list"] = [context["formset"]]
     else:
         context["adminlte2_formset_list"] = []
 
     if "adminlte2_form_list" in context:
         for form in context["adminlte2_form_list"]:
-            _update_errors_with_form_data(errors, form)
+            collector.add_form(form)
     elif "form" in context:
-        _update_errors_with_form_data(errors, context["form"])
+        collector.add_form(context["form"])
         context["adminlte2_form_list"] = [context["form"]]
     else:
         context["adminlte2_form_list"] = []
@@ -174,22 +265,7 @@ def render_fields(*fields_to_render, labels=True, media=None, **kwargs):
     :param media: Media that needs to be used in the form. Defaults to None.
     :return: Context to use with template.
     """
-    hidden_fields = []
-    visible_fields = []
-    for bound_field in fields_to_render:
-        if bound_field.field.widget.is_hidden:
-            hidden_fields.append(bound_field)
-        else:
-            visible_fields.append(bound_field)
-    return {
-        "fields_to_render": fields_to_render,
-        "bold_required": BOLD_REQUIRED_FIELDS,
-        "asterisk_required": ASTERISK_REQUIRED_FIELDS,
-        "hidden_fields": hidden_fields,
-        "visible_fields": visible_fields,
-        "labels": labels,
-        "media": media,
-    }
+    return renderers.get_fields_context(fields_to_render, labels=labels, media=media)
 
 
 @register.inclusion_tag("adminlte2/partials/_form.html")
@@ -219,22 +295,7 @@ def render_horizontal_fields(*fields_to_render, labels=True, media=None, **kwarg
     :param media: Media that needs to be used in the form. Defaults to None.
     :return: Context to use with template.
     """
-    hidden_fields = []
-    visible_fields = []
-    for bound_field in fields_to_render:
-        if bound_field.field.widget.is_hidden:
-            hidden_fields.append(bound_field)
-        else:
-            visible_fields.append(bound_field)
-    return {
-        "fields_to_render": fields_to_render,
-        "bold_required": BOLD_REQUIRED_FIELDS,
-        "asterisk_required": ASTERISK_REQUIRED_FIELDS,
-        "hidden_fields": hidden_fields,
-        "visible_fields": visible_fields,
-        "labels": labels,
-        "media": media,
-    }
+    return renderers.get_fields_context(fields_to_render, labels=labels, media=media)
 
 
 @register.inclusion_tag("adminlte2/partials/_horizontal_form.html")
@@ -266,6 +327,7 @@ def render_horizontal_formset(formset, section_heading):
     return {
         "formset": formset,
         "section_heading": section_heading,
+        "adminlte2_partials": renderers.PARTIAL_TEMPLATES.get(),
     }
 
 
@@ -289,25 +351,27 @@ def get_logout_url():
 @register.simple_tag()
 def get_home_url():
     """Get the home URL from the settings and default to the adminlte2_pdq home."""
-    return reverse(getattr(settings, "ADMINLTE2_HOME_ROUTE", "adminlte2_pdq:home"))
+    ui_settings = UISettings.get()
+    # Reverse again if the route did not resolve, so that the usual NoReverseMatch error is raised.
+    return ui_settings.home_url or reverse(ui_settings.home_route)
 
 
 @register.simple_tag()
 def get_logo_text():
     """Get the logo text from the settings and default to AdminLTE"""
-    return getattr(settings, "ADMINLTE2_LOGO_TEXT", mark_safe("<b>Admin</b>LTE"))
+    return UISettings.get().logo_text
 
 
 @register.simple_tag()
 def get_logo_text_small():
     """Get the logo text small from the settings and default to ALTE"""
-    return getattr(settings, "ADMINLTE2_LOGO_TEXT_SMALL", mark_safe("<b>A</b>LTE"))
+    return UISettings.get().logo_text_small
 
 
 @register.simple_tag()
 def get_skin_class():
     """Get the skin class to use from the settings and default to skin-blue"""
-    return getattr(settings, "ADMINLTE2_SKIN_CLASS", "skin-blue")
+    return UISettings.get().skin_class
 
 
 @register.simple_tag()
@@ -328,6 +392,12 @@ def get_time_widget():
     return TIME_WIDGET
 
 
+@register.simple_tag()
+def get_asset_bundles():
+    """Get the static paths of the asset bundles, by bundle name. Empty if bundles are not in use."""
+    return AssetBundles.get()
+
+
 # pylint:disable=unused-argument
 @register.simple_tag(takes_context=True)
 def get_avatar_url(context, user=None, email=None, size=None, default="mp"):
@@ -351,12 +421,17 @@ def get_avatar_url(context, user=None, email=None, size=None, default="mp"):
     if not size:
         size = 25
 
+    # Local avatars are rendered from the user's initials, without any external request.
+    if USE_LOCAL_AVATARS:
+        initials = _get_initials(getattr(user, "first_name", ""), getattr(user, "last_name", ""))
+        return _get_local_avatar_url(initials, size)
+
     email = email or ""
 
     if not email and user and hasattr(user, "email"):
         email = user.email or ""
 
-    hashcode = md5(email.encode("utf-8")).hexdigest()
+    hashcode = _get_email_hash(email)
     size = size or ""
 
     return f"https://www.gravatar.com/avatar/{hashcode}?s={size}&d={default}"
@@ -408,23 +483,22 @@ def user_image_initials(
 
     # If initials are not provided, create them from the first and last name.
     if not initials:
-        if first_name and last_name:
-            initials = f"{first_name[0]} {last_name[0]}"
-        elif first_name:
-            initials = f"{first_name[0]}"
-        elif last_name:
-            initials = f"{last_name[0]}"
-        else:
+        initials = _get_initials(first_name, last_name)
+        if not initials:
             gravatar_default = "mp"
 
-    # Get the gravatar url.
-    profile_url = get_avatar_url(
-        context,
-        size=size,
-        user=user,
-        email=email,
-        default=gravatar_default,
-    )
+    if USE_LOCAL_AVATARS:
+        # Get the local avatar url, which renders the same initials.
+        profile_url = _get_local_avatar_url(initials or "", size or 25)
+    else:
+        # Get the gravatar url.
+        profile_url = get_avatar_url(
+            context,
+            size=size,
+            user=user,
+            email=email,
+            default=gravatar_default,
+        )
 
     return {
         "initials": initials or "",
@@ -13,14 +13,12 @@ from django.urls import resolve, reverse, NoReverseMatch
 from django.utils.module_loading import import_string
 
 # Internal Imports.
-from adminlte2_pdq.constants import (
-    LOGIN_REQUIRED,
-    LOGIN_EXEMPT_WHITELIST,
-    STRICT_POLICY,
-    STRICT_POLICY_WHITELIST,
-)
 from adminlte2_pdq.menu import MENU
+from adminlte2_pdq.policy import Policy
+from adminlte2_pdq.policy_manifest import PolicyManifest
+from adminlte2_pdq.registry import VIEW_POLICY_REGISTRY
 from adminlte2_pdq.templatetags.admin.admin_menu import AdminMenu
+from adminlte2_pdq.ui_settings import UISettings
 
 
 # Template tag registration.
@@ -53,17 +51,9 @@ def render_menu(context):
     A menu is the entire menu on the sidebar.
     """
 
-    use_menu_group_separator = getattr(
-        settings,
-        "ADMINLTE2_USE_MENU_GROUP_SEPARATOR",
-        True,
-    )
-
-    include_admin_nav = getattr(
-        settings,
-        "ADMINLTE2_INCLUDE_ADMIN_NAV_ON_MAIN_PAGES",
-        False,
-    )
+    ui_settings = UISettings.get()
+    use_menu_group_separator = ui_settings.use_menu_group_separator
+    include_admin_nav = ui_settings.include_admin_nav_on_main_pages
 
     separator = {
         "text": "",
@@ -85,7 +75,8 @@ def render_menu(context):
     menu_admin = AdminMenu.create_menu(context) if include_admin_nav else []
     menu_last = context.get("ADMINLTE2_MENU_LAST", [])
 
-    section_list = menu_first
+    # Copy, so that the separators are not appended to the context/settings list itself.
+    section_list = list(menu_first)
     if use_menu_group_separator and menu_first and (menu_main or menu_admin or menu_last):
         section_list += [separator]
 
@@ -231,7 +222,7 @@ def get_permissions_from_view(view):
         # Is class-based view.
 
         # Get AdminLte class data dict.
-        admin_pdq_data = getattr(view_class, "admin_pdq_data", {})
+        admin_pdq_data = VIEW_POLICY_REGISTRY.get_admin_pdq_data(view_class)
 
         permission_required_one_value = getattr(view_class, "permission_required_one", None)
         permission_required_value = getattr(view_class, "permission_required", None)
@@ -253,6 +244,22 @@ def get_permissions_from_view(view):
     return view_data
 
 
+def get_view_data_from_node(node):
+    """Get the permission/access data from the view of a node, or None if the node has no view.
+
+    Read from the route policy manifest when possible, which avoids reversing and resolving the node route.
+    """
+    if not node.get("route_args") and not node.get("route_kwargs"):
+        view_data = PolicyManifest.get_menu_data(node.get("route"))
+        if view_data is not None:
+            return view_data
+
+    view = get_view_from_node(node)
+    if view:
+        return get_permissions_from_view(view)
+    return None
+
+
 def get_permissions_from_node(node):
     """Gets the permission/access data for provided node.
 
@@ -335,12 +342,11 @@ def get_permissions_from_node(node):
     view_one_of_permissions = None
     view_full_permissions = None
 
-    # Get the view from the node.
-    view = get_view_from_node(node)
+    # Get the view data from the node's view.
+    view_data = get_view_data_from_node(node)
 
     # If there is a view, use it to get the view permissions and login_required.
-    if view:
-        view_data = get_permissions_from_view(view)
+    if view_data:
         view_allow_anonymous_access = view_data["allow_anonymous_access"]
         view_login_required = view_data["login_required"]
         view_allow_without_permissions = view_data["allow_without_permissions"]
@@ -397,7 +403,7 @@ def get_permissions_from_node(node):
     if login_required is None and not bool(node_allow_anonymous_access):
         # Fall back to settings values, as long as node allow_anonymous_access is not also set.
         # If either of these are set, then login should be required.
-        login_required = STRICT_POLICY or LOGIN_REQUIRED
+        login_required = Policy.strict_policy or Policy.login_required
 
     # Check if node allows without permissions.
     allow_without_permissions = node_allow_without_permissions
@@ -446,8 +452,8 @@ def is_allowed_node(user, node):
     # Start allowed as the opposite of the authentication policy.
     # If we are in LOGIN REQUIRED, should start as failing login checks.
     # If we are in STRICT, should start as failing permission checks.
-    passes_login_check = not LOGIN_REQUIRED
-    passes_permission_check = not STRICT_POLICY
+    passes_login_check = not Policy.login_required
+    passes_permission_check = not Policy.strict_policy
 
     # Get the permission/access values from the node or node's view.
     return_data = get_permissions_from_node(node)
@@ -466,7 +472,7 @@ def is_allowed_node(user, node):
         passes_permission_check = True
 
     # If the node requires being logged in, or the login required middleware is active.
-    elif login_required or LOGIN_REQUIRED:
+    elif login_required or Policy.login_required:
         # Some iteration of login is required.
         # Verify user is authenticated or the route for the node is whitelisted in the login exempt whitelist.
         passes_login_check = user.is_authenticated or check_for_login_whitelisted_node(node)
@@ -606,12 +612,12 @@ def check_for_one_permission_in_node_list(user, nodes):
 
 def check_for_login_whitelisted_node(node):
     """Check to see if the route property on the node is in the login whitelist"""
-    return node.get("route") in LOGIN_EXEMPT_WHITELIST
+    return node.get("route") in Policy.login_exempt_whitelist
 
 
 def check_for_strict_whitelisted_node(node):
     """Check to see if the route property on the node is in the whitelist"""
-    return node.get("route") in STRICT_POLICY_WHITELIST
+    return node.get("route") in Policy.strict_policy_whitelist
 
 
 # endregion Permission Handling Functions
@@ -719,14 +725,4 @@ def _determine_node_active_status(node, request):
 
 def _default_routes_are_registered():
     """Determine if the default routes provided by the package are registered for use"""
-    try:
-        _ = reverse("password_change")
-        _ = reverse("adminlte2_pdq:home")
-        _ = reverse("adminlte2_pdq:demo-css")
-        _ = reverse("adminlte2_pdq:register")
-        _ = reverse("adminlte2_pdq:sample_form")
-        _ = reverse("adminlte2_pdq:sample1")
-        _ = reverse("adminlte2_pdq:sample2")
-    except NoReverseMatch:
-        return False
-    return True
+    return UISettings.get().default_routes_are_registered
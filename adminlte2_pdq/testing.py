@@ -0,0 +1,114 @@
+"""Django AdminLte2Pdq test utilities.
+
+Assert query count and time budgets for the package components that render a page, so that
+regressions such as N+1 queries in the menus or recent activity pane fail tests.
+
+Budgets are per component, as named by adminlte2_pdq.profiling. Such as "auth_middleware",
+"admin_menu", "view", or "tag.<template tag function name>". Budget names may use shell-style
+wildcards, which apply the budget to the sum of all matching components. Such as "tag.render_*"
+for the sidebar menu tags, or "*" for everything within the budget check.
+"""
+
+# System Imports.
+import time
+from contextlib import ExitStack, contextmanager
+from fnmatch import fnmatchcase
+from typing import NamedTuple, Optional
+
+# Third-Party Imports.
+from django.db import connections
+
+# Internal Imports.
+from .profiling import PageProfiler, QueryCounter, profile_request
+
+
+class ComponentBudget(NamedTuple):
+    """Most queries and time that a component may take. Either may be None, to not check it."""
+
+    queries: Optional[int] = None
+    time_ms: Optional[float] = None
+
+
+def get_budget_failures(report, budgets):
+    """Get the budgets exceeded by the components of a profile report.
+
+    :param report: Dict of component name to timings dict, as given by PageProfiler.get_report().
+    :param budgets: Dict of component name or wildcard pattern, to ComponentBudget.
+    :return: List of failure messages. Empty if all budgets are met.
+    """
+    failures = []
+    for pattern, budget in budgets.items():
+        matches = [timing for name, timing in report.items() if fnmatchcase(name, pattern)]
+        queries = sum(timing["queries"] for timing in matches)
+        time_ms = sum(timing["time_ms"] for timing in matches)
+
+        if budget.queries is not None and queries > budget.queries:
+            failures.append(f"{pattern}: {queries} queries, over budget of {budget.queries}.")
+        if budget.time_ms is not None and time_ms > budget.time_ms:
+            failures.append(f"{pattern}: {time_ms:.1f} ms, over budget of {budget.time_ms} ms.")
+    return failures
+
+
+@contextmanager
+def component_budgets(budgets):
+    """Context manager that asserts budgets for the package components run within it.
+
+    Requests made by a test client only report the "view" component if the client middleware is
+    loaded within the block. Use ComponentBudgetMixin.assertPageWithinBudgets() for that.
+
+    :param budgets: Dict of component name or wildcard pattern, to ComponentBudget.
+    :raises AssertionError: On exit, if any budget was exceeded.
+    """
+    query_counter = QueryCounter()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(query_counter))
+        with PageProfiler.profile():
+            start_time = time.perf_counter()
+            yield
+            total_time = time.perf_counter() - start_time
+
+    failures = get_budget_failures(PageProfiler.get_report(total_time, query_counter.count), budgets)
+    if failures:
+        raise AssertionError("Component budgets exceeded:\n" + "\n".join(failures))
+
+
+class ComponentBudgetMixin:
+    """TestCase mixin to assert query count and time budgets for the package components of a page.
+
+    Budgets in the component_budgets class attribute apply to every page checked by the TestCase,
+    and can be added to or overridden per page.
+    """
+
+    # Dict of component name or wildcard pattern, to ComponentBudget.
+    component_budgets = {}
+
+    def assertPageWithinBudgets(self, path, user=None, budgets=None, status_code=200, warm=True):
+        """Request a page with the test client, and assert the budgets of the package components that render it.
+
+        :param path: Url path of the page, such as "/home/".
+        :param user: User to request the page as. Defaults to an anonymous user.
+        :param budgets: Budgets for this page, added to the component_budgets class attribute.
+        :param status_code: Expected response status code.
+        :param warm: Whether to make an unchecked request first, so that first use caches don't count.
+        :return: The checked response.
+        """
+        if user is not None:
+            self.client.force_login(user)
+        else:
+            self.client.logout()
+
+        if warm:
+            self.client.get(path)
+
+        response, total_time, total_queries = profile_request(self.client, path)
+        self.assertEqual(response.status_code, status_code)
+
+        failures = get_budget_failures(
+            PageProfiler.get_report(total_time, total_queries),
+            {**self.component_budgets, **(budgets or {})},
+        )
+        if failures:
+            self.fail(f"Component budgets exceeded for {path}:\n" + "\n".join(failures))
+
+        return response
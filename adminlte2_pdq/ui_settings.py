@@ -0,0 +1,122 @@
+"""Django AdminLte2Pdq UI settings snapshot."""
+
+# System Imports.
+from typing import NamedTuple, Optional
+
+# Third-Party Imports.
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.utils.safestring import mark_safe
+
+
+# Control sidebar tab settings, before applying the ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS setting.
+DEFAULT_CONTROL_SIDEBAR_TABS = {
+    "SHOW_RECENT_ACTIVITY_TAB": True,
+}
+
+# Routes that the default package menu links to.
+DEFAULT_MENU_ROUTES = (
+    "password_change",
+    "adminlte2_pdq:home",
+    "adminlte2_pdq:demo-css",
+    "adminlte2_pdq:register",
+    "adminlte2_pdq:sample_form",
+    "adminlte2_pdq:sample1",
+    "adminlte2_pdq:sample2",
+)
+
+
+class UISettingsSnapshot(NamedTuple):
+    """Settings values (and values derived from them) that the package templates read on every render."""
+
+    skin_class: str
+    logo_text: str
+    logo_text_small: str
+    home_route: str
+    home_url: Optional[str]
+    control_sidebar_tabs: dict
+    show_control_sidebar_button: bool
+    show_control_sidebar_tabs: bool
+    use_menu_group_separator: bool
+    include_admin_nav_on_main_pages: bool
+    default_routes_are_registered: bool
+
+
+def _reverse_or_none(route):
+    """Reverse a route, or get None if it is not registered."""
+    try:
+        return reverse(route)
+    except NoReverseMatch:
+        return None
+
+
+def _default_routes_are_registered():
+    """Determine if the default routes provided by the package are registered for use"""
+    try:
+        for route in DEFAULT_MENU_ROUTES:
+            reverse(route)
+    except NoReverseMatch:
+        return False
+    return True
+
+
+class _UISettings:
+    """Cached UI settings snapshot.
+
+    The snapshot is built on first use, and cleared whenever a setting changes.
+    Urls are reversed when the snapshot is built, so a separate snapshot is kept
+    per (script prefix, urlconf) pair.
+    """
+
+    def __init__(self):
+        self.snapshots = {}
+
+    def get(self):
+        """Get the UI settings snapshot for the current script prefix and urlconf."""
+        key = (get_script_prefix(), get_urlconf())
+        snapshot = self.snapshots.get(key)
+        if snapshot is None:
+            snapshot = self.snapshots[key] = self.build()
+        return snapshot
+
+    def clear(self):
+        """Clear all snapshots, so that they are rebuilt from settings on next use."""
+        self.snapshots.clear()
+
+    @staticmethod
+    def build():
+        """Build a new snapshot from the current settings."""
+        home_route = getattr(settings, "ADMINLTE2_HOME_ROUTE", "adminlte2_pdq:home")
+
+        control_sidebar_tabs = {
+            **DEFAULT_CONTROL_SIDEBAR_TABS,
+            **getattr(settings, "ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS", {}),
+        }
+        # Each tab setting is a boolean, so the sum is the number of visible tabs.
+        number_of_tabs = sum(control_sidebar_tabs.values())
+
+        return UISettingsSnapshot(
+            skin_class=getattr(settings, "ADMINLTE2_SKIN_CLASS", "skin-blue"),
+            logo_text=getattr(settings, "ADMINLTE2_LOGO_TEXT", mark_safe("<b>Admin</b>LTE")),
+            logo_text_small=getattr(settings, "ADMINLTE2_LOGO_TEXT_SMALL", mark_safe("<b>A</b>LTE")),
+            home_route=home_route,
+            home_url=_reverse_or_none(home_route),
+            control_sidebar_tabs=control_sidebar_tabs,
+            show_control_sidebar_button=number_of_tabs > 0,
+            show_control_sidebar_tabs=number_of_tabs > 1,
+            use_menu_group_separator=getattr(settings, "ADMINLTE2_USE_MENU_GROUP_SEPARATOR", True),
+            include_admin_nav_on_main_pages=getattr(settings, "ADMINLTE2_INCLUDE_ADMIN_NAV_ON_MAIN_PAGES", False),
+            default_routes_are_registered=_default_routes_are_registered(),
+        )
+
+
+# Make the snapshot cache instance.
+UISettings = _UISettings()
+
+
+@receiver(setting_changed)
+def _reset_ui_settings(**kwargs):
+    """Clear the UI settings snapshots when any setting changes, as any of them may be stale."""
+    UISettings.clear()
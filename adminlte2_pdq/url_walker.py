@@ -0,0 +1,61 @@
+"""Django AdminLte2Pdq URLconf walker."""
+
+# Third-Party Imports.
+from django.urls.resolvers import URLPattern, URLResolver
+
+
+def walk_url_patterns(urlpatterns, prefix="", app_name="", nested_app_names=False):
+    """Yield every URLPattern within the given url patterns, in definition order.
+
+    Walks nested resolvers with an explicit stack rather than recursion, so each pattern is visited once,
+    and deeply nested or very long URLconfs do not hit the recursion limit.
+
+    :param urlpatterns: Url patterns to walk, such as the urlpatterns of the project ROOT_URLCONF.
+    :param prefix: Route prefix of the given url patterns.
+    :param app_name: App name of the given url patterns.
+    :param nested_app_names: Whether to join the app names of all enclosing resolvers, the same as
+        ResolverMatch.app_name, instead of only using the closest one.
+    :return: Generator of (prefix, app_name, pattern) tuples. The prefix is the joined route of all
+        enclosing resolvers, and the app name is that of the closest enclosing resolver which defines one.
+    """
+    stack = [(prefix, app_name, iter(urlpatterns))]
+    while stack:
+        prefix, app_name, patterns = stack[-1]
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                # Descend into resolver. Current iterator is resumed once the resolver is exhausted.
+                if nested_app_names:
+                    resolver_app_name = ":".join(name for name in (app_name, pattern.app_name) if name)
+                else:
+                    resolver_app_name = pattern.app_name or app_name
+                stack.append((prefix + str(pattern.pattern), resolver_app_name, iter(pattern.url_patterns)))
+                break
+            if isinstance(pattern, URLPattern):
+                yield prefix, app_name, pattern
+        else:
+            stack.pop()
+
+
+def get_route_data(prefix, app_name, pattern):
+    """Get display values for a url pattern, as yielded by walk_url_patterns().
+
+    :return: Dict of app_name, pattern, name, lookup_str and default_args strings.
+    """
+    route = prefix + str(pattern.pattern)
+    if len(route) == 0 or route[-1] != "/":
+        route += "/"
+
+    # Process url "name" as defined in the Django url definition.
+    name = str(pattern.name).strip()
+    if name in {"", "None"}:
+        name = "None"
+    elif app_name:
+        name = app_name + ":" + name
+
+    return {
+        "app_name": app_name,
+        "pattern": route,
+        "name": name,
+        "lookup_str": str(pattern.lookup_str),
+        "default_args": str(pattern.default_args),
+    }
@@ -20,6 +20,9 @@ urlpatterns = [
     path("sample1/", views.sample1, name="sample1"),
     path("sample2/", views.sample2, name="sample2"),
     path("demo-css/", views.demo_css, name="demo-css"),
+    # Local avatar images
+    path("avatar/<int:size>.svg", views.avatar, name="avatar"),
+    path("avatar/<int:size>/<str:initials>.svg", views.avatar, name="avatar_initials"),
     # Redirects to the home page
     path(
         "",
@@ -1,11 +1,18 @@
 """Django AdminLTE2 Views"""
 
 # System Imports.
+from functools import lru_cache
+from hashlib import md5
 import logging
 
 # Third-Party Imports.
 from django.contrib import messages
+from django.contrib.auth.decorators import login_required as django_login_required
+from django.http import Http404, HttpResponse
 from django.shortcuts import render
+from django.utils.cache import patch_cache_control
+from django.utils.html import escape
+from django.views.decorators.http import etag, require_safe
 
 # Internal Imports.
 from .decorators import (
@@ -20,6 +27,29 @@ from .forms import SampleForm, SampleFormset
 logger = logging.getLogger(__name__)
 
 
+# Background colors of initials avatars. Taken from the AdminLTE color palette.
+AVATAR_COLORS = (
+    "#00c0ef",
+    "#00a65a",
+    "#f39c12",
+    "#dd4b39",
+    "#0073b7",
+    "#001f3f",
+    "#39cccc",
+    "#3d9970",
+    "#ff851b",
+    "#f012be",
+    "#605ca8",
+    "#d81b60",
+)
+# Largest avatar size, in pixels, that the avatar view will render.
+AVATAR_MAX_SIZE = 512
+# Longest initials that the avatar view will render.
+AVATAR_MAX_INITIALS = 3
+# Avatar urls fully determine their content, so browsers may cache them for a year.
+AVATAR_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+
+
 def home(request):
     """Show default home page"""
     return render(request, "adminlte2/home.html", {})
@@ -118,3 +148,67 @@ def demo_css(request):
             "bootstrap_types": bootstrap_types,
         },
     )
+
+
+@lru_cache(maxsize=1024)
+def _render_avatar(initials, size):
+    """
+    Render an avatar image as SVG.
+
+    :param initials: Initials to show. If empty, a default person silhouette is shown.
+    :param size: Width and height of the image, in pixels.
+    :return: Tuple of the SVG content, and a strong ETag for it.
+    """
+    if initials:
+        color = AVATAR_COLORS[int(md5(initials.encode("utf-8")).hexdigest(), 16) % len(AVATAR_COLORS)]
+        font_size = 40 if len(initials) < 3 else 32
+        body = (
+            f'<rect width="100" height="100" fill="{color}"/>'
+            f'<text x="50" y="50" dy=".35em" fill="#fff" font-size="{font_size}" text-anchor="middle"'
+            f' font-family="Source Sans Pro,Helvetica Neue,Helvetica,Arial,sans-serif">{escape(initials)}</text>'
+        )
+    else:
+        body = (
+            '<rect width="100" height="100" fill="#d2d6de"/>'
+            '<circle cx="50" cy="38" r="18" fill="#fff"/>'
+            '<path d="M16 100a34 30 0 0 1 68 0z" fill="#fff"/>'
+        )
+
+    content = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 100 100">{body}</svg>'
+    ).encode("utf-8")
+
+    return content, md5(content).hexdigest()
+
+
+def _get_avatar_args(size, initials):
+    """Validate and normalize the avatar view arguments."""
+    if len(initials) > AVATAR_MAX_INITIALS:
+        raise Http404("Avatar initials are too long.")
+    return initials, max(1, min(size, AVATAR_MAX_SIZE))
+
+
+# pylint:disable=unused-argument
+def _avatar_etag(request, size, initials=""):
+    """Get the ETag of an avatar, so that conditional requests skip rendering the response."""
+    return _render_avatar(*_get_avatar_args(size, initials))[1]
+
+
+# Django's login check, as the package login_required decorator is not allowed in STRICT or LOGIN REQUIRED mode.
+# Those modes require login for the avatar routes anyway, as they are in the default strict policy whitelist.
+@django_login_required
+@require_safe
+@etag(_avatar_etag)
+def avatar(request, size, initials=""):
+    """
+    Serve an initials avatar, or the default person avatar, as an SVG image.
+
+    Requires a logged in user, in every policy mode.
+    The url fully determines the image, so responses are served with a strong
+    ETag and are marked as immutable.
+    """
+    content, _ = _render_avatar(*_get_avatar_args(size, initials))
+
+    response = HttpResponse(content, content_type="image/svg+xml")
+    patch_cache_control(response, private=True, max_age=AVATAR_CACHE_MAX_AGE, immutable=True)
+    return response
@@ -18,7 +18,7 @@ from django_expanded_test_cases import IntegrationTestCase
 UserModel = get_user_model()
 
 
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
 class Test_LoginRequiredMode_AppWideWhitelistSettings(IntegrationTestCase):  # pylint:disable=invalid-name
     """Test for project "app-wide" whitelist settings.
 
@@ -71,7 +71,7 @@ class Test_LoginRequiredMode_AppWideWhitelistSettings(IntegrationTestCase):  # p
                 ],
             )
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_FUZZY_WHITELIST", LOGIN_EXEMPT_FUZZY_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_fuzzy_whitelist", LOGIN_EXEMPT_FUZZY_WHITELIST)
     def test__verify_login_whitelist(self):
         """Tests to verify handling of "app-wide" login whitelist."""
 
@@ -114,7 +114,7 @@ class Test_LoginRequiredMode_AppWideWhitelistSettings(IntegrationTestCase):  # p
                 ],
             )
 
-    @patch("adminlte2_pdq.middleware.STRICT_POLICY_FUZZY_WHITELIST", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_fuzzy_whitelist", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
     def test__verify_perm_whitelist(self):
         """Tests to verify handling of "app-wide" perm whitelist.
         In this case, should handle identical to no settings provided.
@@ -160,8 +160,8 @@ class Test_LoginRequiredMode_AppWideWhitelistSettings(IntegrationTestCase):  # p
                 ],
             )
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_FUZZY_WHITELIST", LOGIN_EXEMPT_FUZZY_WHITELIST)
-    @patch("adminlte2_pdq.middleware.STRICT_POLICY_FUZZY_WHITELIST", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_fuzzy_whitelist", LOGIN_EXEMPT_FUZZY_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_fuzzy_whitelist", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
     def test__verify_both_whitelists(self):
         """Tests to verify handling of combined "app-wide" login and permission whitelists."""
 
@@ -206,8 +206,8 @@ class Test_LoginRequiredMode_AppWideWhitelistSettings(IntegrationTestCase):  # p
             )
 
 
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class Test_StrictMode_AppWideWhitelistSettings(IntegrationTestCase):  # pylint:disable=invalid-name
     """Test for project "app-wide" whitelist settings.
 
@@ -263,7 +263,7 @@ class Test_StrictMode_AppWideWhitelistSettings(IntegrationTestCase):  # pylint:d
                 ],
             )
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_FUZZY_WHITELIST", LOGIN_EXEMPT_FUZZY_WHITELIST_VIEWS)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_fuzzy_whitelist", LOGIN_EXEMPT_FUZZY_WHITELIST_VIEWS)
     def test__verify_login_whitelist(self):
         """Tests to verify handling of "app-wide" login whitelist."""
 
@@ -311,7 +311,7 @@ class Test_StrictMode_AppWideWhitelistSettings(IntegrationTestCase):  # pylint:d
                     ],
                 )
 
-    @patch("adminlte2_pdq.middleware.STRICT_POLICY_FUZZY_WHITELIST", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_fuzzy_whitelist", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
     def test__verify_perm_whitelist(self):
         """Tests to verify handling of "app-wide" perm whitelist."""
 
@@ -355,8 +355,8 @@ class Test_StrictMode_AppWideWhitelistSettings(IntegrationTestCase):  # pylint:d
                 ],
             )
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_FUZZY_WHITELIST", LOGIN_EXEMPT_FUZZY_WHITELIST_VIEWS)
-    @patch("adminlte2_pdq.middleware.STRICT_POLICY_FUZZY_WHITELIST", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_fuzzy_whitelist", LOGIN_EXEMPT_FUZZY_WHITELIST_VIEWS)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_fuzzy_whitelist", STRICT_POLICY_FUZZY_WHITELIST_VIEWS)
     def test__verify_both_whitelists(self):
         """Tests to verify handling of combined "app-wide" login and permission whitelists."""
 
@@ -0,0 +1,177 @@
+"""
+Tests for the Asset Bundles
+"""
+
+# System Imports.
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+# Internal Imports.
+from adminlte2_pdq.asset_bundles import (
+    BUNDLE_MANIFEST_PATH,
+    AssetBundles,
+    minify_css,
+    minify_js,
+    rewrite_css_urls,
+    write_bundles,
+)
+
+
+class TestMinifiers(TestCase):
+    """Tests for the CSS and JS minifiers."""
+
+    def test__minify_css(self):
+        """Test that comments and redundant whitespace are removed, and strings and license comments are kept."""
+
+        css = """
+            /*! License */
+            /* Comment */
+            .a > .b,
+            .c  .d {
+                content: "  /* kept */  ";
+                margin: 0 auto;
+            }
+            @media (min-width: 768px) { .e { width: calc(100% - 10px); } }
+        """
+
+        self.assertEqual(
+            minify_css(css),
+            '/*! License */ .a > .b,.c .d{content: "  /* kept */  ";margin: 0 auto}'
+            "@media (min-width: 768px){.e{width: calc(100% - 10px)}}",
+        )
+
+    def test__rewrite_css_urls(self):
+        """Test that relative urls are made relative to the bundle, keeping any query or fragment."""
+
+        css = (
+            "src: url(../fonts/a.eot?#iefix); background: url('../img/b.png'); "
+            'src: url("data:font/woff;base64,AA"); @import url(https://fonts.example.com/css);'
+        )
+
+        self.assertEqual(
+            rewrite_css_urls(css, "third-party/lib/css/lib.css", "adminlte2_pdq/bundles/styles.css"),
+            "src: url(../../third-party/lib/fonts/a.eot?#iefix); "
+            "background: url('../../third-party/lib/img/b.png'); "
+            'src: url("data:font/woff;base64,AA"); @import url(https://fonts.example.com/css);',
+        )
+
+    def test__minify_js(self):
+        """Test that comments and redundant whitespace are removed, without changing strings, regexes or ASI."""
+
+        js = """
+            /*! License */
+            // Comment
+            var a = "  // kept  " ,
+                b = /[/*]+\\//g.test( 'x' ) ;
+            var c = a / 2 / b
+            c ++
+            function d ( ) {
+                return /x/ ;   /* Comment */
+            }
+        """
+
+        self.assertEqual(
+            minify_js(js),
+            "/*! License */\nvar a=\"  // kept  \",b=/[/*]+\\//g.test('x');var c=a / 2 / b\nc ++\n"
+            "function d(){return /x/;}",
+        )
+
+
+class TestAssetBundles(TestCase):
+    """Tests for building, loading and using the asset bundles."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()  # pylint:disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = temp_dir.name
+
+        # Serve the output folder as a static files folder, so that the manifest is found.
+        settings_override = override_settings(STATICFILES_DIRS=[self.output_dir])
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        patcher = patch("adminlte2_pdq.asset_bundles.USE_ASSET_BUNDLES", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        AssetBundles.clear()
+        self.addCleanup(AssetBundles.clear)
+
+    def test__bundles_are_written(self):
+        """Test that bundles are named by content hash, and have the fonts of their stylesheets rewritten."""
+
+        manifest = write_bundles(self.output_dir)
+
+        self.assertRegex(manifest["bundles"]["styles"], r"^adminlte2_pdq/bundles/styles\.[0-9a-f]{12}\.css$")
+        self.assertRegex(manifest["bundles"]["scripts"], r"^adminlte2_pdq/bundles/scripts\.[0-9a-f]{12}\.js$")
+
+        styles = Path(self.output_dir, manifest["bundles"]["styles"]).read_text(encoding="utf-8")
+        # Imports are moved to the start of the bundle.
+        self.assertTrue(styles.startswith("@import url(https://fonts.googleapis.com/"))
+        self.assertIn("url(../../third-party/font-awesome-5/5.8.2/webfonts/fa-solid-900.woff2)", styles)
+        self.assertNotIn("sourceMappingURL", styles)
+
+        scripts = Path(self.output_dir, manifest["bundles"]["scripts"]).read_text(encoding="utf-8")
+        self.assertTrue(scripts.startswith("/*! jQuery v2.2.4"))
+        self.assertTrue(scripts.rstrip().endswith("$.widget.bridge('uibutton',$.ui.button);"))
+
+        # Building again gives the same bundles.
+        self.assertEqual(write_bundles(self.output_dir), manifest)
+
+    def test__templates_use_bundles(self):
+        """Test that pages load the bundles, instead of the individual files that they contain."""
+
+        response = self.client.get("/home/")
+        self.assertContains(response, "adminlte2_pdq/conflicts/conflicts.css")
+
+        manifest = write_bundles(self.output_dir)
+        AssetBundles.clear()
+
+        response = self.client.get("/home/")
+        self.assertContains(response, f'href="/static/{manifest["bundles"]["styles"]}"')
+        self.assertContains(response, f'src="/static/{manifest["bundles"]["scripts"]}"')
+        for path in ("conflicts/conflicts.css", "conflicts/conflicts.js", "extra-features/extra-features.js"):
+            with self.subTest(path):
+                self.assertNotContains(response, path)
+        self.assertNotContains(response, "bootstrap.min.css")
+        # Must still run as soon as the body tag is rendered.
+        self.assertContains(response, "adminlte2_pdq/extra-features/sidebar-state.js")
+
+    def test__missing_or_out_of_date_manifest_is_ignored(self):
+        """Test that the individual files are used, with a warning, if the manifest can't be used."""
+
+        with self.assertLogs("adminlte2_pdq.asset_bundles", "WARNING"):
+            self.assertEqual(AssetBundles.get(), {})
+
+        manifest = write_bundles(self.output_dir)
+        Path(self.output_dir, BUNDLE_MANIFEST_PATH).write_text(
+            json.dumps({**manifest, "checksum": "old"}), encoding="utf-8"
+        )
+        AssetBundles.clear()
+
+        with self.assertLogs("adminlte2_pdq.asset_bundles", "WARNING"):
+            self.assertEqual(AssetBundles.get(), {})
+
+        with patch("adminlte2_pdq.asset_bundles.USE_ASSET_BUNDLES", False):
+            AssetBundles.clear()
+            self.assertEqual(AssetBundles.get(), {})
+
+    def test__command(self):
+        """Test that the command writes the bundles and manifest."""
+
+        stdout = StringIO()
+        call_command("bundleassets", f"--output-dir={self.output_dir}", stdout=stdout)
+
+        self.assertIn("Wrote asset bundles", stdout.getvalue())
+        self.assertEqual(set(AssetBundles.get()), {"styles", "scripts"})
+
+        with self.assertRaisesMessage(CommandError, "No folder to write bundles to."):
+            call_command("bundleassets", stdout=stdout)
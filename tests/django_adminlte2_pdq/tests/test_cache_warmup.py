@@ -0,0 +1,96 @@
+"""
+Tests for the Cache Warm-Up
+"""
+
+# System Imports.
+from io import StringIO
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+# Internal Imports.
+import adminlte2_pdq
+from adminlte2_pdq.cache_warmup import WARMUP_STEPS, warm_menu, warm_templates, warm_whitelists
+from adminlte2_pdq.policy import Policy
+from adminlte2_pdq.renderers import PARTIAL_TEMPLATES, clear_compiled_templates
+from adminlte2_pdq.ui_settings import UISettings
+
+
+# Copies of the whitelists, so that tests don't change the lists used by other tests.
+@patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", list(Policy.strict_policy_whitelist))
+@patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", list(Policy.login_exempt_whitelist))
+class TestCacheWarmup(TestCase):
+    """Tests for the package cache warm-up."""
+
+    def setUp(self):
+        UISettings.clear()
+        clear_compiled_templates()
+
+    def test__warmup_runs_all_steps_without_queries(self):
+        """Test that all steps run, without any database queries, so that it is safe to run before forking."""
+
+        with self.assertNumQueries(0):
+            counts = adminlte2_pdq.warmup()
+
+        self.assertEqual(list(counts), list(WARMUP_STEPS))
+        self.assertGreater(counts["menu"], 0)
+        self.assertGreater(counts["templates"], 0)
+
+    def test__warmup_runs_given_steps(self):
+        """Test that only the given steps run."""
+
+        self.assertEqual(adminlte2_pdq.warmup(["ui_settings"]), {"ui_settings": 1})
+        self.assertTrue(UISettings.snapshots)
+
+    def test__lazy_whitelist_entries_are_evaluated(self):
+        """Test that lazy whitelist entries are replaced with their string values."""
+
+        Policy.login_exempt_whitelist[:] = [reverse_lazy("login"), "adminlte2_pdq:register"]
+        Policy.strict_policy_whitelist[:] = ["adminlte2_pdq:home"]
+
+        self.assertEqual(warm_whitelists(), 1)
+
+        self.assertEqual(Policy.login_exempt_whitelist, ["/accounts/login/", "adminlte2_pdq:register"])
+        self.assertIs(type(Policy.login_exempt_whitelist[0]), str)
+
+    def test__menu_node_urls_are_reversed(self):
+        """Test that menu nodes have their urls set, including nodes within trees."""
+
+        menu = [
+            {
+                "text": "Section",
+                "nodes": [
+                    {"route": "adminlte2_pdq:home", "text": "Home"},
+                    {"text": "Tree", "nodes": [{"route": "adminlte2_pdq:demo-css", "text": "Demo CSS"}]},
+                ],
+            },
+        ]
+
+        with override_settings(ADMINLTE2_MENU=menu):
+            self.assertEqual(warm_menu(), 3)
+
+        self.assertEqual(menu[0]["nodes"][0]["url"], "/home/")
+        self.assertEqual(menu[0]["nodes"][1]["url"], "#")
+        self.assertEqual(menu[0]["nodes"][1]["nodes"][0]["url"], "/demo-css/")
+
+    def test__templates_are_compiled(self):
+        """Test that the form partial templates are compiled."""
+
+        warm_templates()
+
+        self.assertIsNotNone(PARTIAL_TEMPLATES.templates)
+
+    def test__command(self):
+        """Test that the command reports each step."""
+
+        stdout = StringIO()
+        call_command("adminlte_warmup", "--step=ui_settings", "--step=menu", stdout=stdout)
+        output = stdout.getvalue()
+
+        self.assertIn("ui_settings", output)
+        self.assertIn("menu", output)
+        self.assertNotIn("templates", output)
+        self.assertIn("Warm-up complete", output)
@@ -0,0 +1,91 @@
+"""
+Tests for System Checks
+"""
+
+# Third-Party Imports.
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.http import HttpResponse
+from django.core import checks
+from django.test import TestCase, override_settings
+from django.urls import path
+from django.views import View
+
+# Internal Imports.
+from adminlte2_pdq.checks import check_view_permissions
+from adminlte2_pdq.decorators import permission_required, permission_required_one
+from adminlte2_pdq.mixins import PermissionRequiredMixin
+
+
+@permission_required(["auth.add_foo", "auth.chnage_foo"])
+def typo_view(request):
+    """View with a typo in a permission."""
+    return HttpResponse("foobar")
+
+
+@permission_required_one("add_foo")
+def malformed_view(request):
+    """View with a permission missing the app label."""
+    return HttpResponse("foobar")
+
+
+class TypoClassView(PermissionRequiredMixin, View):
+    """Class view with a typo in a permission."""
+
+    permission_required_one = ["auth.add_foo", "auth.chnage_foo"]
+
+    def get(self, request):
+        """Test get method"""
+        return HttpResponse("foobar")
+
+
+# Url configuration for checks to inspect.
+urlpatterns = [
+    path("typo/", typo_view),
+    path("malformed/", malformed_view),
+    path("typo-class/", TypoClassView.as_view()),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TestViewPermissionsCheck(TestCase):
+    """Tests for the system check that validates view permission strings."""
+
+    def setUp(self):
+        content_type = ContentType.objects.get_for_model(Permission)
+        Permission.objects.create(name="add_foo", codename="add_foo", content_type=content_type)
+        Permission.objects.create(name="change_foo", codename="change_foo", content_type=content_type)
+
+    def test__reports_unknown_and_malformed_permissions(self):
+        """Test that typos and malformed permission strings are reported, and valid ones are not."""
+
+        errors = check_view_permissions(databases=["default"])
+
+        self.assertEqual([error.id for error in errors], ["adminlte2_pdq.E001", "adminlte2_pdq.W001"])
+        self.assertIn("'add_foo'", errors[0].msg)
+        self.assertIn("'auth.chnage_foo'", errors[1].msg)
+        self.assertIn(f"{__name__}.typo_view", errors[1].hint)
+
+    def test__reports_class_based_view_permissions(self):
+        """Test that permissions defined on class-based views are checked."""
+
+        errors = check_view_permissions(databases=["default"])
+
+        self.assertIn(f"{__name__}.TypoClassView", errors[1].hint)
+
+    def test__no_errors_when_all_permissions_exist(self):
+        """Test that no errors are reported once all permissions exist."""
+
+        Permission.objects.filter(codename="change_foo").update(codename="chnage_foo")
+
+        errors = check_view_permissions(databases=["default"])
+
+        self.assertEqual([error.id for error in errors], ["adminlte2_pdq.E001"])
+
+    def test__only_runs_for_database_checks(self):
+        """Test that the check is a database check, which makes no queries unless databases are given."""
+
+        self.assertEqual(check_view_permissions.tags, (checks.Tags.database,))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(check_view_permissions(), [])
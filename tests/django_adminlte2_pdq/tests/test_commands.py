@@ -0,0 +1,373 @@
+"""
+Tests for Management Commands
+"""
+
+# System Imports.
+import csv
+import json
+from functools import wraps
+from io import StringIO
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import path
+
+# Internal Imports.
+from adminlte2_pdq.access_decisions import AccessRole, get_access_decisions, get_access_decisions_in_pool
+from adminlte2_pdq.management.commands import auditpolicy, showviews
+from adminlte2_pdq.management.output import filters_to_q, matches_filters
+from adminlte2_pdq.url_walker import walk_url_patterns
+from tests.django_adminlte2_pdq.django_test_project import views
+
+
+def attribute_dropping_decorator(function):
+    """Decorator that does not keep the attributes of the wrapped view."""
+
+    def wrapper(request, *args, **kwargs):
+        return function(request, *args, **kwargs)
+
+    wrapper.__module__ = function.__module__
+    wrapper.__qualname__ = function.__qualname__
+    return wrapper
+
+
+def run_command(*args, **kwargs):
+    """Run a management command, and get the output."""
+    stdout = StringIO()
+    call_command(*args, stdout=stdout, **kwargs)
+    return stdout.getvalue()
+
+
+class TestOutputFormats(TestCase):
+    """Tests for the machine-readable output formats and filters of the show commands."""
+
+    def test__showroutes_json(self):
+        """Test that showroutes json output is a list of filtered route rows."""
+
+        rows = json.loads(run_command("showroutes", "--format=json", "--filter-app-name=adminlte2_pdq"))
+
+        self.assertIn(
+            {"app_name": "adminlte2_pdq", "pattern": "home/", "name": "adminlte2_pdq:home"},
+            rows,
+        )
+        self.assertEqual({row["app_name"] for row in rows}, {"adminlte2_pdq"})
+
+    def test__showroutes_url_name_filter(self):
+        """Test that url name filters match with or without app name."""
+
+        for url_name_filter in ("home", "adminlte2_pdq:home", "adminlte2_pdq:h*"):
+            with self.subTest(url_name_filter=url_name_filter):
+                output = run_command(
+                    "showroutes",
+                    "--format=jsonl",
+                    "--filter-app-name=adminlte2_pdq",
+                    f"--filter-url-name={url_name_filter}",
+                    "--show-lookup-strings",
+                )
+
+                self.assertEqual(
+                    [json.loads(line) for line in output.splitlines()],
+                    [
+                        {
+                            "app_name": "adminlte2_pdq",
+                            "pattern": "home/",
+                            "name": "adminlte2_pdq:home",
+                            "lookup_str": "adminlte2_pdq.views.home",
+                        }
+                    ],
+                )
+
+    def test__showroutes_empty_json(self):
+        """Test that json output is valid when no routes match."""
+
+        self.assertEqual(json.loads(run_command("showroutes", "--format=json", "--filter-app-name=missing")), [])
+
+    def test__showviews_csv(self):
+        """Test that showviews csv output has a row per view and decorator type."""
+
+        output = run_command("showviews", "--format=csv", "--hide-app-names", "--filter-url-name=*function-login*")
+
+        self.assertEqual(
+            list(csv.DictReader(StringIO(output))),
+            [
+                {
+                    "decorator_type": "login_required",
+                    "pattern": "tests/function/login/",
+                    "name": "adminlte2_pdq_tests:function-login-required",
+                }
+            ],
+        )
+
+    def test__showperms_jsonl(self):
+        """Test that showperms jsonl output has a row per filtered permission."""
+
+        output = run_command(
+            "showperms",
+            "--format=jsonl",
+            "--filter-app-name=auth",
+            "--filter-codename=*_group",
+            "--hide-names",
+        )
+
+        self.assertEqual(
+            [json.loads(line) for line in output.splitlines()],
+            [
+                {"content_type": "auth", "codename": f"{action}_group", "has_perm": f"auth.{action}_group"}
+                for action in ("add", "change", "delete", "view")
+            ],
+        )
+
+    def test__table_output_is_filtered(self):
+        """Test that filters also apply to the default table output."""
+
+        output = run_command("showperms", "--filter-codename=view_group")
+
+        self.assertIn("auth.view_group", output)
+        self.assertNotIn("auth.add_group", output)
+
+
+class TestShowPermsCommand(TestCase):
+    """Tests for the showperms command."""
+
+    def test__filters_to_q_matches_filters(self):
+        """Test that queryset filters match the same values as the in-memory filters."""
+
+        codenames = list(Permission.objects.values_list("codename", flat=True))
+
+        for patterns in (
+            ["view_group"],
+            ["view_*"],
+            ["*_group"],
+            ["*_perm*"],
+            ["add_*_group", "view_??er"],
+            ["[acd]*_user"],
+            ["[!v]*_session"],
+            ["*"],
+            [""],
+            # Case-sensitive, with or without wildcards that need a regex.
+            ["VIEW_*"],
+            ["View_grou?"],
+            # Regex characters within character classes.
+            ["[]^\\a-c]*_user"],
+            ["[!^]*_session"],
+            ["[&~|]*"],
+            ["view_[unclosed"],
+        ):
+            with self.subTest(patterns=patterns):
+                self.assertCountEqual(
+                    Permission.objects.filter(filters_to_q("codename", patterns)).values_list("codename", flat=True),
+                    [codename for codename in codenames if matches_filters(codename, patterns)],
+                )
+
+
+    def test__filters_to_q_escapes_character_classes(self):
+        """Test that regex characters within character classes match literally, the same as the in-memory filters."""
+
+        content_type = ContentType.objects.get_for_model(Group)
+        for codename in ("a^b", "a]b", "a\\b", "a[b", "a&b", "a-b", "axb"):
+            Permission.objects.create(codename=codename, name=codename, content_type=content_type)
+
+        codenames = list(Permission.objects.values_list("codename", flat=True))
+
+        for pattern, expected in (
+            ("a[^]b", ["a^b"]),
+            ("a[]]b", ["a]b"]),
+            ("a[\\]b", ["a\\b"]),
+            ("a[[]b", ["a[b"]),
+            ("a[&]b", ["a&b"]),
+            ("a[\\-]b", ["a\\b", "a-b"]),
+            ("a[!x]b", ["a^b", "a]b", "a\\b", "a[b", "a&b", "a-b"]),
+        ):
+            with self.subTest(pattern=pattern):
+                self.assertCountEqual(
+                    [codename for codename in codenames if matches_filters(codename, [pattern])], expected
+                )
+                self.assertCountEqual(
+                    Permission.objects.filter(filters_to_q("codename", [pattern])).values_list("codename", flat=True),
+                    expected,
+                )
+
+    def test__filtered_in_database(self):
+        """Test that filters and column widths are calculated by queries, with rows fetched once."""
+
+        with CaptureQueriesContext(connection) as captured_queries:
+            output = run_command("showperms", "--filter-model-name=group", "--hide-default-perms")
+
+        self.assertEqual(len(captured_queries), 2)
+        self.assertNotIn("auth.view_group", output)
+
+        output = run_command("showperms", "--filter-model-name=group", "--filter-codename=*_group")
+        rows = [line for line in output.splitlines() if line.startswith("| ")]
+
+        # Header row, then one row per permission, padded to the longest value.
+        self.assertEqual(len(rows), 5)
+        for action in ("add", "change", "delete", "view"):
+            self.assertIn(f"| {f'auth.{action}_group':17} |", output)
+
+
+class TestShowViewsCommand(TestCase):
+    """Tests for the showviews command."""
+
+    def setUp(self):
+        self.command = showviews.Command()
+        showviews.get_module_decorators.cache_clear()
+
+    def test__decorator_type_from_view_data(self):
+        """Test that views are classified by the data attached by package decorators/mixins, without parsing."""
+
+        for view, decorator_type in (
+            (views.allow_anonymous_access_view, "allow_anonymous_access"),
+            (views.login_required_view, "login_required"),
+            (views.allow_without_permissions_view, "allow_without_permissions"),
+            (views.one_permission_required_view, "permission_required_one"),
+            (views.full_permissions_required_view, "permission_required"),
+            (views.LoginRequiredView.as_view(), "login_required"),
+            (views.OnePermissionRequiredView.as_view(), "permission_required_one"),
+            (views.standard_view, ""),
+        ):
+            with self.subTest(decorator_type=decorator_type):
+                with patch.object(showviews, "get_module_decorators") as mock_get_module_decorators:
+                    mock_get_module_decorators.return_value = {}
+
+                    self.assertEqual(self.command.get_decorator_type(path("test/", view)), decorator_type)
+
+                # Source is only parsed for views without any package data.
+                self.assertEqual(mock_get_module_decorators.called, decorator_type == "")
+
+    def test__decorator_type_follows_wrapped(self):
+        """Test that view data is found through further decorators that set __wrapped__."""
+
+        @wraps(views.login_required_view)
+        def wrapper(request, *args, **kwargs):
+            return views.login_required_view(request, *args, **kwargs)
+
+        del wrapper.admin_pdq_data
+
+        self.assertEqual(self.command.get_decorator_type(path("test/", wrapper)), "login_required")
+
+    def test__decorator_type_falls_back_to_source(self):
+        """Test that views without any reachable view data are classified from their module source."""
+
+        view = attribute_dropping_decorator(views.allow_without_permissions_view)
+
+        self.assertEqual(self.command.get_decorator_type(path("test/", view)), "allow_without_permissions")
+
+    def test__module_source_is_parsed_once(self):
+        """Test that module source is parsed once, regardless of the number of views within it."""
+
+        with patch.object(showviews.ast, "parse", wraps=showviews.ast.parse) as mock_parse:
+            for view in (views.standard_view, views.login_required_view, views.full_permissions_required_view):
+                showviews.get_module_decorators(view.__module__)
+
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(
+            showviews.get_module_decorators(views.__name__)["stacked_permissions_required_view"],
+            ["permission_required_one", "permission_required"],
+        )
+
+
+class TestAuditPolicyCommand(TestCase):
+    """Tests for the auditpolicy command."""
+
+    def get_decisions(self, *args):
+        """Run the command with json output, and get the decisions keyed by url name."""
+        rows = json.loads(run_command("auditpolicy", "--format=json", "--filter-app-name=adminlte2_pdq_tests", *args))
+        return {row.pop("name").split(":")[-1]: row for row in rows}
+
+    def test__loose_mode(self):
+        """Test that only decorated views need login or permissions in loose mode."""
+
+        decisions = self.get_decisions("--role=adder=auth.add_foo")
+
+        self.assertEqual(list(decisions["function-standard"]), ["app_name", "pattern", "anonymous", "adder"])
+        for url_name, expected in (
+            ("function-standard", ["allow", "allow"]),
+            ("function-login-required", ["login", "allow"]),
+            ("function-one-permission-required", ["login", "allow"]),
+            ("function-full-permissions-required", ["login", "403"]),
+            ("class-one-permission-required", ["login", "allow"]),
+        ):
+            with self.subTest(url_name=url_name):
+                self.assertEqual([decisions[url_name]["anonymous"], decisions[url_name]["adder"]], expected)
+
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    def test__strict_mode(self):
+        """Test that undecorated views need login and permissions in strict mode."""
+
+        decisions = self.get_decisions()
+
+        for url_name, expected in (
+            ("function-standard", ["login", "403", "403"]),
+            ("function-allow-anonymous-access", ["allow", "allow", "allow"]),
+            ("function-allow-without-permissions", ["login", "allow", "allow"]),
+            ("function-full-permissions-required", ["login", "403", "allow"]),
+        ):
+            with self.subTest(url_name=url_name):
+                self.assertEqual(
+                    [decisions[url_name][role] for role in ("anonymous", "authenticated", "superuser")],
+                    expected,
+                )
+
+    def test__user_and_group_roles(self):
+        """Test that user and group roles use their stored permissions."""
+
+        group = Group.objects.create(name="adders")
+        group.permissions.add(Permission.objects.get(codename="add_group"))
+        user = get_user_model().objects.create_user(username="test_user", password="password")
+        user.groups.add(group)
+
+        output = run_command(
+            "auditpolicy",
+            "--format=csv",
+            "--user=test_user",
+            "--group=adders",
+            "--filter-url-name=adminlte2_pdq:home",
+        )
+
+        self.assertEqual(
+            list(csv.DictReader(StringIO(output))),
+            [
+                {
+                    "app_name": "adminlte2_pdq",
+                    "pattern": "home/",
+                    "name": "adminlte2_pdq:home",
+                    "anonymous": "allow",
+                    "test_user": "allow",
+                    "adders": "allow",
+                }
+            ],
+        )
+
+    def test__table_output(self):
+        """Test that table output has a column per role."""
+
+        output = run_command("auditpolicy", "--filter-url-name=*function-login-required")
+
+        self.assertIn("| anonymous | authenticated | superuser |", output)
+        self.assertIn("| login     | allow         | allow     |", output)
+
+    def test__process_pool(self):
+        """Test that decisions from a process pool match the decisions from a single process."""
+
+        command = auditpolicy.Command()
+        middleware = command.get_middleware()
+        urlconf = __import__(settings.ROOT_URLCONF, {}, {}, [""])
+        route_policies = [
+            command.get_route_policy(middleware, prefix, app_name, url)
+            for prefix, app_name, url in walk_url_patterns(urlconf.urlpatterns)
+        ]
+        roles = [AccessRole("anonymous", is_authenticated=False), AccessRole("adder", ["auth.add_foo"])]
+
+        self.assertEqual(
+            get_access_decisions_in_pool(route_policies, roles, processes=2, chunk_size=10),
+            get_access_decisions(route_policies, roles),
+        )
@@ -0,0 +1,115 @@
+"""
+Tests for the Component Budget test utilities, and the package component budgets under each policy mode
+"""
+
+# System Imports.
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+
+# Internal Imports.
+from adminlte2_pdq.testing import ComponentBudget, ComponentBudgetMixin, component_budgets, get_budget_failures
+
+
+class TestComponentBudgetUtilities(TestCase):
+    """Tests for checking budgets."""
+
+    def test__budget_failures(self):
+        """Test that budgets are checked against the sum of matching components."""
+
+        report = {
+            "auth_middleware": {"queries": 2, "time_ms": 1.5},
+            "tag.render_menu": {"queries": 1, "time_ms": 2.0},
+            "tag.render_link": {"queries": 1, "time_ms": 3.0},
+        }
+
+        self.assertEqual(get_budget_failures(report, {"tag.*": ComponentBudget(queries=2, time_ms=5.0)}), [])
+        self.assertEqual(get_budget_failures(report, {"missing": ComponentBudget(queries=0, time_ms=0)}), [])
+        self.assertEqual(
+            get_budget_failures(report, {"tag.*": ComponentBudget(queries=1), "*": ComponentBudget(time_ms=6.0)}),
+            ["tag.*: 2 queries, over budget of 1.", "*: 6.5 ms, over budget of 6.0 ms."],
+        )
+
+    def test__context_manager(self):
+        """Test that the context manager fails when budgets are exceeded within it."""
+
+        with component_budgets({"*": ComponentBudget(queries=1)}):
+            Permission.objects.count()
+
+        with self.assertRaisesMessage(AssertionError, "other: 2 queries, over budget of 1."):
+            with component_budgets({"other": ComponentBudget(queries=1)}):
+                Permission.objects.count()
+                Permission.objects.count()
+
+
+class ComponentBudgetPagesMixin(ComponentBudgetMixin):
+    """Budgets for the package components of base template pages. Run for each policy mode."""
+
+    # Template tags should never query, as user permissions are cached after the first check.
+    # Times are only generous guards against gross regressions, so as not to fail on slow machines.
+    component_budgets = {
+        "auth_middleware": ComponentBudget(time_ms=100),
+        "admin_menu": ComponentBudget(time_ms=100),
+        "tag.*": ComponentBudget(queries=0, time_ms=500),
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = get_user_model().objects.create_superuser(username="test_superuser", password="password")
+        cls.user = get_user_model().objects.create_user(username="test_user", password="password")
+        cls.user.user_permissions.add(*Permission.objects.filter(content_type__app_label="auth"))
+
+    def test__home_page(self):
+        """Test the home page, as a user with permissions. Loads the session, user and user permissions."""
+
+        self.assertPageWithinBudgets(
+            "/home/",
+            user=self.user,
+            budgets={"admin_menu": ComponentBudget(queries=2, time_ms=100), "*": ComponentBudget(queries=4)},
+        )
+
+    def test__admin_index_page(self):
+        """Test the admin index page, as a superuser. Includes the recent activity pane."""
+
+        self.assertPageWithinBudgets("/admin/", user=self.superuser, budgets={"*": ComponentBudget(queries=3)})
+
+
+class TestLooseModeComponentBudgets(ComponentBudgetPagesMixin, TestCase):
+    """Component budgets under project "Loose" mode."""
+
+    def test__anonymous_home_page(self):
+        """Test the home page, as an anonymous user."""
+
+        self.assertPageWithinBudgets("/home/", budgets={"*": ComponentBudget(queries=0)})
+
+
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+class TestLoginRequiredModeComponentBudgets(ComponentBudgetPagesMixin, TestCase):
+    """Component budgets under project "Login Required" mode."""
+
+    def test__anonymous_home_page(self):
+        """Test the home page, as an anonymous user. Redirects to login."""
+
+        self.assertPageWithinBudgets("/home/", status_code=302, budgets={"*": ComponentBudget(queries=0)})
+
+
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+class TestStrictModeComponentBudgets(ComponentBudgetPagesMixin, TestCase):
+    """Component budgets under project "Strict" mode."""
+
+    def test__anonymous_home_page(self):
+        """Test the home page, as an anonymous user. Redirects to login."""
+
+        self.assertPageWithinBudgets("/home/", status_code=302, budgets={"*": ComponentBudget(queries=0)})
+
+    def test__permission_page(self):
+        """Test a page requiring permissions, as a user with permissions."""
+
+        self.assertPageWithinBudgets(
+            reverse("adminlte2_pdq:sample1"), user=self.user, budgets={"*": ComponentBudget(queries=4)}
+        )
@@ -5,12 +5,13 @@ Tests for Decorators
 # System Imports.
 
 # Third-Party Imports.
+from asgiref.sync import iscoroutinefunction
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase
+from django.test import AsyncRequestFactory, RequestFactory, TestCase
 
 # Internal Imports.
 from adminlte2_pdq.constants import LOGIN_EXEMPT_WHITELIST, STRICT_POLICY_WHITELIST
@@ -48,6 +49,7 @@ class TestIsolatedDecorators(TestCase):
     def setUp(self):
         self.permission_content_type = ContentType.objects.get_for_model(Permission)
         self.factory = RequestFactory()
+        self.async_factory = AsyncRequestFactory()
 
         Permission.objects.create(
             name="add_foo",
@@ -374,4 +376,147 @@ class TestIsolatedDecorators(TestCase):
             f"Unknown type ({type(max)}) for permission. Expected list, tuple, or string.",
         )
 
+    def test__permission_required__loads_user_permissions_once_per_request(self):
+        """Test stacked permission decorators share a single load of the request user permissions."""
+
+        @permission_required_one(["auth.add_foo", "auth.view_foo"])
+        @permission_required(["auth.add_foo", "auth.change_foo"])
+        def a_view(request):
+            return HttpResponse("foobar")
+
+        request = self.factory.get("/rand")
+        setattr(request, "user", UserModel.objects.get(pk=self.full_user.pk))
+
+        # Two queries to load the user/group permissions. Evaluated against the cached set afterwards.
+        with self.assertNumQueries(2):
+            response = a_view(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode(), "foobar")
+
     # endregion Permission Required Tests
+
+    # region Async View Tests
+
+    def get_async_request(self, user, use_auser=True):
+        """Create an async request with the given user attached.
+
+        :param user: User to attach to the request.
+        :param use_auser: Bool indicating if the Django 5.0+ "auser" accessor should be provided.
+        """
+        request = self.async_factory.get("/rand")
+        setattr(request, "user", user)
+        if use_auser:
+
+            async def auser():
+                return user
+
+            setattr(request, "auser", auser)
+
+        return request
+
+    async def test__async_views__keep_coroutine_function_status(self):
+        """Test that all decorators return a coroutine function when decorating an async view."""
+
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        for decorator_name, decorator in (
+            ("allow_anonymous_access", allow_anonymous_access),
+            ("login_required", login_required),
+            ("allow_without_permissions", allow_without_permissions),
+            ("permission_required_one", permission_required_one("auth.add_foo")),
+            ("permission_required", permission_required("auth.add_foo")),
+        ):
+            with self.subTest(decorator_name):
+                decorated_view = decorator(a_view)
+
+                self.assertTrue(iscoroutinefunction(decorated_view))
+                self.assertTrue(hasattr(decorated_view, "admin_pdq_data"))
+
+    async def test__async_allow_anonymous_decorator__allows_anonymous_access(self):
+        """Test allow_anonymous_access decorator works with async views."""
+
+        @allow_anonymous_access
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        response = await a_view(self.get_async_request(self.anonymous_user))
+
+        self.assertEqual(response.status_code, 200)
+
+    async def test__async_login_required_decorator__allows_authenticated_access(self):
+        """Test login_required decorator works with async views, when user is logged in."""
+
+        @login_required
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        for use_auser in (True, False):
+            with self.subTest(f"With auser: {use_auser}"):
+                response = await a_view(self.get_async_request(self.full_user, use_auser=use_auser))
+
+                self.assertEqual(response.status_code, 200)
+
+    async def test__async_login_required_decorator__prevents_anonymous_access(self):
+        """Test login_required decorator works with async views, when user is not logged in."""
+
+        @login_required
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        response = await a_view(self.get_async_request(self.anonymous_user))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, "/accounts/login/?next=/rand")
+
+    async def test__async_allow_without_permissions_decorator__prevents_anonymous_access(self):
+        """Test allow_without_permissions decorator works with async views."""
+
+        @allow_without_permissions
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        response = await a_view(self.get_async_request(self.none_user))
+        self.assertEqual(response.status_code, 200)
+
+        response = await a_view(self.get_async_request(self.anonymous_user))
+        self.assertEqual(response.status_code, 302)
+
+    async def test__async_permission_required_one__checks_permissions(self):
+        """Test permission_required_one decorator works with async views."""
+
+        @permission_required_one(("auth.add_foo", "auth.change_foo"))
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        response = await a_view(self.get_async_request(self.partial_user))
+        self.assertEqual(response.status_code, 200)
+
+        response = await a_view(self.get_async_request(self.none_user))
+        self.assertEqual(response.status_code, 302)
+
+    async def test__async_permission_required__checks_permissions(self):
+        """Test permission_required decorator works with async views."""
+
+        @permission_required(("auth.add_foo", "auth.change_foo"))
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        response = await a_view(self.get_async_request(self.full_user))
+        self.assertEqual(response.status_code, 200)
+
+        response = await a_view(self.get_async_request(self.partial_user))
+        self.assertEqual(response.status_code, 302)
+
+    async def test__async_permission_required__raises_exception(self):
+        """Test permission_required decorator raises PermissionDenied with async views, when requested."""
+
+        @permission_required(("auth.add_foo", "auth.change_foo"), raise_exception=True)
+        async def a_view(request):
+            return HttpResponse("foobar")
+
+        with self.assertRaises(PermissionDenied):
+            await a_view(self.get_async_request(self.none_user))
+
+    # endregion Async View Tests
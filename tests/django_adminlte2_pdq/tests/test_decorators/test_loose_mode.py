@@ -14,7 +14,7 @@ from .base_test_case import BaseDecoratorTestCase
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", False)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", False)
 class TestLooseAuthenticationDecorators(BaseDecoratorTestCase):
     """
     Test project authentication decorators, under project "Loose" mode.
@@ -23,26 +23,19 @@ class TestLooseAuthenticationDecorators(BaseDecoratorTestCase):
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
+        from adminlte2_pdq.policy import Policy
 
         # Test for expected setting values.
-        self.assertFalse(LOGIN_REQUIRED)
-        self.assertFalse(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        self.assertFalse(Policy.login_required)
+        self.assertFalse(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__no_decorators(self):
         """Test for view with no decorators, in project "Loose" mode. For sanity checking."""
@@ -135,7 +128,7 @@ class TestLooseAuthenticationDecorators(BaseDecoratorTestCase):
                 # Verify values associated with returned view.
                 self.assertAdminPdqData(response, decorator_name="login_required", login_required=True)
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq_tests:function-login-required"])
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq_tests:function-login-required"])
     def test__login_required_decorator_and_login_whitelisted(self):
         """Test when both login_required decorator used and view is login whitelisted
         in "Loose" mode raises improperly configured error."""
@@ -368,36 +368,29 @@ class StrictModeMixin:
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class TestStrictAuthenticationDecorators(BaseDecoratorTestCase, StrictModeMixin):
     """Runtime test execution of decorators under "Strict" mode."""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     @override_settings(DEBUG=False)
-    @patch("adminlte2_pdq.middleware.REDIRECT_TO_HOME_ON_403", False)
+    @patch("adminlte2_pdq.policy.Policy.redirect_to_home_on_403", False)
     def test__no_decorators__redirect_on_403_turned_off(self):
         """Test for view with no decorators, in project "Strict" mode
         and the redirect on 403 setting is set to False.
@@ -453,9 +446,9 @@ class TestStrictAuthenticationDecorators(BaseDecoratorTestCase, StrictModeMixin)
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
-@patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", LOGIN_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+@patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", LOGIN_WHITELIST_VIEWS)
 class TestStrictAuthenticationDecoratorsWithLoginWhitelist(BaseDecoratorTestCase, StrictModeMixin):
     """Runtime test execution of decorators under "Strict" mode, with login whitelist set for views.
 
@@ -473,25 +466,18 @@ class TestStrictAuthenticationDecoratorsWithLoginWhitelist(BaseDecoratorTestCase
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(13, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(13, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__no_decorators(self):
         """Test for view with no decorators, in project "Strict" mode, with login whitelist.
@@ -881,9 +867,9 @@ class TestStrictAuthenticationDecoratorsWithLoginWhitelist(BaseDecoratorTestCase
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY_WHITELIST", PERM_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", PERM_WHITELIST_VIEWS)
 class TestStrictAuthenticationDecoratorsWithPermWhitelist(BaseDecoratorTestCase, StrictModeMixin):
     """Runtime test execution of decorators under "Strict" mode, with permission whitelist set for views.
 
@@ -897,25 +883,18 @@ class TestStrictAuthenticationDecoratorsWithPermWhitelist(BaseDecoratorTestCase,
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(16, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(18, len(Policy.strict_policy_whitelist))
 
     def test__no_decorators(self):
         """Test for view with no decorators, in project "STRICT" mode, with perm whitelist.
@@ -1095,10 +1074,10 @@ class TestStrictAuthenticationDecoratorsWithPermWhitelist(BaseDecoratorTestCase,
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
-@patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", LOGIN_WHITELIST_VIEWS)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY_WHITELIST", PERM_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+@patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", LOGIN_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", PERM_WHITELIST_VIEWS)
 class TestStrictAuthenticationDecoratorsWithBothWhitelists(BaseDecoratorTestCase, StrictModeMixin):
     """Runtime test execution of decorators under "Strict" mode, with both whitelists set for views.
 
@@ -1111,25 +1090,18 @@ class TestStrictAuthenticationDecoratorsWithBothWhitelists(BaseDecoratorTestCase
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(13, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(16, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(13, len(Policy.login_exempt_whitelist))
+        self.assertEqual(18, len(Policy.strict_policy_whitelist))
 
     def test__no_decorators(self):
         """Test for view with no decorators, in project "strict" mode, with both whitelists."""
@@ -1339,8 +1311,8 @@ class TestStrictAuthenticationDecoratorsWithBothWhitelists(BaseDecoratorTestCase
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class TestStrictAutAuthenticationMixinsWithOverlap(BaseDecoratorTestCase):
     """Tests for overlapping decorator use.
 
@@ -0,0 +1,188 @@
+"""
+Tests for the Message Channel
+"""
+
+# System Imports.
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+
+# Internal Imports.
+from adminlte2_pdq import message_channel
+
+
+class TestMessageChannel(TestCase):
+    """Tests for the deduplicating, capacity-bounded message channel."""
+
+    def setUp(self):
+        self.request = RequestFactory().get("/")
+        self.request.session = SessionStore()
+        self.request._messages = CookieStorage(self.request)
+
+    def store_and_reload(self):
+        """Store pending messages in a cookie, and load them into a new request, as on a redirect."""
+        response = HttpResponse()
+        self.request._messages.update(response)
+
+        request = RequestFactory().get("/")
+        # Unchanged messages are not stored again, so the browser keeps sending the previous cookie.
+        cookie = response.cookies.get(CookieStorage.cookie_name)
+        request.COOKIES[CookieStorage.cookie_name] = (
+            cookie.value if cookie else self.request.COOKIES[CookieStorage.cookie_name]
+        )
+        request.session = self.request.session
+        request._messages = CookieStorage(request)
+        self.request = request
+
+    def get_counts(self):
+        """Get the (message text, count) pairs that would be displayed for the request."""
+        return [(message.message, count) for message, count in message_channel.group_messages(self.request._messages)]
+
+    def test__repeated_messages_are_stored_once(self):
+        """Test that repeats of a pending message only increment its count."""
+
+        for _ in range(3):
+            message_channel.warning(self.request, "Repeated warning.")
+        message_channel.warning(self.request, "Other warning.")
+        message_channel.add_message(self.request, messages.ERROR, "Repeated warning.")
+
+        self.assertEqual(
+            message_channel.get_message_counts(self.request._messages),
+            {
+                (messages.WARNING, "Repeated warning."): 3,
+                (messages.WARNING, "Other warning."): 1,
+                (messages.ERROR, "Repeated warning."): 1,
+            },
+        )
+
+        stored_messages = list(self.request._messages)
+
+        self.assertEqual(
+            [(message.level, message.message) for message in stored_messages],
+            [
+                (messages.WARNING, "Repeated warning."),
+                (messages.WARNING, "Other warning."),
+                (messages.ERROR, "Repeated warning."),
+            ],
+        )
+        # The count is not part of the message tags, which are rendered as css classes.
+        self.assertEqual([message.tags for message in stored_messages], ["warning", "warning", "error"])
+
+    def test__count_survives_storage(self):
+        """Test that counts are kept through message storage, and repeats after a redirect are merged."""
+
+        message_channel.warning(self.request, "Repeated warning.")
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+
+        self.assertEqual(self.get_counts(), [("Repeated warning.", 3)])
+
+        # Displayed messages no longer have a count.
+        self.assertNotIn(message_channel.COUNTS_SESSION_KEY, self.request.session)
+
+    def test__displayed_messages_are_not_merged(self):
+        """Test that once stored messages are displayed, repeats are stored as new messages."""
+
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+        self.get_counts()
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+
+        self.assertEqual(self.get_counts(), [("Repeated warning.", 1)])
+
+    def test__messages_displayed_without_grouping_drop_their_counts(self):
+        """Test that counts are dropped once their messages are displayed by a plain loop over the messages."""
+
+        message_channel.warning(self.request, "Repeated warning.")
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+        # Displayed without grouping, so the count is left in the session.
+        list(self.request._messages)
+        self.store_and_reload()
+
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+
+        self.assertEqual(self.get_counts(), [("Repeated warning.", 1)])
+
+    def test__messages_displayed_in_same_request_drop_their_counts(self):
+        """Test that iterating the storage drops the counts of the messages that it displayed."""
+
+        message_channel.warning(self.request, "Repeated warning.")
+        message_channel.warning(self.request, "Repeated warning.")
+        list(self.request._messages)
+
+        self.assertEqual(message_channel.get_message_counts(self.request._messages), {})
+        self.assertNotIn(message_channel.COUNTS_SESSION_KEY, self.request.session)
+
+        # Repeats after being displayed are stored again.
+        message_channel.warning(self.request, "Repeated warning.")
+        message_channel.warning(self.request, "Repeated warning.")
+        self.store_and_reload()
+
+        self.assertEqual(self.get_counts(), [("Repeated warning.", 2)])
+
+    def test__capacity_is_bounded(self):
+        """Test that distinct messages past the capacity are dropped."""
+
+        with patch("adminlte2_pdq.message_channel.MESSAGE_CHANNEL_CAPACITY", 2):
+            for index in range(4):
+                message_channel.warning(self.request, f"Warning {index}.")
+            message_channel.warning(self.request, "Warning 0.")
+
+        self.assertEqual(self.get_counts(), [("Warning 0.", 2), ("Warning 1.", 1)])
+
+    def test__capacity_ignores_displayed_messages(self):
+        """Test that messages which were already displayed do not count against the capacity."""
+
+        with patch("adminlte2_pdq.message_channel.MESSAGE_CHANNEL_CAPACITY", 2):
+            message_channel.warning(self.request, "Warning 0.")
+            message_channel.warning(self.request, "Warning 1.")
+            self.store_and_reload()
+            self.get_counts()
+
+            message_channel.warning(self.request, "Warning 2.")
+            message_channel.warning(self.request, "Warning 3.")
+            message_channel.warning(self.request, "Warning 4.")
+            self.store_and_reload()
+
+        self.assertEqual(self.get_counts(), [("Warning 2.", 1), ("Warning 3.", 1)])
+
+    def test__messages_below_storage_level_are_ignored(self):
+        """Test that the storage level is respected, the same as for the messages framework."""
+
+        message_channel.add_message(self.request, messages.DEBUG, "Debug message.")
+
+        self.assertEqual(list(self.request._messages), [])
+
+    def test__grouped_messages_template(self):
+        """Test that the messages partial renders each group of identical messages once, with its count."""
+
+        for _ in range(2):
+            message_channel.warning(self.request, "Repeated warning.")
+        messages.warning(self.request, "Repeated warning.")
+        messages.info(self.request, "Single message.")
+
+        self.assertEqual(
+            [(message.message, count) for message, count in message_channel.group_messages(self.request._messages)],
+            [("Repeated warning.", 3), ("Single message.", 1)],
+        )
+
+        content = render_to_string(
+            "adminlte2/partials/_messages.html",
+            {"messages": self.request._messages, "DEFAULT_MESSAGE_LEVELS": messages.DEFAULT_LEVELS},
+        )
+
+        self.assertEqual(content.count("Repeated warning."), 1)
+        self.assertEqual(content.count("Single message."), 1)
+        self.assertInHTML('<span class="badge pull-right" title="Occurrences">3</span>', content)
+        self.assertEqual(content.count('class="badge'), 1)
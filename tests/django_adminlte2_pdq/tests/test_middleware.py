@@ -136,7 +136,7 @@ class NotFound404HandlingTestCase(MiddlewareBaseTestCase):
         self.assertEqual(response.status_code, 404)
         self.assertIn("Not Found", response.content.decode())
 
-    @patch("adminlte2_pdq.middleware.STATIC_ROUTE", "/")
+    @patch("adminlte2_pdq.policy.Policy.static_route", "/")
     def test__unknown_static_url_redirects_to_home_when_static_setting_incorrect(self):
         """Test that an unknown static url redirects to home when the
         static setting is incorrect"""
@@ -151,7 +151,7 @@ class NotFound404HandlingTestCase(MiddlewareBaseTestCase):
         self.assertEqual(response.status_code, 404)
         self.assertIn("Not Found", response.content.decode())
 
-    @patch("adminlte2_pdq.middleware.MEDIA_ROUTE", "/")
+    @patch("adminlte2_pdq.policy.Policy.media_route", "/")
     def test__unknown_media_url_redirects_to_home_when_media_setting_incorrect(self):
         """Test that an unknown media url redirects to home when the
         media setting is incorrect"""
@@ -179,7 +179,7 @@ class NotFound404HandlingTestCase(MiddlewareBaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Dashboard")
 
-    @patch("adminlte2_pdq.middleware.REDIRECT_TO_HOME_ON_404", False)
+    @patch("adminlte2_pdq.policy.Policy.redirect_to_home_on_404", False)
     def test__unknown_app_url_returns_404_when_redirect_turned_off(self):
         """Test that an unknown static url returns the default Django 404 page
         vs redirecting to the home page when redirect turned off"""
@@ -218,28 +218,21 @@ class StandardMiddlewareTestCase(MiddlewareBaseTestCase):
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
 class LoginRequiredMiddlewareTestCase(MiddlewareBaseTestCase):
     """Test Middleware handling when in "LOGIN_REQUIRED" authentication mode."""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # Verify values imported from middleware file.
-        # We don't use constants.py values because the above settings technically don't override such.
-        # Plus this test is a middleware test so it's probably fine.
-        # pylint:disable=redefined-outer-name reimported import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertFalse(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        # Verify values of the Policy, as read by the middleware.
+        # pylint:disable=import-outside-toplevel
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertFalse(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__no_whitelists(self):
         """Test when "LOGIN_REQUIRED" mode and no whitelists set."""
@@ -265,7 +258,7 @@ class LoginRequiredMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "<h1>Demo CSS</h1>")
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", UPDATED_LOGIN_EXEMPT_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", UPDATED_LOGIN_EXEMPT_WHITELIST)
     def test__with_login_whitelist(self):
         """Test when "LOGIN_REQUIRED" mode and login whitelist is set."""
 
@@ -293,28 +286,21 @@ class LoginRequiredMiddlewareTestCase(MiddlewareBaseTestCase):
 
 @override_settings(DEBUG=True)
 @override_settings(APPEND_SLASH=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
 class MiddlewareUrlProcessingTestCaseAppendSlashTrue(MiddlewareBaseTestCase):
     """Test Middleware URL Processing with the APPEND_SLASH setting set to True"""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # Verify values imported from middleware file.
-        # We don't use constants.py values because the above settings technically don't override such.
-        # Plus this test is a middleware test so it's probably fine.
-        # pylint:disable=redefined-outer-name reimported import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertFalse(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        # Verify values of the Policy, as read by the middleware.
+        # pylint:disable=import-outside-toplevel
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertFalse(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
         self.assertTrue(settings.APPEND_SLASH)
 
     def test__trailing_slash__with_valid_url(self):
@@ -433,28 +419,21 @@ class MiddlewareUrlProcessingTestCaseAppendSlashTrue(MiddlewareBaseTestCase):
 
 @override_settings(DEBUG=True)
 @override_settings(APPEND_SLASH=False)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
 class MiddlewareUrlProcessingTestCaseAppendSlashFalse(MiddlewareBaseTestCase):
     """Test Middleware URL Processing with the APPEND_SLASH setting set to False"""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # Verify values imported from middleware file.
-        # We don't use constants.py values because the above settings technically don't override such.
-        # Plus this test is a middleware test so it's probably fine.
-        # pylint:disable=redefined-outer-name reimported import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertFalse(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        # Verify values of the Policy, as read by the middleware.
+        # pylint:disable=import-outside-toplevel
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertFalse(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
         self.assertFalse(settings.APPEND_SLASH)
 
     def test__trailing_slash__with_valid_url(self):
@@ -539,29 +518,22 @@ class MiddlewareUrlProcessingTestCaseAppendSlashFalse(MiddlewareBaseTestCase):
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
     """Test Middleware handling when in "STRICT" authentication mode."""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # Verify values imported from middleware file.
-        # We don't use constants.py values because the above settings technically don't override such.
-        # Plus this test is a middleware test so it's probably fine.
-        # pylint:disable=redefined-outer-name reimported import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        # Verify values of the Policy, as read by the middleware.
+        # pylint:disable=import-outside-toplevel
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__no_whitelists(self):
         """Test when "STRICT" mode and no whitelist is set."""
@@ -620,7 +592,7 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "Home")
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", UPDATED_LOGIN_EXEMPT_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", UPDATED_LOGIN_EXEMPT_WHITELIST)
     def test__with_login_whitelist(self):
         """Test when "STRICT" mode and login whitelist is set."""
 
@@ -668,7 +640,7 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             # Assert warnings match.
             self.assertEqual(expected_warns, actual_warns)
 
-    @patch("adminlte2_pdq.middleware.STRICT_POLICY_WHITELIST", UPDATED_STRICT_POLICY_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", UPDATED_STRICT_POLICY_WHITELIST)
     def test__with_permission_whitelist(self):
         """Test when "STRICT" mode and permission whitelist is set."""
 
@@ -693,8 +665,8 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "<h1>Demo CSS</h1>")
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", UPDATED_LOGIN_EXEMPT_WHITELIST)
-    @patch("adminlte2_pdq.middleware.STRICT_POLICY_WHITELIST", UPDATED_STRICT_POLICY_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", UPDATED_LOGIN_EXEMPT_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", UPDATED_STRICT_POLICY_WHITELIST)
     def test__with_both_whitelists(self):
         """Test when "STRICT" mode and both whitelists are set."""
 
@@ -719,7 +691,7 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "<h1>Demo CSS</h1>")
 
-    @patch("adminlte2_pdq.middleware.MEDIA_ROUTE", "/")  # Pretend the root url is a media file.
+    @patch("adminlte2_pdq.policy.Policy.media_route", "/")  # Pretend the root url is a media file.
     def test__no_whitelists_and_home_page_is_media_route(self):
         """Test no white lists and home page is media route"""
         # MEDIA_URL should not be allowed to be the root of a website, thus can not skip the login required check.
@@ -734,7 +706,7 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "Login")
 
-    @patch("adminlte2_pdq.middleware.MEDIA_ROUTE", "/demo-css/")  # Pretend the demo-css route is a media file.
+    @patch("adminlte2_pdq.policy.Policy.media_route", "/demo-css/")  # Pretend the demo-css route is a media file.
     def test__no_whitelists_and_misc_page_is_media_route(self):
         """Test no white lists and misc page is media route"""
 
@@ -746,7 +718,7 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "<h1>Demo CSS</h1>")
 
-    @patch("adminlte2_pdq.middleware.WEBSOCKET_ROUTE", "/")  # Pretend the root url is a websocket file.
+    @patch("adminlte2_pdq.policy.Policy.websocket_route", "/")  # Pretend the root url is a websocket file.
     def test__no_whitelists_and_home_page_is_websocket_route(self):
         """Test no white lists and home page is websocket route"""
         # WEBSOCKET_URL should not be allowed to be the root of a website, thus can not skip the login required check.
@@ -761,7 +733,8 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertEqual(response.status_code, 200)
             self.assertContains(response, "Login")
 
-    @patch("adminlte2_pdq.middleware.WEBSOCKET_ROUTE", "/demo-css/")  # Pretend the demo-css route is a websocket file.
+    # Pretend the demo-css route is a websocket file.
+    @patch("adminlte2_pdq.policy.Policy.websocket_route", "/demo-css/")
     def test__no_whitelists_and_misc_page_is_websocket_route(self):
         """Test no white lists and misc page is websocket route"""
 
@@ -774,11 +747,11 @@ class StrictMiddlewareTestCase(MiddlewareBaseTestCase):
             self.assertContains(response, "<h1>Demo CSS</h1>")
 
     @patch(
-        "adminlte2_pdq.middleware.STRICT_POLICY_SERVE_403_FUZZY_WHITELIST",
+        "adminlte2_pdq.policy.Policy.strict_policy_serve_403_fuzzy_whitelist",
         UPDATED_STRICT_POLICY_SERVE_403_FUZZY_WHITELIST,
     )
     @patch(
-        "adminlte2_pdq.mixins.STRICT_POLICY_SERVE_403_FUZZY_WHITELIST",
+        "adminlte2_pdq.policy.Policy.strict_policy_serve_403_fuzzy_whitelist",
         UPDATED_STRICT_POLICY_SERVE_403_FUZZY_WHITELIST,
     )
     def test__with_fuzzy_403_whitelist(self):
@@ -9,9 +9,11 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from django.views import View
+from django.views.generic import ListView
 
 # Internal Imports.
 from adminlte2_pdq.constants import LOGIN_EXEMPT_WHITELIST, STRICT_POLICY_WHITELIST
@@ -19,6 +21,7 @@ from adminlte2_pdq.mixins import (
     AllowAnonymousAccessMixin,
     LoginRequiredMixin,
     AllowWithoutPermissionsMixin,
+    ObjectPermissionRequiredMixin,
     PermissionRequiredMixin,
 )
 
@@ -35,6 +38,23 @@ WHITELIST_VIEWS = [
 ]
 LOGIN_WHITELIST_VIEWS = LOGIN_EXEMPT_WHITELIST + WHITELIST_VIEWS
 PERM_WHITELIST_VIEWS = STRICT_POLICY_WHITELIST + WHITELIST_VIEWS
+OBJECT_PERMISSION_BACKENDS = [
+    "django.contrib.auth.backends.ModelBackend",
+    "tests.django_adminlte2_pdq.tests.test_mixins.test_isolated_mixins.ObjectPermissionBackend",
+]
+
+
+class ObjectPermissionBackend:
+    """Test authentication backend, granting object permissions on Permissions with a "_foo" codename."""
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def get_object_permission_q(self, user_obj, perms, model):
+        """Test object permission hook"""
+        if model is not Permission or not user_obj.has_perms(perms):
+            return None
+        return Q(codename__endswith="_foo")
 
 
 class TestIsolatedMixins(TestCase):
@@ -396,3 +416,111 @@ class TestIsolatedMixins(TestCase):
         )
 
     # endregion Permission Required Tests
+
+    # region Object Permission Required Tests
+
+    def get_object_permission_queryset(self, view_class, user):
+        """Get the queryset of the given view class, as the given user."""
+        request = self.factory.get("/rand")
+        setattr(request, "user", user)
+        view = view_class()
+        view.setup(request)
+        return view.get_queryset()
+
+    @override_settings(AUTHENTICATION_BACKENDS=OBJECT_PERMISSION_BACKENDS)
+    def test__object_permission_required__filters_queryset_with_backend_q(self):
+        """Test ObjectPermissionRequiredMixin applies the backend Q object as a single queryset filter."""
+
+        class TestView(ObjectPermissionRequiredMixin, ListView):
+            """Test View Class"""
+
+            model = Permission
+            permission_required = "auth.add_foo"
+            object_permission_required = "auth.change_foo"
+
+        with self.assertNumQueries(3):
+            # Two queries to load the user/group permissions, one to fetch the filtered objects.
+            objects = list(self.get_object_permission_queryset(TestView, self.full_user))
+
+        self.assertEqual(sorted(obj.codename for obj in objects), ["add_foo", "change_foo"])
+
+        # Backend does not grant object permissions when user is missing the perms.
+        self.assertEqual(list(self.get_object_permission_queryset(TestView, self.partial_user)), [])
+
+        # View is still rendered through dispatch.
+        request = self.factory.get("/rand")
+        setattr(request, "user", self.full_user)
+        response = TestView.as_view(template_name="adminlte2/pages/index.html")(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context_data["object_list"]), 2)
+
+    def test__object_permission_required__matches_nothing_without_backend_hook(self):
+        """Test ObjectPermissionRequiredMixin returns no objects when no backend handles object permissions."""
+
+        class TestView(ObjectPermissionRequiredMixin, ListView):
+            """Test View Class"""
+
+            model = Permission
+            permission_required = "auth.add_foo"
+            object_permission_required = ["auth.add_foo", "auth.change_foo"]
+
+        self.assertEqual(list(self.get_object_permission_queryset(TestView, self.full_user)), [])
+
+    def test__object_permission_required__superuser_and_no_object_perms_are_unfiltered(self):
+        """Test ObjectPermissionRequiredMixin does not filter for superusers, or when no object perms are set."""
+
+        class TestView(ObjectPermissionRequiredMixin, ListView):
+            """Test View Class"""
+
+            model = Permission
+            permission_required = "auth.add_foo"
+            object_permission_required = "auth.change_foo"
+
+        class NoObjectPermsView(ObjectPermissionRequiredMixin, ListView):
+            """Test View Class"""
+
+            model = Permission
+            permission_required = "auth.add_foo"
+
+        superuser = UserModel.objects.create(username="jillsuper", password="qwerty", is_superuser=True)
+        total = Permission.objects.count()
+
+        self.assertEqual(self.get_object_permission_queryset(TestView, superuser).count(), total)
+        self.assertEqual(self.get_object_permission_queryset(NoObjectPermsView, self.none_user).count(), total)
+
+    def test__object_permission_required__keeps_model_permission_policy(self):
+        """Test ObjectPermissionRequiredMixin is treated as a permission view, and enforces model permissions."""
+
+        class TestView(ObjectPermissionRequiredMixin, ListView):
+            """Test View Class"""
+
+            model = Permission
+            permission_required = "auth.change_foo"
+            object_permission_required = "auth.change_foo"
+
+        self.assertEqual(TestView.admin_pdq_data["decorator_name"], "permission_required")
+
+        request = self.factory.get("/rand")
+        setattr(request, "user", self.partial_user)
+        response = TestView.as_view()(request)
+        self.assertEqual(response.status_code, 302)
+
+    def test__object_permission_required__raises_error_when_permission_is_unknown_type(self):
+        """Test ObjectPermissionRequiredMixin raises error when object permission type is unknown type"""
+
+        class TestView(ObjectPermissionRequiredMixin, ListView):
+            """Test View Class"""
+
+            model = Permission
+            permission_required = "auth.add_foo"
+            object_permission_required = max
+
+        with self.assertRaises(TypeError) as cm:
+            self.get_object_permission_queryset(TestView, self.full_user)
+
+        self.assertEqual(
+            str(cm.exception),
+            f"Unknown type ({type(max)}) for object permission. Expected list, tuple, or string.",
+        )
+
+    # endregion Object Permission Required Tests
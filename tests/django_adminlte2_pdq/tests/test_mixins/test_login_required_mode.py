@@ -318,37 +318,30 @@ class LoginModeMixin:
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
 class TestLoginRequiredAuthenticationMixins(BaseMixinTextCase, LoginModeMixin):
     """Runtime test execution of mixins under "Login Required" mode."""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
+        from adminlte2_pdq.policy import Policy
 
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertFalse(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        self.assertTrue(Policy.login_required)
+        self.assertFalse(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", LOGIN_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", LOGIN_WHITELIST_VIEWS)
 class TestLoginRequiredAuthenticationMixinsWithLoginWhitelist(BaseMixinTextCase, LoginModeMixin):
     """Runtime test execution of mixins under "Login Required" mode, with whitelist set for views.
 
@@ -366,25 +359,18 @@ class TestLoginRequiredAuthenticationMixinsWithLoginWhitelist(BaseMixinTextCase,
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertFalse(STRICT_POLICY)
-        self.assertEqual(13, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertFalse(Policy.strict_policy)
+        self.assertEqual(13, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__no_mixins(self):
         """Test for view with no mixins, in project "LOGIN REQUIRED" mode, with login whitelist.
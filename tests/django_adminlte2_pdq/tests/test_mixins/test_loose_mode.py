@@ -48,7 +48,7 @@ class TestLooseAuthenticationMixins(BaseMixinTextCase):
         self.assertFalse(LOGIN_REQUIRED)
         self.assertFalse(STRICT_POLICY)
         self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        self.assertEqual(12, len(STRICT_POLICY_WHITELIST))
 
     def test__no_mixins(self):
         """Test for view with no mixins, in project "Loose" mode. For sanity checking."""
@@ -142,7 +142,7 @@ class TestLooseAuthenticationMixins(BaseMixinTextCase):
                     login_required=True,
                 )
 
-    @patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq_tests:class-login-required"])
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq_tests:class-login-required"])
     def test__login_required_decorator_and_login_whitelisted(self):
         """Test when both login_required decorator used and view is login whitelisted
         in "Loose" mode raises improperly configured error."""
@@ -542,7 +542,7 @@ class TestLooseAutAuthenticationMixinsWithLogicBleed(BaseMixinTextCase):
         self.assertFalse(LOGIN_REQUIRED)
         self.assertFalse(STRICT_POLICY)
         self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        self.assertEqual(12, len(STRICT_POLICY_WHITELIST))
 
     def test__bleeding_anonymous_with_permissions(self):
         """Bleeding tests for allow_anonymous_access mixin, in project "Loose" mode."""
@@ -838,7 +838,7 @@ class TestLooseAutAuthenticationMixinsWithLogicBleedInProduction(BaseMixinTextCa
         self.assertFalse(LOGIN_REQUIRED)
         self.assertFalse(STRICT_POLICY)
         self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        self.assertEqual(12, len(STRICT_POLICY_WHITELIST))
 
     def test__bleeding_one_permission_missing_permissions__in_production(self):
         """Bleeding tests for permission_required_one mixin, in project "Loose" mode in production."""
@@ -379,36 +379,29 @@ class StrictModeMixin:
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class TestStrictAuthenticationMixins(BaseMixinTextCase, StrictModeMixin):
     """Runtime test execution of mixins under "Strict" mode."""
 
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     @override_settings(DEBUG=False)
-    @patch("adminlte2_pdq.middleware.REDIRECT_TO_HOME_ON_403", False)
+    @patch("adminlte2_pdq.policy.Policy.redirect_to_home_on_403", False)
     def test__no_decorators__redirect_on_403_turned_off(self):
         """Test for view with perms, in project "Strict" mode
         and the redirect on 403 setting is set to False.
@@ -489,9 +482,9 @@ class TestStrictAuthenticationMixins(BaseMixinTextCase, StrictModeMixin):
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
-@patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", LOGIN_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+@patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", LOGIN_WHITELIST_VIEWS)
 class TestStrictAuthenticationMixinsWithLoginWhitelist(BaseMixinTextCase, StrictModeMixin):
     """Runtime test execution of mixins under "Strict" mode, with login whitelist set for views.
 
@@ -506,25 +499,18 @@ class TestStrictAuthenticationMixinsWithLoginWhitelist(BaseMixinTextCase, Strict
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(13, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(13, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__no_mixins(self):
         """Test for view with no mixins, in project "Strict" mode, with login whitelist.
@@ -909,9 +895,9 @@ class TestStrictAuthenticationMixinsWithLoginWhitelist(BaseMixinTextCase, Strict
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY_WHITELIST", PERM_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", PERM_WHITELIST_VIEWS)
 class TestStrictAuthenticationMixinsWithPermWhitelist(BaseMixinTextCase, StrictModeMixin):
     """Runtime test execution of mixins under "Strict" mode, with login whitelist set for views.
 
@@ -925,25 +911,18 @@ class TestStrictAuthenticationMixinsWithPermWhitelist(BaseMixinTextCase, StrictM
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(16, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(18, len(Policy.strict_policy_whitelist))
 
     def test__no_mixins(self):
         """Test for view with no mixins, in project "Strict" mode, with perm whitelist.
@@ -1122,10 +1101,10 @@ class TestStrictAuthenticationMixinsWithPermWhitelist(BaseMixinTextCase, StrictM
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
-@patch("adminlte2_pdq.middleware.LOGIN_EXEMPT_WHITELIST", LOGIN_WHITELIST_VIEWS)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY_WHITELIST", PERM_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+@patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", LOGIN_WHITELIST_VIEWS)
+@patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", PERM_WHITELIST_VIEWS)
 class TestStrictAuthenticationMixinsWithBothWhitelists(BaseMixinTextCase, StrictModeMixin):
     """Runtime test execution of mixins under "Strict" mode, with login whitelist set for views.
 
@@ -1138,25 +1117,18 @@ class TestStrictAuthenticationMixinsWithBothWhitelists(BaseMixinTextCase, Strict
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(13, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(16, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(13, len(Policy.login_exempt_whitelist))
+        self.assertEqual(18, len(Policy.strict_policy_whitelist))
 
     def test__no_mixins(self):
         """Test for view with no mixin, in project "strict" mode, with both whitelists."""
@@ -1319,8 +1291,8 @@ class TestStrictAuthenticationMixinsWithBothWhitelists(BaseMixinTextCase, Strict
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class TestStrictAutAuthenticationMixinsWithLogicBleed(BaseMixinTextCase):
     """Tests to make sure mixin logic doesn't bleed into each other.
 
@@ -1342,25 +1314,18 @@ class TestStrictAutAuthenticationMixinsWithLogicBleed(BaseMixinTextCase):
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__bleeding_anonymous_with_permissions(self):
         """Bleeding tests for allow_anonymous_access mixin, in project "Strict" mode."""
@@ -1656,8 +1621,8 @@ class TestStrictAutAuthenticationMixinsWithLogicBleed(BaseMixinTextCase):
 
 
 @override_settings(DEBUG=True)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class TestStrictAutAuthenticationMixinsWithOverlap(BaseMixinTextCase):
     """Tests for overlapping mixin use.
 
@@ -1793,8 +1758,8 @@ class TestStrictAutAuthenticationMixinsWithOverlap(BaseMixinTextCase):
 
 
 @override_settings(DEBUG=False)
-@patch("adminlte2_pdq.middleware.LOGIN_REQUIRED", True)
-@patch("adminlte2_pdq.middleware.STRICT_POLICY", True)
+@patch("adminlte2_pdq.policy.Policy.login_required", True)
+@patch("adminlte2_pdq.policy.Policy.strict_policy", True)
 class TestStrictAutAuthenticationMixinsWithLogicBleedInProduction(BaseMixinTextCase):
     """Tests to make sure mixin logic doesn't bleed into each other.
 
@@ -1816,25 +1781,18 @@ class TestStrictAutAuthenticationMixinsWithLogicBleedInProduction(BaseMixinTextC
     def test__verify_patch_settings(self):
         """Sanity check tests, to make sure settings are set as intended, even if other tests fail."""
 
-        # NOTE: The heavy lifting of these tests is done in the middleware.
-        # Therefore the patch that is used needs to target the imports in the middleware.
-        # Import from the middleware to verify that the patch works as intended.
+        # NOTE: The heavy lifting of these tests is done in the middleware, which reads the package Policy.
         # Settings do not need to be overridden because every setting is first converted
-        # to a constant. So, we only need to patch the constant in the middleware.
+        # to a Policy attribute. So, we only need to patch the attribute on the Policy.
 
-        # Verify values imported from middleware.py file.
+        # Verify values of the Policy.
         # pylint: disable=import-outside-toplevel
-        from adminlte2_pdq.middleware import (
-            LOGIN_REQUIRED,
-            STRICT_POLICY,
-            LOGIN_EXEMPT_WHITELIST,
-            STRICT_POLICY_WHITELIST,
-        )
-
-        self.assertTrue(LOGIN_REQUIRED)
-        self.assertTrue(STRICT_POLICY)
-        self.assertEqual(7, len(LOGIN_EXEMPT_WHITELIST))
-        self.assertEqual(10, len(STRICT_POLICY_WHITELIST))
+        from adminlte2_pdq.policy import Policy
+
+        self.assertTrue(Policy.login_required)
+        self.assertTrue(Policy.strict_policy)
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
 
     def test__bleeding_conflicting_permissions__in_production(self):
         """Bleeding tests for allow_without_permissions mixin, in project "Strict" mode in production."""
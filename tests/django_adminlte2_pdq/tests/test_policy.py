@@ -0,0 +1,63 @@
+"""
+Tests for the Authentication and Authorization Policy
+"""
+
+# Third-Party Imports.
+from django.test import TestCase, override_settings
+
+# Internal Imports.
+from adminlte2_pdq.middleware import get_auth_middleware
+from adminlte2_pdq.policy import Policy
+
+
+class TestPolicy(TestCase):
+    """Tests for building and reloading the package policy."""
+
+    def test__built_from_settings(self):
+        """Test that the policy is built when the app is ready, matching the test project settings."""
+
+        self.assertFalse(Policy.strict_policy)
+        self.assertFalse(Policy.login_required)
+        self.assertEqual(Policy.home_route, "adminlte2_pdq:home")
+        self.assertEqual(7, len(Policy.login_exempt_whitelist))
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
+        self.assertFalse(hasattr(Policy, "__dict__"))
+
+    def test__reloaded_on_setting_change(self):
+        """Test that changes to policy settings apply without reloading any modules."""
+
+        with override_settings(ADMINLTE2_USE_STRICT_POLICY=True, ADMINLTE2_STRICT_POLICY_WHITELIST=["foo"]):
+            self.assertTrue(Policy.strict_policy)
+            self.assertTrue(Policy.login_required)
+            self.assertEqual(13, len(Policy.strict_policy_whitelist))
+
+        self.assertFalse(Policy.strict_policy)
+        self.assertFalse(Policy.login_required)
+        self.assertEqual(12, len(Policy.strict_policy_whitelist))
+
+        with override_settings(ADMINLTE2_RESPONSE_404_DEBUG_MESSAGE="  Not here.  "):
+            self.assertEqual(Policy.response_404_debug_message, "Not here.")
+
+    def test__invalid_setting_change_keeps_policy(self):
+        """Test that a change to an invalid combination of settings keeps the previous policy."""
+
+        with self.assertLogs("adminlte2_pdq.policy", "WARNING"):
+            with override_settings(ADMINLTE2_LOGIN_EXEMPT_WHITELIST=["foo"]):
+                self.assertEqual(7, len(Policy.login_exempt_whitelist))
+
+    def test__other_setting_change_keeps_policy(self):
+        """Test that changes to settings the policy isn't built from don't rebuild it, so patches still apply."""
+
+        whitelist = Policy.login_exempt_whitelist
+        with override_settings(DEBUG=True):
+            self.assertIs(Policy.login_exempt_whitelist, whitelist)
+
+    def test__bound_to_middleware(self):
+        """Test that the middleware reads the reloaded policy."""
+
+        middleware = get_auth_middleware()
+
+        self.assertIs(middleware.policy, Policy)
+        with override_settings(ADMINLTE2_USE_LOGIN_REQUIRED=True):
+            self.assertTrue(middleware.view_requires_login({"login_required": False}))
+        self.assertFalse(middleware.view_requires_login({"login_required": False}))
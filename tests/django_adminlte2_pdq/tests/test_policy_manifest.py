@@ -0,0 +1,131 @@
+"""
+Tests for the Route Policy Manifest
+"""
+
+# System Imports.
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import resolve
+
+# Internal Imports.
+from adminlte2_pdq.management.commands.policymanifest import build_manifest
+from adminlte2_pdq.middleware import AuthMiddleware
+from adminlte2_pdq.policy_manifest import PolicyManifest, get_policy_checksum, get_route_key
+from adminlte2_pdq.templatetags.sidebar_menu import get_view_data_from_node
+
+
+class TestPolicyManifest(TestCase):
+    """Tests for building, loading and using the route policy manifest."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()  # pylint:disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.manifest_path = str(Path(temp_dir.name) / "manifest.json")
+
+        patcher = patch("adminlte2_pdq.policy.Policy.route_policy_manifest", self.manifest_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        PolicyManifest.clear()
+        self.addCleanup(PolicyManifest.clear)
+
+    def write_manifest(self, manifest=None):
+        """Write a manifest to the manifest path. Defaults to a manifest of the current project."""
+        with open(self.manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest or build_manifest(), manifest_file)
+
+        # Load the new manifest on next use.
+        PolicyManifest.clear()
+
+    def test__route_data_matches_live_introspection(self):
+        """Test that the stored view data matches the data that the middleware calculates from the view."""
+
+        self.write_manifest()
+
+        route_data = PolicyManifest.get_route_data("tests/function/one_permission/")
+
+        self.assertEqual(route_data["decorator_name"], "permission_required")
+        self.assertEqual(route_data["one_of_permissions"], ("auth.add_foo", "auth.change_foo"))
+        self.assertEqual(route_data["view_type"], "function-based")
+        self.assertIsNone(PolicyManifest.get_route_data("tests/missing/"))
+
+    def test__middleware_uses_manifest(self):
+        """Test that requests are handled the same, without introspecting views."""
+
+        expected = {
+            url: self.client.get(url).status_code
+            for url in ("/tests/function/standard/", "/tests/function/login/", "/tests/function/one_permission/")
+        }
+
+        self.write_manifest()
+        with patch.object(AuthMiddleware, "parse_view_data", side_effect=AssertionError("View was introspected.")):
+            for url, status_code in expected.items():
+                with self.subTest(url=url):
+                    self.assertEqual(self.client.get(url).status_code, status_code)
+
+    def test__sidebar_uses_manifest(self):
+        """Test that menu nodes get the stored view data, without resolving the node route."""
+
+        self.write_manifest()
+        node = {"route": "adminlte2_pdq:sample1", "text": "Sample1"}
+
+        with patch("adminlte2_pdq.templatetags.sidebar_menu.get_view_from_node") as get_view_from_node:
+            view_data = get_view_data_from_node(node)
+
+        get_view_from_node.assert_not_called()
+        self.assertEqual(view_data["decorator_name"], "permission_required")
+        self.assertEqual(view_data["full_permissions"], ("auth.add_group", "auth.change_group", "auth.delete_group"))
+
+    def test__out_of_date_manifest_is_ignored(self):
+        """Test that a manifest with a different checksum falls back to live introspection."""
+
+        manifest = build_manifest()
+        manifest["checksum"] = "changed"
+        self.write_manifest(manifest)
+
+        with self.assertLogs("adminlte2_pdq.policy_manifest", "WARNING"):
+            self.assertFalse(PolicyManifest.load())
+
+        self.assertIsNone(PolicyManifest.get_route_data("tests/function/one_permission/"))
+        self.assertEqual(self.client.get("/tests/function/standard/").status_code, 200)
+
+    def test__checksum_covers_view_policies(self):
+        """Test that changing the permissions of a view changes the checksum, so that old manifests are ignored."""
+
+        checksum = get_policy_checksum()
+        view = resolve("/tests/function/one_permission/").func
+
+        with patch.object(view, "permission_required_one", ("auth.add_foo",)):
+            self.assertNotEqual(get_policy_checksum(), checksum)
+
+        with patch.dict(view.admin_pdq_data, {"decorator_name": "login_required"}):
+            self.assertNotEqual(get_policy_checksum(), checksum)
+
+        self.assertEqual(get_policy_checksum(), checksum)
+
+    def test__route_key(self):
+        """Test that route keys match between joined regex patterns and resolved routes."""
+
+        self.assertEqual(get_route_key("^api/^items/$"), get_route_key("^api/items/$"))
+
+    def test__command(self):
+        """Test that the command writes a manifest, and checks if it is up to date."""
+
+        stdout = StringIO()
+        call_command("policymanifest", f"--output={self.manifest_path}", stdout=stdout)
+        call_command("policymanifest", f"--output={self.manifest_path}", "--check", stdout=stdout)
+
+        self.assertIn("is up to date", stdout.getvalue())
+        self.assertTrue(PolicyManifest.load())
+
+        self.write_manifest({"version": 0})
+        with self.assertRaisesMessage(CommandError, "is out of date"):
+            call_command("policymanifest", f"--output={self.manifest_path}", "--check", stdout=stdout)
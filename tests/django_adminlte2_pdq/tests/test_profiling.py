@@ -0,0 +1,89 @@
+"""
+Tests for the Page Profiler
+"""
+
+# System Imports.
+import json
+from io import StringIO
+
+# Third-Party Imports.
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+# Internal Imports.
+from adminlte2_pdq.admin_menu import AdminMenu
+from adminlte2_pdq.middleware import AuthMiddleware
+from adminlte2_pdq.profiling import OTHER_COMPONENT, PageProfiler, profile_page
+
+
+class TestPageProfiler(TestCase):
+    """Tests for profiling the package components of a page."""
+
+    def test__components_are_timed(self):
+        """Test that the middleware and sidebar menu tags of a page are reported, with queries per component."""
+
+        user = get_user_model().objects.create_superuser(username="test_superuser", password="password")
+
+        report = profile_page("/admin/", user=user, top=5)
+
+        self.assertEqual(report["status_code"], 200)
+        self.assertEqual(report["user"], "test_superuser")
+        components = report["components"]
+        for name in ("auth_middleware", "view", "admin_menu", "tag.render_admin_menu", "tag.render_link"):
+            with self.subTest(name):
+                self.assertIn(name, components)
+                self.assertGreater(components[name]["calls"], 0)
+        self.assertIn(OTHER_COMPONENT, components)
+
+        # Every query is counted against exactly one component.
+        self.assertEqual(sum(timing["queries"] for timing in components.values()), report["queries"])
+        # Times are self times, so add up to the whole request.
+        self.assertAlmostEqual(sum(timing["time_ms"] for timing in components.values()), report["time_ms"], delta=0.1)
+
+        self.assertEqual(len(report["profile"]), 5)
+
+        # The session of the profiling client is not left behind.
+        self.assertFalse(Session.objects.exists())
+
+    def test__hooks_are_removed(self):
+        """Test that hooks are only installed while profiling."""
+
+        run_auth_checks = AuthMiddleware.run_auth_checks
+
+        with PageProfiler.profile():
+            self.assertIsNot(AuthMiddleware.run_auth_checks, run_auth_checks)
+            self.assertIn("create_menu", vars(AdminMenu))
+
+        self.assertIs(AuthMiddleware.run_auth_checks, run_auth_checks)
+        self.assertNotIn("create_menu", vars(AdminMenu))
+
+        with PageProfiler.component("auth_middleware"):
+            pass
+        self.assertEqual(PageProfiler.components, {})
+
+    def test__command(self):
+        """Test that the command reports json, and a table."""
+
+        get_user_model().objects.create_user(username="test_user", password="password")
+
+        stdout = StringIO()
+        call_command("profilepage", "/home/", "--user=test_user", "--top=3", "--format=json", stdout=stdout)
+        report = json.loads(stdout.getvalue())
+
+        self.assertEqual(report["path"], "/home/")
+        self.assertIn("tag.render_menu", report["components"])
+        self.assertEqual(len(report["profile"]), 3)
+
+        stdout = StringIO()
+        call_command("profilepage", "/home/", "--top=0", "--cold", stdout=stdout)
+        output = stdout.getvalue()
+
+        self.assertIn("as anonymous user", output)
+        self.assertIn("auth_middleware", output)
+        self.assertNotIn("Function", output)
+
+        with self.assertRaisesMessage(CommandError, 'User "missing" does not exist.'):
+            call_command("profilepage", "/home/", "--user=missing", stdout=stdout)
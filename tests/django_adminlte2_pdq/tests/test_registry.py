@@ -0,0 +1,110 @@
+"""
+Tests for the View Policy Registry
+"""
+
+# Third-Party Imports.
+from django.test import TestCase
+from django.views.generic import TemplateView
+
+# Internal Imports.
+from adminlte2_pdq.mixins import (
+    AllowAnonymousAccessMixin,
+    AllowWithoutPermissionsMixin,
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+)
+from adminlte2_pdq.registry import VIEW_POLICY_REGISTRY
+from tests.django_adminlte2_pdq.django_test_project import views
+
+
+class TestViewPolicyRegistry(TestCase):
+    """Tests for the class-keyed view policy registry."""
+
+    def test__mixin_subclasses_are_registered(self):
+        """Test that every class inheriting a package mixin is registered with the matching policy."""
+
+        for view_class, decorator_name in (
+            (views.AllowAnonymousAccessView, "allow_anonymous_access"),
+            (views.LoginRequiredView, "login_required"),
+            (views.AllowWithoutPermissionsView, "allow_without_permissions"),
+            (views.OnePermissionRequiredView, "permission_required"),
+        ):
+            with self.subTest(view_class.__name__):
+                record = VIEW_POLICY_REGISTRY.get(view_class)
+
+                self.assertIsNotNone(record)
+                self.assertIs(record["view_class"], view_class)
+                self.assertEqual(record["decorator_name"], decorator_name)
+                self.assertEqual(record["allow_anonymous_access"], view_class.admin_pdq_data["allow_anonymous_access"])
+                self.assertEqual(record["login_required"], view_class.admin_pdq_data["login_required"])
+
+    def test__lookup_by_qualified_name(self):
+        """Test that records can be found by fully qualified name, which matches url lookup strings."""
+
+        qualified_name = f"{views.LoginRequiredView.__module__}.{views.LoginRequiredView.__qualname__}"
+
+        self.assertIn(qualified_name, VIEW_POLICY_REGISTRY)
+        self.assertIs(VIEW_POLICY_REGISTRY.get(qualified_name), VIEW_POLICY_REGISTRY.get(views.LoginRequiredView))
+        self.assertIsNone(VIEW_POLICY_REGISTRY.get(f"{views.__name__}.NotAView"))
+
+    def test__same_class_name_does_not_collide(self):
+        """Test that two views sharing a class name are registered independently."""
+
+        def make_anonymous_view():
+            class SharedNameView(AllowAnonymousAccessMixin, TemplateView):
+                """Anonymous view."""
+
+            return SharedNameView
+
+        def make_permission_view():
+            class SharedNameView(PermissionRequiredMixin, TemplateView):
+                """Permission view."""
+
+                permission_required = "auth.add_foo"
+
+            return SharedNameView
+
+        anonymous_view = make_anonymous_view()
+        permission_view = make_permission_view()
+
+        self.assertEqual(VIEW_POLICY_REGISTRY.get(anonymous_view)["decorator_name"], "allow_anonymous_access")
+        self.assertEqual(VIEW_POLICY_REGISTRY.get(permission_view)["decorator_name"], "permission_required")
+
+    def test__first_mixin_in_mro_defines_policy(self):
+        """Test that the record matches the admin_pdq_data that attribute lookup resolves to."""
+
+        class StackedView(LoginRequiredMixin, AllowWithoutPermissionsMixin, TemplateView):
+            """View with stacked mixins."""
+
+        record = VIEW_POLICY_REGISTRY.get(StackedView)
+
+        self.assertEqual(record["decorator_name"], StackedView.admin_pdq_data["decorator_name"])
+        self.assertEqual(record["decorator_name"], "login_required")
+
+    def test__get_admin_pdq_data_falls_back_to_class_attribute(self):
+        """Test unregistered classes fall back to their own admin_pdq_data, if any."""
+
+        class PlainView(TemplateView):
+            """View without package mixins."""
+
+        self.assertNotIn(PlainView, VIEW_POLICY_REGISTRY)
+        self.assertEqual(VIEW_POLICY_REGISTRY.get_admin_pdq_data(PlainView), {})
+
+        PlainView.admin_pdq_data = {"decorator_name": ""}
+        self.assertEqual(VIEW_POLICY_REGISTRY.get_admin_pdq_data(PlainView), {"decorator_name": ""})
+
+    def test__deprecated_subclasses_attribute(self):
+        """Test that the mixin "subclasses" attribute still lists inheriting class names, with a warning."""
+
+        class CompatView(LoginRequiredMixin, TemplateView):
+            """View read through the deprecated attribute."""
+
+        with self.assertWarns(DeprecationWarning):
+            subclasses = LoginRequiredMixin.subclasses
+
+        self.assertIn("LoginRequiredView", subclasses)
+        self.assertEqual(subclasses[-1], "CompatView")
+        self.assertNotIn("AllowAnonymousAccessView", subclasses)
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(CompatView.subclasses, subclasses)
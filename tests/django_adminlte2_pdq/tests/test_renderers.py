@@ -0,0 +1,124 @@
+"""
+Tests for Form Renderers
+"""
+
+# System Imports.
+from pathlib import Path
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django import forms
+from django.http import StreamingHttpResponse
+from django.template import Context, Template
+from django.template.engine import Engine
+from django.test import TestCase, override_settings
+from django.utils.autoreload import file_changed
+
+# Internal Imports.
+from adminlte2_pdq.renderers import (
+    FORM_PARTIALS,
+    PARTIAL_TEMPLATES,
+    AdminLteFormRenderer,
+    AdminLteHorizontalFormRenderer,
+    stream_horizontal_formset,
+)
+
+
+class SampleForm(forms.Form):
+    """Test Form, with one field per widget partial."""
+
+    test_hidden = forms.CharField(widget=forms.HiddenInput, required=False)
+    test_checkbox = forms.BooleanField()
+    test_select = forms.ChoiceField(choices=[("a", "A"), ("b", "B")])
+    test_null_boolean = forms.NullBooleanField(required=False)
+    test_radio = forms.ChoiceField(choices=[("a", "A"), ("b", "B")], widget=forms.RadioSelect)
+    test_checkbox_select = forms.MultipleChoiceField(
+        choices=[("a", "A"), ("b", "B")],
+        widget=forms.CheckboxSelectMultiple,
+        required=False,
+    )
+    test_file = forms.FileField(required=False)
+    test_date = forms.DateField(required=False, help_text="Date help text")
+    test_text = forms.CharField()
+
+
+class SampleFormRenderers(TestCase):
+    """Tests for the precompiled partial templates and the streamed formset."""
+
+    def test__partial_templates__included_without_loading(self):
+        """Test the form tags include the precompiled partials, instead of loading them by name each render."""
+
+        PARTIAL_TEMPLATES.clear()
+        form_template = Template("{% load adminlte_tags %}{% render_form form %}{% render_horizontal_form form %}")
+        form_template.render(Context({"form": SampleForm()}))
+
+        with patch.object(Engine, "get_template", autospec=True, side_effect=Engine.get_template) as mock_get_template:
+            form_template.render(Context({"form": SampleForm()}))
+
+        loaded_templates = {call.args[1] for call in mock_get_template.call_args_list}
+        self.assertFalse(loaded_templates & set(FORM_PARTIALS.values()))
+
+    def test__partial_templates__cleared_on_template_settings_change(self):
+        """Test compiled templates are discarded when the TEMPLATES setting changes."""
+
+        PARTIAL_TEMPLATES.get()
+        self.assertIsNotNone(PARTIAL_TEMPLATES.templates)
+
+        with override_settings(TEMPLATES=[]):
+            self.assertIsNone(PARTIAL_TEMPLATES.templates)
+
+    def test__partial_templates__cleared_on_template_change(self):
+        """Test compiled templates are discarded when the autoreloader sees a template file change."""
+
+        template_path = Path(PARTIAL_TEMPLATES.get()["select"].origin.name)
+
+        file_changed.send(sender=None, file_path=template_path.with_suffix(".py"))
+        self.assertIsNotNone(PARTIAL_TEMPLATES.templates)
+
+        file_changed.send(sender=None, file_path=template_path)
+        self.assertIsNone(PARTIAL_TEMPLATES.templates)
+
+    def test__form_renderers__match_form_tags(self):
+        """Test the form renderers render "{{ form }}" the same as the form tags."""
+
+        for renderer, tag in (
+            (AdminLteFormRenderer(), "render_form"),
+            (AdminLteHorizontalFormRenderer(), "render_horizontal_form"),
+        ):
+            for data in (None, {"test_select": "c"}):
+                with self.subTest(tag=tag, bound=data is not None):
+                    expected = Template("{% load adminlte_tags %}{% " + tag + " form %}").render(
+                        Context({"form": SampleForm(data)})
+                    )
+
+                    rendered = str(SampleForm(data, renderer=renderer))
+
+                    self.assertHTMLEqual(rendered, expected)
+                    self.assertIn('name="test_radio"', rendered)
+
+    def test__stream_horizontal_formset__matches_formset_tag(self):
+        """Test the streamed formset renders the same HTML as the render_horizontal_formset tag, in chunks."""
+
+        SampleFormSet = forms.formset_factory(SampleForm, extra=5)
+        template = Template("{% load adminlte_tags %}{% render_horizontal_formset formset 'Test Formset Section' %}")
+        expected = template.render(Context({"formset": SampleFormSet()}))
+
+        chunks = list(stream_horizontal_formset(SampleFormSet(), "Test Formset Section", forms_per_chunk=2))
+
+        # Header, three chunks of forms (2 + 2 + 1), then footer.
+        self.assertEqual(len(chunks), 5)
+        self.assertIn('name="form-TOTAL_FORMS"', chunks[0])
+        self.assertEqual(chunks[1].count('<div class="col-sm-12">'), 2)
+        self.assertEqual(chunks[3].count('<div class="col-sm-12">'), 1)
+        self.assertHTMLEqual("".join(chunks), expected)
+
+    def test__stream_horizontal_formset__usable_with_streaming_response(self):
+        """Test the streamed formset can be sent via a StreamingHttpResponse."""
+
+        SampleFormSet = forms.formset_factory(SampleForm, extra=3)
+
+        response = StreamingHttpResponse(stream_horizontal_formset(SampleFormSet(), "Test Formset Section"))
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertIn("Test Formset Section", content)
+        self.assertIn('id="id_form-2-test_text"', content)
@@ -3,11 +3,13 @@ Tests for Template Tags
 """
 
 # System Imports.
+from unittest.mock import patch
 
 # Third-Party Imports.
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
+from django.template import Context, Template, TemplateSyntaxError
 from django.test import TestCase
 
 # Internal Imports.
@@ -131,6 +133,34 @@ class TemplateTagTestCase(TestCase):
             # Verify retrieved value.
             self.assertEqual("TextInput", result)
 
+    def test_filter__form_partial(self):
+        """Tests for the "form_partial" filter."""
+
+        with self.subTest("Verify returns the partial template name for a select field"):
+            # Get value from filter.
+            test_form = self.TestForm()
+            result = adminlte_filters.form_partial(test_form["test_select"])
+
+            # Verify retrieved value.
+            self.assertEqual("adminlte2/partials/_form/_select.html", result)
+
+        with self.subTest("Verify returns the text partial template name for an unlisted widget"):
+            # Get value from filter.
+            test_form = self.TestForm()
+            result = adminlte_filters.form_partial(test_form["test_date"])
+
+            # Verify retrieved value.
+            self.assertEqual("adminlte2/partials/_form/_text.html", result)
+
+        with self.subTest("Verify returns the compiled partial template when given the compiled partials"):
+            # Get value from filter.
+            test_form = self.TestForm()
+            partials = {"checkbox": "compiled checkbox"}
+            result = adminlte_filters.form_partial(test_form["test_checkbox"], partials)
+
+            # Verify retrieved value.
+            self.assertEqual("compiled checkbox", result)
+
     def test_filter__with_attrs(self):
         """Tests for the "with_attrs" filter."""
 
@@ -166,6 +196,33 @@ class TemplateTagTestCase(TestCase):
             # Verify retrieved value.
             self.assertIn('class="my-class-name"', str(result))
 
+        with self.subTest("Verify appends to a class set via with_attrs"):
+            test_form = self.TestForm()
+            test_form["test_text"].field.widget.attrs["class"] = "existing-class"
+            template = Template(
+                "{% load adminlte_filters %}"
+                "{{ field|with_attrs:'{\"class\":\"attrs-class\"}'|with_class:\"my-class-name\" }}"
+            )
+
+            result = template.render(Context({"field": test_form["test_text"]}))
+
+            self.assertInHTML(
+                '<input type="text" name="test_text" class="attrs-class my-class-name" id="id_test_text" />', result
+            )
+
+        with self.subTest("Verify keeps the hidden initial value of show_hidden_initial fields"):
+
+            class HiddenInitialForm(forms.Form):
+                test_text = forms.CharField(initial="initial text", show_hidden_initial=True)
+
+            test_form = HiddenInitialForm()
+            result = adminlte_filters.with_class(test_form["test_text"], "my-class-name")
+
+            self.assertInHTML(
+                '<input type="hidden" name="initial-test_text" value="initial text" id="initial-id_test_text" />',
+                str(result),
+            )
+
         with self.subTest("Verify handles missing field"):
             result = adminlte_filters.with_class(None, "my-class-name")
             self.assertIsNone(result)
@@ -325,6 +382,140 @@ class TemplateTagTestCase(TestCase):
             # Verify retrieved value.
             self.assertIn('type="url"', str(result))
 
+    def test_filter__chained_with_filters(self):
+        """Tests for chaining multiple "with_" filters."""
+
+        with self.subTest("Verify applies all chained attributes"):
+            test_form = self.TestForm()
+            template = Template(
+                "{% load adminlte_filters %}"
+                "{{ field|with_class:'my-class-name'|with_placeholder|with_input_type:'url'|with_min:5|with_list }}"
+            )
+
+            result = template.render(Context({"field": test_form["test_text"]}))
+
+            self.assertInHTML(
+                (
+                    '<input type="url" name="test_text" class="my-class-name" placeholder="Test text" min="5" '
+                    'list="test_text_list" id="id_test_text" />'
+                ),
+                result,
+            )
+
+        with self.subTest("Verify does not modify the field widget, between renders of the same form"):
+            test_form = self.TestForm()
+            widget = test_form["test_text"].field.widget
+            template = Template(
+                "{% load adminlte_filters %}{{ field|with_class:'my-class-name'|with_input_type:'url' }}{{ field }}"
+            )
+
+            first_result = template.render(Context({"field": test_form["test_text"]}))
+            second_result = template.render(Context({"field": test_form["test_text"]}))
+
+            self.assertEqual(widget.attrs, {})
+            self.assertEqual(widget.input_type, "text")
+            self.assertEqual(first_result, second_result)
+            self.assertEqual(first_result.count("my-class-name"), 1)
+            self.assertInHTML('<input type="text" name="test_text" id="id_test_text" />', second_result)
+
+        with self.subTest("Verify explicit placeholder is not replaced by a later default placeholder"):
+            test_form = self.TestForm()
+            result = adminlte_filters.with_placeholder(
+                adminlte_filters.with_placeholder(test_form["test_text"], "My Placeholder Text")
+            )
+
+            self.assertIn('placeholder="My Placeholder Text"', str(result))
+
+    def test_tag__field_attrs(self):
+        """Tests for the "field_attrs" tag."""
+
+        with self.subTest("Verify applies all attributes in a single tag"):
+            test_form = self.TestForm()
+            test_form["test_text"].field.widget.attrs["class"] = "existing-class"
+            template = Template(
+                "{% load adminlte_filters %}"
+                "{% field_attrs field attrs='{\"attribute-1\":\"value-1\"}' data='{\"attribute-2\":\"value-2\"}' "
+                'class="my-class-name" placeholder type="url" min=5 list=None %}'
+            )
+
+            result = template.render(Context({"field": test_form["test_text"]}))
+
+            self.assertInHTML(
+                (
+                    '<input type="url" name="test_text" attribute-1="value-1" data-attribute-2="value-2" '
+                    'class="existing-class my-class-name" placeholder="Test text" min="5" list="test_text_list" '
+                    'id="id_test_text" />'
+                ),
+                result,
+            )
+
+        with self.subTest("Verify does not modify the field widget"):
+            test_form = self.TestForm()
+            widget = test_form["test_text"].field.widget
+            template = Template('{% load adminlte_filters %}{% field_attrs field class="my-class-name" type="url" %}')
+
+            template.render(Context({"field": test_form["test_text"]}))
+
+            self.assertEqual(widget.attrs, {})
+            self.assertEqual(widget.input_type, "text")
+
+        with self.subTest("Verify resolves variable arguments at render time"):
+            test_form = self.TestForm()
+            template = Template(
+                "{% load adminlte_filters %}{% field_attrs field placeholder=text pattern=pattern max=max_val %}"
+            )
+
+            result = template.render(
+                Context({"field": test_form["test_text"], "text": "My Placeholder Text", "pattern": "[0-9]{3}"})
+            )
+
+            self.assertInHTML(
+                (
+                    '<input type="text" name="test_text" placeholder="My Placeholder Text" pattern="[0-9]{3}" '
+                    'max="100" id="id_test_text" />'
+                ),
+                result,
+            )
+
+        with self.subTest("Verify parses constant json once, at compile time"):
+            test_form = self.TestForm()
+            template = Template(
+                "{% load adminlte_filters %}{% field_attrs field attrs='{\"attribute-1\":\"value-1\"}' %}"
+            )
+
+            with patch("adminlte2_pdq.templatetags.adminlte_filters._load_json_attrs") as mock_load_json_attrs:
+                result = template.render(Context({"field": test_form["test_text"]}))
+
+            mock_load_json_attrs.assert_not_called()
+            self.assertIn('attribute-1="value-1"', result)
+
+        with self.subTest("Verify keeps the hidden initial value of show_hidden_initial fields"):
+
+            class HiddenInitialForm(forms.Form):
+                test_text = forms.CharField(initial="initial text", show_hidden_initial=True)
+
+            test_form = HiddenInitialForm()
+            template = Template('{% load adminlte_filters %}{% field_attrs field class="my-class-name" %}')
+
+            result = template.render(Context({"field": test_form["test_text"]}))
+
+            self.assertInHTML(
+                '<input type="hidden" name="initial-test_text" value="initial text" id="initial-id_test_text" />',
+                result,
+            )
+
+        with self.subTest("Verify handles missing field"):
+            template = Template('{% load adminlte_filters %}{% field_attrs field class="my-class-name" %}')
+            self.assertEqual(template.render(Context({"field": None})), "")
+
+        with self.subTest("Verify raises error on invalid arguments"):
+            with self.assertRaises(TemplateSyntaxError):
+                Template("{% load adminlte_filters %}{% field_attrs field attrs='{not json}' %}")
+            with self.assertRaises(TemplateSyntaxError):
+                Template("{% load adminlte_filters %}{% field_attrs field my-class-name %}")
+            with self.assertRaises(TemplateSyntaxError):
+                Template("{% load adminlte_filters %}{% field_attrs %}")
+
     def test_filter__dir(self):
         """Tests for the "dir" filter."""
 
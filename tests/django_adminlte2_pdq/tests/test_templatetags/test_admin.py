@@ -3,8 +3,10 @@ Tests for Admin Template Tags
 """
 
 # Third-Party Imports.
-from django.contrib.admin.models import LogEntry
+from django.contrib.admin.models import ADDITION, LogEntry
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.template import Template, Context
 from django.test import TestCase, override_settings
 
@@ -167,6 +169,63 @@ class TemplateTagAdminTestCase(TestCase):
 
         self.assertNotIn("None available", rendered_template)
 
+    def test_show_control_sidebar_recent_activity_tab_pane_caches_log_entries_per_user(self):
+        """Test show control sidebar recent activity tab pane only queries log
+        entries once, until one of the user's log entries changes"""
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        user_model = get_user_model()
+        user = user_model.objects.create(username="recent_activity_user")
+        content_type = ContentType.objects.get_for_model(user_model)
+
+        def add_log_entry(object_repr):
+            LogEntry.objects.create(
+                user=user,
+                content_type=content_type,
+                object_id=str(user.pk),
+                object_repr=object_repr,
+                action_flag=ADDITION,
+            )
+
+        template_to_render = Template(
+            "{% load admin.admin_control_sidebar %}{% show_control_sidebar_recent_activity_tab_pane %}"
+        )
+
+        add_log_entry("First Entry")
+
+        with self.assertNumQueries(1):
+            rendered_template = template_to_render.render(Context({"user": user}))
+        self.assertIn("First Entry", rendered_template)
+
+        with self.assertNumQueries(0):
+            rendered_template = template_to_render.render(Context({"user": user}))
+        self.assertIn("First Entry", rendered_template)
+
+        add_log_entry("Second Entry")
+
+        with self.assertNumQueries(1):
+            rendered_template = template_to_render.render(Context({"user": user}))
+        self.assertIn("Second Entry", rendered_template)
+
+    def test_show_control_sidebar_recent_activity_tab_pane_does_not_query_for_unsaved_user(self):
+        """Test show control sidebar recent activity tab pane does not query
+        log entries for a user that can not have any"""
+
+        user_model = get_user_model()
+        user = user_model()
+
+        context = Context({"user": user})
+        template_to_render = Template(
+            "{% load admin.admin_control_sidebar %}{% show_control_sidebar_recent_activity_tab_pane %}"
+        )
+
+        with self.assertNumQueries(0):
+            rendered_template = template_to_render.render(context)
+
+        self.assertIn("None available", rendered_template)
+
     # |-------------------------------------------------------------------------
     # | Test show_control_sidebar_settings_tab_pane
     # |-------------------------------------------------------------------------
@@ -1022,7 +1022,7 @@ class TemplateTagSidebarMenuTestCase(TemplateTagSidebarMenuBaseTestCase):
 
         self.assertFalse(is_whitelisted)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:sample_form"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:sample_form"])
     def test__check_for_login_whitelisted_node__node_in_list(self):
         """Test check for login whitelisted node where node is in list"""
         node = {
@@ -1051,7 +1051,7 @@ class TemplateTagSidebarMenuTestCase(TemplateTagSidebarMenuBaseTestCase):
 
         self.assertFalse(is_whitelisted)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:sample2"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:sample2"])
     def test__check_for_strict_whitelisted_node__node_in_list(self):
         """Test check for strict whitelisted node where node is in list."""
         node = {
@@ -2573,7 +2573,7 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
 
     # region LoginRequired Mode, No Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required__no_whitelists__node_minimal(self):
         """Test login required no whitelists node minimal"""
 
@@ -2654,7 +2654,7 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required__no_whitelists__node_allow_anonymous_access(self):
         """Test login required no whitelist node allow anonymous access"""
 
@@ -2738,7 +2738,7 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required__no_whitelists__node_login_required(self):
         """Test login required no whitelists node login required"""
 
@@ -2820,7 +2820,7 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.staff_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required__no_whitelists__node_allow_without_permissions(self):
         """Test login required no whitelists node allow without permissions"""
 
@@ -2902,7 +2902,7 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.staff_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required__no_whitelists__node_one_permission_required(self):
         """Test login required no whitelists node one permission required"""
 
@@ -2984,7 +2984,7 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required__no_whitelists__node_full_permissions_required(self):
         """Test login required no whitelists node full permissions required."""
 
@@ -3070,8 +3070,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
 
     # region LoginRequired Mode, Login Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__login_required__with_login_whitelist__node_minimal(self):
         """Test login required with login whitelist node minimal."""
 
@@ -3151,8 +3151,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__login_required__with_login_whitelist__node_allow_anonymous_access(self):
         """Test login required with login whitelist node allow anonymous access."""
 
@@ -3235,8 +3235,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__login_required__with_login_whitelist__node_login_required(self):
         """Test login required with login whitelist node login required."""
 
@@ -3316,8 +3316,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__login_required__with_login_whitelist__node_allow_without_permissions(self):
         """Test login required with login whitelist node allow without permissions."""
 
@@ -3397,8 +3397,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__login_required__with_login_whitelist__node_one_permission_required(self):
         """Test login required with login whitelist node one permission required."""
 
@@ -3480,8 +3480,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__login_required__with_login_whitelist__node_full_permissions_required(self):
         """Test login required with login whitelist node full permissions required."""
 
@@ -3567,8 +3567,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
 
     # region Strict Mode, No Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict__no_whitelists__node_minimal(self):
         """Test strict no whitelists node minimal."""
 
@@ -3648,8 +3648,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict__no_whitelists__node_allow_anonymous_access(self):
         """Test strict no whitelists node allow anonymous access."""
 
@@ -3730,8 +3730,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict__no_whitelists__node_login_required(self):
         """Test strict no whitelists node login required."""
 
@@ -3813,8 +3813,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict__no_whitelists__node_allow_without_permissions(self):
         """Test strict no whitelists node allow without permissions."""
 
@@ -3896,8 +3896,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict__no_whitelists__node_one_permission_required(self):
         """Test strict no whitelists node one permission required."""
 
@@ -3979,8 +3979,8 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict__no_whitelists__node_full_permissions_required(self):
         """Test strict no whitelists node full permissions required."""
 
@@ -4066,9 +4066,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
 
     # region Strict Mode, Login Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_login_whitelist__node_minimal(self):
         """
         NOTE: The LOGIN_EXEMPT_WHITELIST is only for login access.
@@ -4156,9 +4156,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
     #         allowed = sidebar_menu.is_allowed_node(self.super_user, node)
     #         self.assertTrue(allowed)
     #
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    # @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    # @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    # @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     # def test__strict__with_login_whitelist__node_allow_anonymous_access(self):
     #     """"""
     #
@@ -4240,9 +4240,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
     #         allowed = sidebar_menu.is_allowed_node(self.super_user, node)
     #         self.assertTrue(allowed)
     #
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    # @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    # @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    # @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     # def test__strict__with_login_whitelist__node_login_required(self):
     #     """"""
     #
@@ -4324,9 +4324,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
     #         allowed = sidebar_menu.is_allowed_node(self.super_user, node)
     #         self.assertTrue(allowed)
     #
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    # @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    # @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    # @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     # def test__strict__with_login_whitelist__node_allow_without_permissions(self):
     #     """"""
     #
@@ -4408,9 +4408,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
     #         allowed = sidebar_menu.is_allowed_node(self.super_user, node)
     #         self.assertTrue(allowed)
     #
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    # @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    # @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    # @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     # def test__strict__with_login_whitelist__node_one_permission_required(self):
     #     """"""
     #
@@ -4492,9 +4492,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
     #         allowed = sidebar_menu.is_allowed_node(self.super_user, node)
     #         self.assertTrue(allowed)
     #
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    # @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
+    # @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    # @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    # @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
     # def test__strict__with_login_whitelist__node_full_permissions_required(self):
     #     """"""
     #
@@ -4580,9 +4580,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
 
     # region Strict Mode, Permission Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_permission_whitelist__node_minimal(self):
         """Test strict with permission whitelist node minimal."""
 
@@ -4663,9 +4663,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_permission_whitelist__node_allow_anonymous_access(self):
         """Test strict with permission whitelist node allow anonymous access."""
 
@@ -4747,9 +4747,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_permission_whitelist__node_login_required(self):
         """Test strict with permission whitelist node login required."""
 
@@ -4831,9 +4831,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_permission_whitelist__node_allow_without_permissions(self):
         """Test strict with permission whitelist node allow without permissions."""
 
@@ -4915,9 +4915,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_permission_whitelist__node_one_permission_required(self):
         """Test strict with permission whitelist node one permission required."""
 
@@ -4999,9 +4999,9 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_permission_whitelist__node_full_permissions_required(self):
         """Test strict with permission whitelist node full permissions required."""
 
@@ -5087,10 +5087,10 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
 
     # region Strict Mode, Both Whitelists
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_both_whitelists__node_minimal(self):
         """Test strict with both whitelists node minimal."""
 
@@ -5171,10 +5171,10 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_both_whitelists__node_allow_anonymous_access(self):
         """Test strict with both whitelists node allow anonymous access."""
 
@@ -5256,10 +5256,10 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_both_whitelists__node_login_required(self):
         """Test strict with both whitelists node login required."""
 
@@ -5341,10 +5341,10 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_both_whitelists__node_allow_without_permissions(self):
         """Test strict with both whitelists node allow without permissions."""
 
@@ -5426,10 +5426,10 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_both_whitelists__node_one_permission_required(self):
         """Test strict with both whitelists node one permission required."""
 
@@ -5511,10 +5511,10 @@ class TemplateTagSidebarMenu_IsAllowedNodeTestCase(TemplateTagSidebarMenuBaseTes
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", ["adminlte2_pdq:demo-css"])
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", ["adminlte2_pdq:demo-css"])
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", ["adminlte2_pdq:demo-css"])
     def test__strict__with_both_whitelists__node_full_permissions_required(self):
         """Test strict with both whitelists node full permissions required."""
 
@@ -1080,7 +1080,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
 
     # region LoginRequired Mode, No Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_no_decorator(self):
         """Tests for a view with no decorator defined."""
 
@@ -1219,7 +1219,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_anonymous_access_decorator(self):
         """Tests for a view with a AllowAnonymous decorator."""
 
@@ -1358,7 +1358,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_login_required_decorator(self):
         """Tests for a node deferring to a view with a LoginRequired decorator."""
 
@@ -1497,7 +1497,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_allow_without_permissions_decorator(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission decorator."""
 
@@ -1636,7 +1636,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_one_permission_required_decorator(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -1775,7 +1775,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_one_permission_required_decorator_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -1882,7 +1882,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_permission_required_decorator(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -2021,7 +2021,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_permission_required_decorator__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -2132,8 +2132,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
 
     # region LoginRequired Mode, Login Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_no_decorator(self):
         """Tests for a view with no decorator defined."""
 
@@ -2272,8 +2272,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_anonymous_access_decorator(self):
         """Tests for a view with a AllowAnonymous decorator."""
 
@@ -2412,8 +2412,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_login_required_decorator(self):
         """Tests for a node deferring to a view with a LoginRequired decorator."""
 
@@ -2552,8 +2552,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_allow_without_permissions_decorator(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission decorator."""
 
@@ -2692,8 +2692,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_one_permission_required_decorator(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -2832,8 +2832,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_one_permission_required_decorator_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -2940,8 +2940,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_permission_required_decorator(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -3080,8 +3080,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_permission_required_decorator__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -3192,8 +3192,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
 
     # region Strict Mode, No Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_no_decorator(self):
         """Tests for a view with no decorator defined."""
 
@@ -3332,8 +3332,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_anonymous_access_decorator(self):
         """Tests for a view with a AllowAnonymous decorator."""
 
@@ -3472,8 +3472,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_login_required_decorator(self):
         """Tests for a node deferring to a view with a LoginRequired decorator."""
 
@@ -3615,8 +3615,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_allow_without_permissions_decorator(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission decorator."""
 
@@ -3755,8 +3755,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_one_permission_required_decorator(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -3895,8 +3895,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_one_permission_required_decorator_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -4003,8 +4003,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_permission_required_decorator(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -4143,8 +4143,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_permission_required_decorator__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -4255,9 +4255,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
 
     # region Strict Mode, Login Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_no_decorator(self):
         """Tests for a view with no decorator defined."""
 
@@ -4396,9 +4396,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_anonymous_access_decorator(self):
         """Tests for a view with a AllowAnonymous decorator."""
 
@@ -4537,9 +4537,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_login_required_decorator(self):
         """Tests for a node deferring to a view with a LoginRequired decorator."""
 
@@ -4681,9 +4681,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_allow_without_permissions_decorator(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission decorator."""
 
@@ -4822,9 +4822,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_one_permission_required_decorator(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -4963,9 +4963,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_one_permission_required_decorator_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -5072,9 +5072,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_permission_required_decorator(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -5213,9 +5213,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_permission_required_decorator__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -5326,9 +5326,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
 
     # region Strict Mode, Permission Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_no_decorator(self):
         """Tests for a view with no decorator defined."""
 
@@ -5467,9 +5467,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_anonymous_access_decorator(self):
         """Tests for a view with a AllowAnonymous decorator."""
 
@@ -5608,9 +5608,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_login_required_decorator(self):
         """Tests for a node deferring to a view with a LoginRequired decorator."""
 
@@ -5752,9 +5752,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_allow_without_permissions_decorator(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission decorator."""
 
@@ -5893,9 +5893,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_one_permission_required_decorator(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -6034,9 +6034,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_one_permission_required_decorator_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -6143,9 +6143,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_permission_required_decorator(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -6284,9 +6284,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_permission_required_decorator__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -6397,10 +6397,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
 
     # region Strict Mode, Both Whitelists
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_no_decorator(self):
         """Tests for a view with no decorator defined."""
 
@@ -6539,10 +6539,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_anonymous_access_decorator(self):
         """Tests for a view with a AllowAnonymous decorator."""
 
@@ -6681,10 +6681,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_login_required_decorator(self):
         """Tests for a node deferring to a view with a LoginRequired decorator."""
 
@@ -6826,10 +6826,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_allow_without_permissions_decorator(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission decorator."""
 
@@ -6968,10 +6968,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_one_permission_required_decorator(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -7110,10 +7110,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_one_permission_required_decorator_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired decorator."""
 
@@ -7220,10 +7220,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_permission_required_decorator(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -7362,10 +7362,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Decorators(Template
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_permission_required_decorator__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired decorator."""
 
@@ -8538,7 +8538,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
 
     # region LoginRequired Mode, No Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_no_mixin(self):
         """Tests for a view with no mixin defined."""
 
@@ -8677,7 +8677,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_anonymous_access_mixin(self):
         """Tests for a view with a AllowAnonymous mixin."""
 
@@ -8816,7 +8816,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_login_required_mixin(self):
         """Tests for a node deferring to a view with a LoginRequired mixin."""
 
@@ -8955,7 +8955,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_allow_without_permissions_mixin(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission mixin."""
 
@@ -9094,7 +9094,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_one_permission_required_mixin(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -9233,7 +9233,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_one_permission_required_mixin_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -9340,7 +9340,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_permission_required_mixin(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -9479,7 +9479,7 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
     def test__login_required_mode__no_whitelists__view_with_permission_required_mixin__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -9590,8 +9590,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
 
     # region LoginRequired Mode, Login Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_no_mixin(self):
         """Tests for a view with no mixin defined."""
 
@@ -9730,8 +9730,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_anonymous_access_mixin(self):
         """Tests for a view with a AllowAnonymous mixin."""
 
@@ -9870,8 +9870,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_login_required_mixin(self):
         """Tests for a node deferring to a view with a LoginRequired mixin."""
 
@@ -10010,8 +10010,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_allow_without_permissions_mixin(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission mixin."""
 
@@ -10150,8 +10150,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_one_permission_required_mixin(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -10290,8 +10290,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_one_permission_required_mixin_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -10398,8 +10398,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_permission_required_mixin(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -10538,8 +10538,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__login_required_mode__with_login_whitelist__view_with_permission_required_mixin__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -10650,8 +10650,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
 
     # region Strict Mode, No Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_no_mixin(self):
         """Tests for a view with no mixin defined."""
 
@@ -10790,8 +10790,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_anonymous_access_mixin(self):
         """Tests for a view with a AllowAnonymous mixin."""
 
@@ -10930,8 +10930,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_login_required_mixin(self):
         """Tests for a node deferring to a view with a LoginRequired mixin."""
 
@@ -11073,8 +11073,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_allow_without_permissions_mixin(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission mixin."""
 
@@ -11213,8 +11213,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_one_permission_required_mixin(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -11353,8 +11353,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_one_permission_required_mixin_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -11461,8 +11461,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_permission_required_mixin(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -11601,8 +11601,8 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
     def test__strict_mode__no_whitelists__view_with_permission_required_mixin__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -11713,9 +11713,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
 
     # region Strict Mode, Login Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_no_mixin(self):
         """Tests for a view with no mixin defined."""
 
@@ -11854,9 +11854,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_anonymous_access_mixin(self):
         """Tests for a view with a AllowAnonymous mixin."""
 
@@ -11995,9 +11995,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_login_required_mixin(self):
         """Tests for a node deferring to a view with a LoginRequired mixin."""
 
@@ -12139,9 +12139,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_allow_without_permissions_mixin(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission mixin."""
 
@@ -12280,9 +12280,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_one_permission_required_mixin(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -12421,9 +12421,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_one_permission_required_mixin_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -12530,9 +12530,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_permission_required_mixin(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -12671,9 +12671,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_login_whitelist__view_with_permission_required_mixin__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -12784,9 +12784,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
 
     # region Strict Mode, Permission Whitelist
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_no_mixin(self):
         """Tests for a view with no mixin defined."""
 
@@ -12925,9 +12925,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_anonymous_access_mixin(self):
         """Tests for a view with a AllowAnonymous mixin."""
 
@@ -13066,9 +13066,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_login_required_mixin(self):
         """Tests for a node deferring to a view with a LoginRequired mixin."""
 
@@ -13210,9 +13210,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_allow_without_permissions_mixin(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission mixin."""
 
@@ -13351,9 +13351,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_one_permission_required_mixin(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -13492,9 +13492,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_one_permission_required_mixin_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -13601,9 +13601,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_permission_required_mixin(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -13742,9 +13742,9 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__with_permission_whitelist__view_with_permission_required_mixin__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -13855,10 +13855,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
 
     # region Strict Mode, Both Whitelists
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_no_mixin(self):
         """Tests for a view with no mixin defined."""
 
@@ -13997,10 +13997,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_anonymous_access_mixin(self):
         """Tests for a view with a AllowAnonymous mixin."""
 
@@ -14139,10 +14139,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_login_required_mixin(self):
         """Tests for a node deferring to a view with a LoginRequired mixin."""
 
@@ -14284,10 +14284,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_allow_without_permissions_mixin(self):
         """Tests for a node deferring to a view with a AllowWithoutPermission mixin."""
 
@@ -14426,10 +14426,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_one_permission_required_mixin(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -14568,10 +14568,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_one_permission_required_mixin_as_string(self):
         """Tests for a node deferring to a view with a OnePermissionRequired mixin."""
 
@@ -14678,10 +14678,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_permission_required_mixin(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -14820,10 +14820,10 @@ class TemplateTagSidebarMenu__ViewFallbackWhenNodeUndefined__Classes(TemplateTag
             allowed = sidebar_menu.is_allowed_node(self.super_user, node)
             self.assertTrue(allowed)
 
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_REQUIRED", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY", True)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.LOGIN_EXEMPT_WHITELIST", FULL_VIEW_WHITELIST)
-    @patch("adminlte2_pdq.templatetags.sidebar_menu.STRICT_POLICY_WHITELIST", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    @patch("adminlte2_pdq.policy.Policy.login_exempt_whitelist", FULL_VIEW_WHITELIST)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy_whitelist", FULL_VIEW_WHITELIST)
     def test__strict_mode__both_whitelists__view_with_permission_required_mixin__as_str(self):
         """Tests for a node deferring to a view with a PermissionRequired mixin."""
 
@@ -4,6 +4,7 @@ Tests for Template Tags
 
 # System Imports.
 from collections import namedtuple
+from unittest.mock import patch, PropertyMock
 
 # Third-Party Imports.
 from django import forms
@@ -348,6 +349,109 @@ class TemplateTagTestCase(TestCase):
             self.assertEqual(errors["has_non_field_errors"], False)
             self.assertEqual(errors["has_field_errors"], False)
 
+    def test_class__error_summary_collector(self):
+        """Test the single pass error summary collector"""
+
+        with self.subTest("Verify field errors are detected when non field errors outnumber error keys"):
+            collector = adminlte_tags._ErrorSummaryCollector()  # pylint:disable=protected-access
+
+            form = self.TestForm({"test_text": "text_value"})
+            form.add_error(None, "First Form Error")
+            form.add_error(None, "Second Form Error")
+            form.add_error("test_text", "Test Field Error")
+
+            collector.add_form(form)
+
+            self.assertTrue(collector.errors["has_non_field_errors"])
+            self.assertTrue(collector.errors["has_field_errors"])
+            self.assertEqual(collector.errors["forms"], [form])
+
+        with self.subTest("Verify form errors are read once per form"):
+            collector = adminlte_tags._ErrorSummaryCollector()  # pylint:disable=protected-access
+
+            form = self.TestForm({"test_text": "text_value"})
+            form.add_error(None, "Test Form Error")
+
+            with patch.object(self.TestForm, "errors", new_callable=PropertyMock) as mock_errors:
+                mock_errors.return_value = form._errors  # pylint:disable=protected-access
+                collector.get_form_state(form)
+                collector.get_form_state(form)
+
+            self.assertEqual(mock_errors.call_count, 1)
+
+        with self.subTest("Verify forms are skipped once every flag is known"):
+            collector = adminlte_tags._ErrorSummaryCollector()  # pylint:disable=protected-access
+
+            form = self.TestForm({"test_text": "text_value"})
+            form.add_error(None, "Test Form Error")
+            form.add_error("test_text", "Test Field Error")
+            collector.add_form(form)
+
+            skipped_form = self.TestForm({"test_text": "text_value"})
+            skipped_form.adminlte2_show_field_errors_in_summary = False
+
+            with patch.object(collector, "get_form_state") as mock_get_form_state:
+                collector.add_form(skipped_form)
+
+            mock_get_form_state.assert_not_called()
+
+        with self.subTest("Verify forms are still inspected when they show field errors in the summary"):
+            collector = adminlte_tags._ErrorSummaryCollector()  # pylint:disable=protected-access
+
+            TestFormSets = forms.formset_factory(self.TestForm)
+            formset = TestFormSets(
+                {
+                    "form-TOTAL_FORMS": "2",
+                    "form-INITIAL_FORMS": "0",
+                    "form-MAX_NUM_FORMS": "",
+                    "form-0-test_text": "text_value",
+                    "form-1-test_text": "text_value",
+                }
+            )
+            formset.forms[0].add_error(None, "Test Form Error")
+            formset.forms[0].add_error("test_text", "Test Field Error")
+            formset.forms[1].add_error("test_text", "Test Field Error")
+
+            collector.add_formset(formset)
+
+            self.assertEqual(collector.errors["forms"], formset.forms)
+
+        with self.subTest("Verify forms marked for deletion are ignored"):
+            collector = adminlte_tags._ErrorSummaryCollector()  # pylint:disable=protected-access
+
+            TestFormSets = forms.formset_factory(self.TestForm, can_delete=True)
+            formset = TestFormSets(
+                {
+                    "form-TOTAL_FORMS": "1",
+                    "form-INITIAL_FORMS": "0",
+                    "form-MAX_NUM_FORMS": "",
+                    "form-0-test_text": "text_value",
+                    "form-0-DELETE": "on",
+                }
+            )
+            formset.forms[0].add_error("test_text", "Test Field Error")
+
+            collector.add_formset(formset)
+
+            self.assertFalse(collector.errors["has_field_errors"])
+            self.assertEqual(collector.errors["forms"], [])
+
+        with self.subTest("Verify unbound formsets with deletion are inspected without errors"):
+            collector = adminlte_tags._ErrorSummaryCollector()  # pylint:disable=protected-access
+
+            TestFormSets = forms.formset_factory(self.TestForm, can_delete=True, extra=2)
+            formset = TestFormSets()
+
+            collector.add_formset(formset)
+
+            self.assertFalse(collector.errors["has_field_errors"])
+            self.assertFalse(collector.errors["has_non_form_errors"])
+
+            template = Template("{% load adminlte_tags %}{% render_form_error_summary %}")
+            rendered = template.render(Context({"formset": formset}))
+
+            self.assertNotIn("alert", rendered)
+
     # endregion Template Tag Helper Functions
 
     # region render_form_error_summary Function
@@ -953,3 +1057,57 @@ class TemplateTagTestCase(TestCase):
                 rendered_template,
             )
             self.assertNotIn("title=", rendered_template)
+
+    @patch("adminlte2_pdq.templatetags.adminlte_tags.USE_LOCAL_AVATARS", True)
+    def test__get_avatar_url__local_avatars(self):
+        """Test get avatar url and user image initials, when using local avatars"""
+
+        with self.subTest("Verify returns a local initials url for a user with a name"):
+            self._setup_super_user()
+
+            context = Context({"user": self.super_user})
+
+            template_to_render = Template("{% load adminlte_tags %}{% get_avatar_url user=user size=50 %}")
+
+            rendered_template = template_to_render.render(context)
+
+            self.assertEqual(rendered_template, "/avatar/50/DB.svg")
+
+        with self.subTest("Verify returns the local default url when the user is anonymous"):
+            context = Context({"user": AnonymousUser()})
+
+            template_to_render = Template("{% load adminlte_tags %}{% get_avatar_url user=user %}")
+
+            rendered_template = template_to_render.render(context)
+
+            self.assertEqual(rendered_template, "/avatar/25.svg")
+
+        with self.subTest("Verify user image initials uses the local url with the overridden initials"):
+            self._setup_super_user()
+
+            context = Context({"user": self.super_user})
+
+            template_to_render = Template("{% load adminlte_tags %}{% user_image_initials user=user initials='J2D' %}")
+
+            rendered_template = template_to_render.render(context)
+
+            self.assertIn('src="/avatar/25/J2D.svg"', rendered_template)
+            self.assertNotIn("gravatar", rendered_template)
+
+        with self.subTest("Verify user image initials uses the local default url when there are no initials"):
+            template_to_render = Template("{% load adminlte_tags %}{% user_image_initials %}")
+
+            rendered_template = template_to_render.render(Context({}))
+
+            self.assertIn('src="/avatar/25.svg"', rendered_template)
+
+    def test__get_avatar_url__email_hash_is_memoized(self):
+        """Test get avatar url only hashes each email once"""
+
+        adminlte_tags._get_email_hash.cache_clear()  # pylint:disable=protected-access
+
+        with patch("adminlte2_pdq.templatetags.adminlte_tags.md5", wraps=adminlte_tags.md5) as mock_md5:
+            for _ in range(3):
+                adminlte_tags.get_avatar_url(None, email="barnesdavidj@gmail.com")
+
+        self.assertEqual(mock_md5.call_count, 1)
@@ -0,0 +1,82 @@
+"""
+Tests for the UI Settings Snapshot
+"""
+
+# System Imports.
+from unittest.mock import patch
+
+# Third-Party Imports.
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import set_urlconf
+
+# Internal Imports.
+from adminlte2_pdq.context_processors import ui_settings
+from adminlte2_pdq.ui_settings import UISettings
+
+
+class TestUISettings(TestCase):
+    """Tests for the cached UI settings snapshot."""
+
+    def setUp(self):
+        UISettings.clear()
+
+    def test__snapshot_is_built_once(self):
+        """Test that repeated lookups reuse the same snapshot, instead of re-reading settings."""
+
+        with patch.object(UISettings, "build", wraps=UISettings.build) as mock_build:
+            first_snapshot = UISettings.get()
+            second_snapshot = UISettings.get()
+
+        self.assertIs(first_snapshot, second_snapshot)
+        self.assertEqual(mock_build.call_count, 1)
+
+    def test__snapshot_values(self):
+        """Test that the snapshot holds the package defaults."""
+
+        snapshot = UISettings.get()
+
+        self.assertEqual(snapshot.skin_class, "skin-blue")
+        self.assertEqual(snapshot.home_url, "/home/")
+        self.assertTrue(snapshot.show_control_sidebar_button)
+        self.assertFalse(snapshot.show_control_sidebar_tabs)
+        self.assertTrue(snapshot.default_routes_are_registered)
+
+    def test__snapshot_is_cleared_on_setting_changed(self):
+        """Test that changing a setting rebuilds the snapshot."""
+
+        UISettings.get()
+
+        with override_settings(
+            ADMINLTE2_SKIN_CLASS="skin-green",
+            ADMINLTE2_ADMIN_CONTROL_SIDEBAR_TABS={"SHOW_SETTINGS_TAB": True},
+        ):
+            snapshot = UISettings.get()
+            self.assertEqual(snapshot.skin_class, "skin-green")
+            self.assertTrue(snapshot.show_control_sidebar_tabs)
+
+            rendered_template = Template("{% load adminlte_tags %}{% get_skin_class %}").render(Context())
+            self.assertEqual(rendered_template, "skin-green")
+
+        self.assertEqual(UISettings.get().skin_class, "skin-blue")
+
+    def test__snapshot_is_kept_per_urlconf(self):
+        """Test that a request specific urlconf gets its own snapshot, as urls are reversed within it."""
+
+        snapshot = UISettings.get()
+
+        set_urlconf("tests.django_adminlte2_pdq.django_test_project.urls_empty")
+        self.addCleanup(set_urlconf, None)
+
+        urls_empty_snapshot = UISettings.get()
+
+        self.assertTrue(snapshot.default_routes_are_registered)
+        self.assertFalse(urls_empty_snapshot.default_routes_are_registered)
+        self.assertIsNone(urls_empty_snapshot.home_url)
+
+    def test__context_processor(self):
+        """Test that the context processor exposes the snapshot."""
+
+        request = RequestFactory().get("/")
+
+        self.assertIs(ui_settings(request)["adminlte2_ui"], UISettings.get())
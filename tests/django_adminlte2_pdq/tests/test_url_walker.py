@@ -0,0 +1,90 @@
+"""
+Tests for the URLconf Walker
+"""
+
+# System Imports.
+import sys
+
+# Third-Party Imports.
+from django.http import HttpResponse
+from django.test import TestCase
+from django.urls import include, path
+
+# Internal Imports.
+from adminlte2_pdq.url_walker import get_route_data, walk_url_patterns
+
+
+def view(request):
+    """Placeholder view for url patterns."""
+    return HttpResponse()
+
+
+class TestUrlWalker(TestCase):
+    """Tests for the iterative URLconf walker."""
+
+    def test__yields_patterns_in_order(self):
+        """Test that patterns are yielded in definition order, with their prefix and scoped app name."""
+
+        urlpatterns = [
+            path("first/", view, name="first"),
+            path("app/", include(([path("inner/", view, name="inner")], "my_app"))),
+            path("plain/", include([path("nested/", view, name="nested")])),
+            path("last/", view, name="last"),
+        ]
+
+        self.assertEqual(
+            [(prefix, app_name, pattern.name) for prefix, app_name, pattern in walk_url_patterns(urlpatterns)],
+            [
+                ("", "", "first"),
+                ("app/", "my_app", "inner"),
+                ("plain/", "", "nested"),
+                ("", "", "last"),
+            ],
+        )
+
+    def test__nested_app_names(self):
+        """Test that app names of all enclosing resolvers can be joined, the same as for a resolved request."""
+
+        urlpatterns = [
+            path(
+                "outer/",
+                include(([path("inner/", include(([path("leaf/", view, name="leaf")], "inner_app")))], "outer_app")),
+            ),
+        ]
+
+        ((_, closest_app_name, _),) = walk_url_patterns(urlpatterns)
+        ((_, nested_app_name, _),) = walk_url_patterns(urlpatterns, nested_app_names=True)
+
+        self.assertEqual(closest_app_name, "inner_app")
+        self.assertEqual(nested_app_name, "outer_app:inner_app")
+
+    def test__large_urlconfs(self):
+        """Test that long and deeply nested url patterns are walked without hitting the recursion limit."""
+
+        count = sys.getrecursionlimit() + 100
+
+        long_urlpatterns = [path(f"route-{index}/", view) for index in range(count)]
+        self.assertEqual(len(list(walk_url_patterns(long_urlpatterns))), count)
+
+        nested_urlpatterns = [path("leaf/", view, name="leaf")]
+        for _ in range(count):
+            nested_urlpatterns = [path("a/", include(nested_urlpatterns))]
+
+        ((prefix, app_name, pattern),) = walk_url_patterns(nested_urlpatterns)
+        self.assertEqual(prefix, "a/" * count)
+        self.assertEqual(pattern.name, "leaf")
+
+    def test__get_route_data(self):
+        """Test display values for a walked url pattern."""
+
+        self.assertEqual(
+            get_route_data("app/", "my_app", path("inner", view, name="inner")),
+            {
+                "app_name": "my_app",
+                "pattern": "app/inner/",
+                "name": "my_app:inner",
+                "lookup_str": f"{__name__}.view",
+                "default_args": "{}",
+            },
+        )
+        self.assertEqual(get_route_data("", "my_app", path("", view))["name"], "None")
@@ -10,6 +10,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib import messages
+from django.http import Http404
 from django.test import override_settings, RequestFactory, TestCase
 from django.urls import reverse
 
@@ -212,7 +213,7 @@ class ViewsTestCase(TestCase):
         self.assertContains(response, "AdminLtePdq Warning: The page you were looking for does not exist.")
 
     @override_settings(DEBUG=True)
-    @patch("adminlte2_pdq.middleware.RESPONSE_404_DEBUG_MESSAGE", "")
+    @patch("adminlte2_pdq.policy.Policy.response_404_debug_message", "")
     def test_404_view_works_when_triggered_and_followed_in_dev_and_no_message_set(self):
         """Test 404 view works when triggered in dev with no message set"""
 
@@ -239,7 +240,7 @@ class ViewsTestCase(TestCase):
         )
 
     @override_settings(DEBUG=False)
-    @patch("adminlte2_pdq.middleware.RESPONSE_404_PRODUCTION_MESSAGE", "")
+    @patch("adminlte2_pdq.policy.Policy.response_404_production_message", "")
     def test_404_view_works_when_triggered_and_followed_in_prod_and_no_message_set(self):
         """Test 404 view works when triggered"""
 
@@ -254,3 +255,90 @@ class ViewsTestCase(TestCase):
                 "If you believe this was an error, please contact the site administrator."
             ),
         )
+
+    # |-------------------------------------------------------------------------
+    # | Test avatar view
+    # |-------------------------------------------------------------------------
+
+    def test_avatar_view_redirects_to_login_when_not_authenticated(self):
+        """Test avatar view redirects to login when not authenticated"""
+        response = self.client.get(reverse("adminlte2_pdq:avatar", kwargs={"size": 25}))
+        self.assertEqual(response.status_code, 302)
+
+    def test_avatar_view_renders_initials_svg(self):
+        """Test avatar view renders an initials svg, with immutable caching headers"""
+        self.client.force_login(self.test_user_no_perms)
+
+        response = self.client.get(reverse("adminlte2_pdq:avatar_initials", kwargs={"size": 50, "initials": "JD"}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/svg+xml")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+        self.assertTrue(response.has_header("ETag"))
+        self.assertContains(response, 'width="50"')
+        self.assertContains(response, ">JD</text>")
+
+    def test_avatar_view_renders_default_svg(self):
+        """Test avatar view renders the default person svg when no initials are given"""
+        self.client.force_login(self.test_user_no_perms)
+
+        response = self.client.get(reverse("adminlte2_pdq:avatar", kwargs={"size": 25}))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "<circle")
+        self.assertNotContains(response, "<text")
+
+    def test_avatar_view_escapes_initials_and_clamps_size(self):
+        """Test avatar view escapes initials, and limits the rendered size"""
+        self.client.force_login(self.test_user_no_perms)
+
+        response = self.client.get(reverse("adminlte2_pdq:avatar_initials", kwargs={"size": 5000, "initials": "<&"}))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, ">&lt;&amp;</text>")
+        self.assertContains(response, f'width="{views.AVATAR_MAX_SIZE}"')
+
+    def test_avatar_view_returns_not_modified_for_matching_etag(self):
+        """Test avatar view returns a 304 when the browser already has the image"""
+        self.client.force_login(self.test_user_no_perms)
+
+        url = reverse("adminlte2_pdq:avatar_initials", kwargs={"size": 50, "initials": "JD"})
+        response = self.client.get(url)
+
+        with patch("adminlte2_pdq.views.HttpResponse") as mock_response:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+        mock_response.assert_not_called()
+
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    def test_avatar_view_in_login_required_mode(self):
+        """Test avatar view requires login, and renders for any logged in user, in LOGIN REQUIRED mode"""
+        url = reverse("adminlte2_pdq:avatar_initials", kwargs={"size": 50, "initials": "JD"})
+
+        response = self.client.get(url)
+        self.assertRedirects(response, f"/accounts/login/?next={url}", fetch_redirect_response=False)
+
+        self.client.force_login(self.test_user_no_perms)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, ">JD</text>")
+
+    @patch("adminlte2_pdq.policy.Policy.login_required", True)
+    @patch("adminlte2_pdq.policy.Policy.strict_policy", True)
+    def test_avatar_view_in_strict_mode(self):
+        """Test avatar view requires login, but no permissions, in STRICT mode"""
+        url = reverse("adminlte2_pdq:avatar_initials", kwargs={"size": 50, "initials": "JD"})
+
+        response = self.client.get(url)
+        self.assertRedirects(response, f"/accounts/login/?next={url}", fetch_redirect_response=False)
+
+        self.client.force_login(self.test_user_no_perms)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, ">JD</text>")
+
+    def test_avatar_view_rejects_long_initials(self):
+        """Test avatar view does not render arbitrary text"""
+        request = RequestFactory().get("avatar/50/ABCD.svg")
+        request.user = self.test_user_no_perms
+        with self.assertRaises(Http404):
+            views.avatar(request, size=50, initials="ABCD")